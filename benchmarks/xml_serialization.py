@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+XML 직렬화 벤치마크
+카탈로그 dict → XML 내보내기(dict_to_xml, write_xml_stream)와 XML → dict 가져오기의 시간/최대 메모리 측정
+이전 minidom 재파싱 경로(legacy_minidom)를 기준선으로 함께 측정
+
+사용 예:
+    python benchmarks/xml_serialization.py --apps 2000 --topics 20
+    python benchmarks/xml_serialization.py --apps 500 --repeat 5 --format json
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from xml.dom import minidom
+
+from lxml import etree
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.xml_schema import XMLProcessor  # noqa: E402
+
+
+def build_catalog(apps: int, topics: int, seed: int = 0) -> dict:
+    """응용프로그램 apps개 × 토픽 topics개 카탈로그 (파서가 돌려주는 형태)"""
+    rng = random.Random(seed)
+    return {"Applications": {
+        "@xmlns": "http://zeromq-topic-manager/schema", "@version": "1.0",
+        "Application": [
+            {"@name": f"App{i}", "@description": f"응용프로그램 {i} & <설명>", "Topic": [
+                {"@name": f"TOPIC_{i}_{j}", "@proto": f"topic_{rng.randrange(topics * 4)}.proto",
+                 "@direction": rng.choice(("publish", "subscribe")), "@description": f"토픽 {j} \"설명\""}
+                for j in range(topics)
+            ]}
+            for i in range(apps)
+        ]
+    }}
+
+
+def legacy_minidom(processor: XMLProcessor, catalog: dict) -> str:
+    """lxml indent 도입 전 dict_to_xml(pretty_print=True) 경로: lxml 직렬화 → minidom 재파싱 → 재출력"""
+    rough_string = etree.tostring(processor._build_xml_element(catalog), encoding='unicode')
+    return minidom.parseString(rough_string).toprettyxml(indent="  ")[23:]
+
+
+def measure(name: str, func, repeat: int) -> dict:
+    """가장 빠른 실행 시간과 (별도 실행의) tracemalloc 최대 메모리 (Python 할당만, libxml2 내부 메모리 제외)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"case": name, "seconds": round(best, 4), "peak_mb": round(peak / 1e6, 2)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="XML 직렬화 벤치마크")
+    parser.add_argument("--apps", type=int, default=1000, help="응용프로그램 수")
+    parser.add_argument("--topics", type=int, default=20, help="응용프로그램당 토픽 수")
+    parser.add_argument("--repeat", type=int, default=3, help="시간 측정 반복 횟수 (최솟값 보고)")
+    parser.add_argument("--no-legacy", action="store_true", help="minidom 기준선 제외 (큰 카탈로그에서 느림)")
+    parser.add_argument("--format", choices=("text", "json"), default="text", help="출력 형식")
+    args = parser.parse_args(argv)
+    
+    processor = XMLProcessor()
+    catalog = build_catalog(args.apps, args.topics)
+    xml = processor.dict_to_xml(catalog)
+    
+    # 같은 결과를 내는 경로끼리만 비교
+    if not args.no_legacy and legacy_minidom(processor, catalog) != xml:
+        print("❌ legacy_minidom 출력이 dict_to_xml과 다릅니다", file=sys.stderr)
+        return 1
+    
+    fd, output_path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    try:
+        cases = [
+            ("dict_to_xml", lambda: processor.dict_to_xml(catalog)),
+            ("dict_to_xml_compact", lambda: processor.dict_to_xml(catalog, pretty_print=False)),
+            ("write_xml_stream_memory", lambda: processor.write_xml_stream(catalog, io.BytesIO())),
+            ("write_xml_stream_file", lambda: processor.write_xml_stream(catalog, output_path)),
+            ("xml_to_dict_lxml", lambda: processor.xml_to_dict(xml)),
+            ("xml_to_dict_xmltodict", lambda: processor.xml_to_dict(xml, parser="xmltodict")),
+        ]
+        if not args.no_legacy:
+            cases.insert(0, ("legacy_minidom", lambda: legacy_minidom(processor, catalog)))
+        
+        results = [measure(name, func, max(1, args.repeat)) for name, func in cases]
+    finally:
+        os.unlink(output_path)
+    
+    info = {"applications": args.apps, "topics": args.apps * args.topics, "xml_mb": round(len(xml.encode()) / 1e6, 2)}
+    if args.format == "json":
+        print(json.dumps({"catalog": info, "results": results}, ensure_ascii=False, indent=2))
+    else:
+        print(f"📊 카탈로그: 응용프로그램 {info['applications']}, 토픽 {info['topics']}, XML {info['xml_mb']} MB")
+        for result in results:
+            print(f"  {result['case']:<26} {result['seconds']:>9.4f} s  {result['peak_mb']:>9.2f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
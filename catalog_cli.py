@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+카탈로그 일괄 처리 CLI
+디렉토리 트리의 XML 카탈로그를 프로세스 풀로 병렬 검증/정규화/코드 생성
+내용 해시 기반 결과 캐시로 변경되지 않은 파일은 건너뜀
+
+사용 예:
+    python catalog_cli.py validate catalogs/ --format json
+    python catalog_cli.py normalize catalogs/ --write
+    python catalog_cli.py codegen catalogs/ --language cpp --output-dir generated/
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from models.atomic_io import DURABILITY_NONE, atomic_write_bytes
+from models.endpoint_planner import dump_plan, load_plan
+from models.template_engine import SERIALIZATIONS, TEMPLATE_LANGUAGES
+from models.xml_schema import XMLSchemaManager, validator_fingerprint
+
+
+CACHE_FORMAT_VERSION = 1
+DEFAULT_CACHE_FILE = ".catalog_cache.json"
+
+# 워커 프로세스별 스키마 매니저 (프로세스당 한 번 생성)
+_worker_manager: Optional[XMLSchemaManager] = None
+
+
+def _get_manager() -> XMLSchemaManager:
+    global _worker_manager
+    if _worker_manager is None:
+        _worker_manager = XMLSchemaManager()
+    return _worker_manager
+
+
+def _write_atomic(path: Path, data: bytes):
+    """임시 파일에 쓴 뒤 교체"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(path, data, DURABILITY_NONE)
+
+
+def _validate_task(path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """파일 하나 검증"""
+    manager = _get_manager()
+    mode = options["mode"]
+    
+    if mode == "stream":
+        is_valid, errors = manager.validate_file(path, fail_fast=options["fail_fast"])
+    else:
+        with open(path, 'rb') as f:
+            is_valid, errors = manager.validate_xml(f.read(), mode=mode)
+    
+    return {"status": "valid" if is_valid else "invalid", "errors": errors}
+
+
+def _normalize_task(path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """파일 하나 정규화 (write 옵션이면 제자리 교체)"""
+    manager = _get_manager()
+    original = Path(path).read_text(encoding='utf-8')
+    
+    # 서버 저장(file_manager)과 같은 직렬화이므로 서버가 저장한 파일은 unchanged
+    try:
+        normalized = manager.processor.format_xml(original)
+    except ValueError as e:
+        return {"status": "error", "errors": [str(e)]}
+    
+    if normalized == original:
+        return {"status": "unchanged", "errors": []}
+    
+    if options["write"]:
+        _write_atomic(Path(path), normalized.encode('utf-8'))
+        return {"status": "normalized", "errors": []}
+    
+    return {"status": "would_change", "errors": []}
+
+
+def _codegen_task(path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """파일 하나 코드 생성"""
+    manager = _get_manager()
+    
+    try:
+        structure = manager.import_xml(Path(path).read_text(encoding='utf-8'))
+    except ValueError as e:
+        return {"status": "error", "errors": [str(e)]}
+    
+    is_valid, errors = manager.validate(structure)
+    if not is_valid:
+        return {"status": "invalid", "errors": errors}
+    
+    # 이전 실행의 포트 배정을 이어받아 카탈로그가 바뀌어도 남은 발행자의 포트는 유지
+    output_path = _codegen_output_path(path, options)
+    plan_path = output_path.with_suffix(".endpoints.json")
+    plan = manager.plan_endpoints(
+        structure,
+        multiplex_publishers=options["multiplex_publishers"],
+        previous=load_plan(plan_path)
+    )
+    
+    code = manager.generate_code(
+        structure,
+        language=options["language"],
+        include_comments=not options["no_comments"],
+        include_examples=not options["no_examples"],
+        deterministic=options["deterministic"],
+        serialization=options["serialization"],
+        multiplex_publishers=options["multiplex_publishers"],
+        endpoint_plan=plan
+    )
+    
+    _write_atomic(output_path, code.encode('utf-8'))
+    _write_atomic(plan_path, dump_plan(plan))
+    # 빌드 파일은 출력 디렉토리의 생성 파일 전체를 대상으로 함 (같은 디렉토리의 작업들이 같은 내용을 씀)
+    for name, content in manager.project_files(options["language"], include_comments=not options["no_comments"],
+                                               deterministic=True).items():
+        _write_atomic(output_path.parent / name, content.encode('utf-8'))
+    # 벤치마크 프로그램은 카탈로그별 <이름>_benchmarks/ 디렉토리에 응용프로그램마다 하나
+    if options["benchmarks"]:
+        for name, content in manager.generate_benchmarks(structure, include_comments=not options["no_comments"],
+                                                         deterministic=options["deterministic"],
+                                                         multiplex_publishers=options["multiplex_publishers"],
+                                                         endpoint_plan=plan).items():
+            _write_atomic(output_path.with_name(f"{output_path.stem}_benchmarks") / name, content.encode('utf-8'))
+    return {"status": "generated", "errors": [], "output": str(output_path)}
+
+
+def _codegen_output_path(path: str, options: Dict[str, Any]) -> Path:
+    relative = Path(options["relative_paths"][path])
+    return Path(options["output_dir"]) / relative.with_suffix(TEMPLATE_LANGUAGES[options["language"]])
+
+
+TASKS = {
+    "validate": _validate_task,
+    "normalize": _normalize_task,
+    "codegen": _codegen_task
+}
+
+
+def _run_task(command: str, path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """워커 진입점 (예외도 결과로 반환)"""
+    started = time.perf_counter()
+    try:
+        result = TASKS[command](path, options)
+    except Exception as e:
+        result = {"status": "error", "errors": [f"{type(e).__name__}: {e}"]}
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return result
+
+
+def collect_files(paths: List[str], pattern: str) -> Dict[str, str]:
+    """입력 경로에서 카탈로그 파일 수집 (절대 경로 → 입력 기준 상대 경로)"""
+    files: Dict[str, str] = {}
+    for raw in paths:
+        base = Path(raw)
+        if base.is_file():
+            files[str(base.resolve())] = base.name
+        elif base.is_dir():
+            for file_path in sorted(base.rglob(pattern)):
+                if file_path.is_file():
+                    files[str(file_path.resolve())] = str(file_path.relative_to(base))
+        else:
+            print(f"⚠️ 경로 없음: {raw}", file=sys.stderr)
+    return files
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _options_fingerprint(command: str, options: Dict[str, Any]) -> str:
+    """결과에 영향을 주는 옵션과 구현 버전(검증 규칙/XSD, 코드 생성 템플릿)만 캐시 키에 포함"""
+    relevant = {k: v for k, v in options.items() if k not in ("relative_paths", "write")}
+    versions = {"validator": validator_fingerprint()}
+    if command == "codegen":
+        engine = _get_manager().code_generator.template_engine
+        versions["templates"] = engine.template_fingerprint(options["language"])
+        if options["benchmarks"]:
+            versions["benchmark"] = engine.benchmark_fingerprint()
+    return hashlib.sha256(json.dumps([command, relevant, versions], sort_keys=True).encode()).hexdigest()[:16]
+
+
+def load_cache(cache_path: Path) -> Dict[str, Any]:
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get("format") == CACHE_FORMAT_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {"format": CACHE_FORMAT_VERSION, "entries": {}}
+
+
+def save_cache(cache_path: Path, cache: Dict[str, Any]):
+    _write_atomic(cache_path, json.dumps(cache, ensure_ascii=False, separators=(",", ":")).encode('utf-8'))
+
+
+def run(command: str, files: Dict[str, str], options: Dict[str, Any],
+        jobs: int, cache: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """캐시 확인 후 나머지 파일을 프로세스 풀로 처리"""
+    options = dict(options, relative_paths=files)
+    fingerprint = _options_fingerprint(command, options)
+    results: Dict[str, Dict[str, Any]] = {}
+    pending = []
+    
+    for path in files:
+        digest = _file_digest(path)
+        key = f"{command}:{fingerprint}:{digest}"
+        entry = cache["entries"].get(key) if cache is not None else None
+        
+        # 코드 생성 결과는 출력 파일이 남아 있을 때만 재사용
+        if entry is not None and command == "codegen" and not _codegen_output_path(path, options).exists():
+            entry = None
+        
+        if entry is not None:
+            results[path] = dict(entry, cached=True)
+        else:
+            pending.append((path, key))
+    
+    if pending:
+        if jobs > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = [pool.submit(_run_task, command, path, options) for path, _ in pending]
+                computed = [future.result() for future in futures]
+        else:
+            computed = [_run_task(command, path, options) for path, _ in pending]
+        
+        for (path, key), result in zip(pending, computed):
+            results[path] = dict(result, cached=False)
+            # 오류(예외)와 쓰기 전 상태는 캐시하지 않음
+            if cache is not None and result["status"] not in ("error", "would_change", "normalized"):
+                cache["entries"][key] = {k: v for k, v in result.items() if k != "elapsed_ms"}
+    
+    return [dict(results[path], path=files[path]) for path in files]
+
+
+def _summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {"total": len(results), "cached": 0}
+    for result in results:
+        summary[result["status"]] = summary.get(result["status"], 0) + 1
+        if result.get("cached"):
+            summary["cached"] += 1
+    return summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="ZeroMQ Topic Manager 카탈로그 일괄 처리")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("paths", nargs="+", help="카탈로그 파일 또는 디렉토리")
+    common.add_argument("--pattern", default="*.xml", help="디렉토리 검색 패턴 (기본: *.xml)")
+    common.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수")
+    common.add_argument("--cache", default=DEFAULT_CACHE_FILE, help="결과 캐시 파일 경로")
+    common.add_argument("--no-cache", action="store_true", help="결과 캐시 사용 안 함")
+    common.add_argument("--format", choices=("text", "json"), default="text", help="출력 형식")
+    
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    validate = subparsers.add_parser("validate", parents=[common], help="카탈로그 검증")
+    validate.add_argument("--mode", choices=("xsd", "python", "stream"), default="xsd", help="검증 방식")
+    validate.add_argument("--fail-fast", action="store_true", help="stream 모드에서 첫 오류에서 중단")
+    
+    normalize = subparsers.add_parser("normalize", parents=[common], help="카탈로그 정규화")
+    normalize.add_argument("--write", action="store_true", help="정규화 결과로 파일 교체")
+    
+    codegen = subparsers.add_parser("codegen", parents=[common], help="코드 생성")
+    codegen.add_argument("--language", choices=sorted(TEMPLATE_LANGUAGES), default="python")
+    codegen.add_argument("--output-dir", default="generated", help="생성 코드 출력 디렉토리")
+    codegen.add_argument("--no-comments", action="store_true", help="주석 제외")
+    codegen.add_argument("--no-examples", action="store_true", help="사용 예제 제외")
+    codegen.add_argument("--deterministic", action="store_true", help="생성 시각을 넣지 않음 (재현 가능한 출력)")
+    codegen.add_argument("--serialization", choices=SERIALIZATIONS, default="json",
+                         help="python 메시지 형식 (protobuf/raw: 토픽 프레임 + 바이너리 페이로드)")
+    codegen.add_argument("--multiplex-publishers", action="store_true",
+                         help="응용프로그램의 발행 토픽이 PUB 소켓 하나를 공유")
+    codegen.add_argument("--benchmarks", action="store_true",
+                         help="응용프로그램별 토픽 벤치마크 프로그램도 생성 (<출력>_benchmarks/)")
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    
+    if args.command == "validate":
+        options = {"mode": args.mode, "fail_fast": args.fail_fast}
+    elif args.command == "normalize":
+        options = {"write": args.write}
+    else:
+        options = {
+            "language": args.language,
+            "output_dir": str(Path(args.output_dir).resolve()),
+            "no_comments": args.no_comments,
+            "no_examples": args.no_examples,
+            "deterministic": args.deterministic,
+            "serialization": args.serialization,
+            "multiplex_publishers": args.multiplex_publishers,
+            "benchmarks": args.benchmarks
+        }
+    
+    started = time.perf_counter()
+    files = collect_files(args.paths, args.pattern)
+    cache_path = Path(args.cache)
+    cache = None if args.no_cache else load_cache(cache_path)
+    
+    results = run(args.command, files, options, max(1, args.jobs), cache)
+    
+    if cache is not None:
+        save_cache(cache_path, cache)
+    
+    summary = _summarize(results)
+    elapsed = round(time.perf_counter() - started, 3)
+    failed = any(r["status"] in ("invalid", "error", "would_change") for r in results)
+    
+    if args.format == "json":
+        print(json.dumps({
+            "command": args.command,
+            "options": options,
+            "files": results,
+            "summary": summary,
+            "elapsed_seconds": elapsed,
+            "success": not failed
+        }, ensure_ascii=False, indent=2))
+    else:
+        icons = {"valid": "✅", "unchanged": "✅", "generated": "✅", "normalized": "📝",
+                 "would_change": "⚠️", "invalid": "❌", "error": "❌"}
+        for result in results:
+            cached = " (cached)" if result.get("cached") else ""
+            print(f"{icons.get(result['status'], '•')} {result['path']}: {result['status']}{cached}")
+            for error in result.get("errors", []):
+                print(f"    - {error}")
+        print(f"\n📊 {summary} ({elapsed}s)")
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,17 +4,21 @@ ZeroMQ Topic Manager - Python FastAPI Backend
 """
 
 import asyncio
+import bisect
+import hashlib
 import json
 import os
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import uvicorn
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, Response, StreamingResponse
+from email.utils import formatdate, parsedate_to_datetime
 from pydantic import BaseModel
 
 from pycrdt import Doc, Map, Array
@@ -22,6 +26,12 @@ import pycrdt
 import struct
 import base64
 from models.file_manager import xml_file_manager
+from models.xml_schema import XML_DECLARATION, XMLProcessor, IncrementalValidator, XMLSchemaManager
+from models.catalog_diff import build_catalog_index, catalog_differ
+from models.codegen_output import IncrementalCodeWriter, build_code_bundle, create_render_pool
+from models.endpoint_planner import plan_statistics
+from models.structure_utils import as_list
+from models.topology_simulator import SimulationConfig, TopologySimulator, is_available as simulator_available
 
 # 모델 정의
 class ApplicationModel(BaseModel):
@@ -34,17 +44,78 @@ class TopicModel(BaseModel):
     direction: str  # "publish" or "subscribe"
     description: str = ""
 
+class CodegenRequest(BaseModel):
+    language: str = "python"
+    app_name: str = "all"
+    include_comments: bool = True
+    include_examples: bool = True
+    deterministic: bool = False
+    serialization: str = "json"  # json | protobuf | raw (python)
+    multiplex_publishers: bool = False  # 응용프로그램의 발행 토픽이 PUB 소켓 하나를 공유
+    endpoint_plan: Optional[dict] = None  # 포트 배정을 유지할 이전 엔드포인트 계획 (endpoints.json)
+    include_benchmarks: bool = False  # 응용프로그램별 토픽 벤치마크 프로그램 (<응용프로그램>_benchmark.py)
+    structure: Optional[dict] = None  # 없으면 라이브 문서 사용
+
+class CodegenBundleRequest(BaseModel):
+    languages: List[str] = ["python", "cpp", "java", "csharp"]
+    app_names: Optional[List[str]] = None  # 없으면 전체 응용프로그램
+    include_comments: bool = True
+    include_examples: bool = True
+    deterministic: bool = False
+    serialization: str = "json"  # json | protobuf | raw (python)
+    multiplex_publishers: bool = False  # 응용프로그램의 발행 토픽이 PUB 소켓 하나를 공유
+    endpoint_plan: Optional[dict] = None  # 포트 배정을 유지할 이전 엔드포인트 계획 (endpoints.json)
+    structure: Optional[dict] = None  # 없으면 라이브 문서 사용
+
+class SimulationRequest(BaseModel):
+    duration: float = 2.0  # 초 (SIMULATION_MAX_SECONDS 이하)
+    rate: float = 1000.0  # 발행자 하나당 초당 메시지 수 (0 = 제한 없음)
+    rates: Dict[str, float] = {}  # 토픽별 전송률
+    payload_bytes: int = 64
+    payload_sizes: Dict[str, int] = {}  # 토픽별 페이로드 크기
+    hwm: int = 1000  # 모든 소켓의 SNDHWM/RCVHWM (0 = 무제한)
+    multiplex_publishers: bool = False  # 응용프로그램의 발행 토픽이 PUB 소켓 하나를 공유
+    structure: Optional[dict] = None  # 없으면 라이브 문서 사용
+
 class AddTopicRequest(BaseModel):
     app_name: str
     topic: TopicModel
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 수명 동안 유지하는 자원 (코드 번들 렌더링 프로세스 풀은 요청마다 만들지 않음)"""
+    app.state.render_pool = create_render_pool()
+    try:
+        yield
+    finally:
+        if app.state.render_pool is not None:
+            app.state.render_pool.shutdown(wait=False, cancel_futures=True)
+        app.state.render_pool = None
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="ZeroMQ Topic Manager",
     description="실시간 협업 XML 편집기",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
+# JSON 봉투로 내려줄 최대 XML 크기 (초과 시 /raw 스트리밍 엔드포인트 사용)
+JSON_LOAD_MAX_BYTES = int(os.environ.get("JSON_LOAD_MAX_BYTES", 5 * 1024 * 1024))
+
+# 문서 변경 시 응용프로그램별 코드를 다시 생성할 출력 디렉토리 (비어 있으면 비활성)
+CODEGEN_OUTPUT_DIR = os.environ.get("CODEGEN_OUTPUT_DIR", "")
+CODEGEN_LANGUAGES = [language.strip() for language in os.environ.get("CODEGEN_LANGUAGES", "python,cpp").split(",") if language.strip()]
+# 연속 편집을 한 번의 재생성으로 묶는 대기 시간 (초)
+CODEGEN_DEBOUNCE_SECONDS = float(os.environ.get("CODEGEN_DEBOUNCE_SECONDS", 1.0))
+# 자동 생성 코드의 메시지 형식 (json | protobuf | raw)
+CODEGEN_SERIALIZATION = os.environ.get("CODEGEN_SERIALIZATION", "json")
+# 응용프로그램의 발행 토픽을 PUB 소켓 하나로 묶을지 여부
+CODEGEN_MULTIPLEX_PUBLISHERS = os.environ.get("CODEGEN_MULTIPLEX_PUBLISHERS", "false").lower() in ("1", "true", "yes")
+
+# 토폴로지 시뮬레이션 한 번의 최대 실행 시간 (초)
+SIMULATION_MAX_SECONDS = float(os.environ.get("SIMULATION_MAX_SECONDS", 30.0))
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -54,6 +125,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 트랜잭션 origin 구분자
+ORIGIN_REMOTE = "remote"    # WebSocket으로 받은 클라이언트 업데이트
+ORIGIN_RESTORE = "restore"  # 백업/파일에서 문서로 복원
+
+def _to_prelim(value):
+    """to_py()로 뜬 Yjs 값을 문서에 다시 넣을 수 있는 Map/Array로 변환"""
+    if isinstance(value, dict):
+        return Map({key: _to_prelim(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return Array([_to_prelim(item) for item in value])
+    return value
+
+def _longest_increasing_run(values: List[int]) -> set:
+    """순증가 부분열 중 가장 긴 것의 인덱스 집합 (O(n log n))"""
+    tails: List[int] = []       # 길이 k+1 부분열 중 마지막 값이 가장 작은 것의 마지막 인덱스
+    tail_values: List[int] = []
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        k = bisect.bisect_left(tail_values, value)
+        if k:
+            previous[i] = tails[k - 1]
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[k] = i
+            tail_values[k] = value
+    
+    run = set()
+    i = tails[-1] if tails else -1
+    while i != -1:
+        run.add(i)
+        i = previous[i]
+    return run
+
 class ZeroMQTopicManager:
     """ZeroMQ 토픽 관리를 위한 Yjs 기반 협업 매니저"""
     
@@ -62,6 +168,11 @@ class ZeroMQTopicManager:
         self.doc = Doc()
         self.root_map = Map()
         self.doc["applications"] = self.root_map
+        self.xml_processor = XMLProcessor()
+        self.validation = IncrementalValidator()
+        
+        # 진행 중인 트랜잭션의 origin (transaction()이 기록, 변경 콜백이 참조)
+        self._transaction_origin: Optional[str] = None
         
         # 초기 XML 구조 설정
         self._initialize_structure()
@@ -73,24 +184,32 @@ class ZeroMQTopicManager:
         self.connected_clients: Dict[str, WebSocket] = {}
         
         # 변경사항 감지를 위한 콜백 설정
-        self.doc.observe(self._on_document_change)
+        self._document_revision = 0
+        self._doc_subscription = self.doc.observe(self._on_document_change)
+        
+        # 증분 검증: 전체 검증 한 번 후 변경된 응용프로그램만 재검증
+        applications = self.root_map.get("Applications")
+        self.validation.reset(self.get_xml_structure())
+        self._root_subscription = applications.observe(self._on_root_change)
+        self._apps_subscription = applications.get("Application").observe_deep(self._on_applications_change)
         
         # 자동 저장 설정
         self.auto_save_enabled = True
         self.last_save_time = datetime.now()
+        
+        # 증분 코드 재생성 (CODEGEN_OUTPUT_DIR 설정 시)
+        self.code_writer: Optional[IncrementalCodeWriter] = None
+        self._codegen_handle: Optional[asyncio.TimerHandle] = None
     
     def _initialize_structure(self):
         """초기 XML 구조를 Yjs 맵으로 설정"""
         if len(self.root_map) == 0:
-            # Applications 루트 요소 생성
-            applications_elem = Map()
-            self.doc["Applications"] = applications_elem
-            applications_elem["xmlns"] = "http://zeromq-topic-manager/schema"
-            applications_elem["version"] = "1.0"
-            
-            # Application 배열 생성
-            app_array = Array()
-            applications_elem["Application"] = app_array
+            # Applications 루트 요소 + Application 배열 생성
+            self.root_map["Applications"] = Map({
+                "xmlns": "http://zeromq-topic-manager/schema",
+                "version": "1.0",
+                "Application": Array()
+            })
             
             print("✅ Yjs 문서 구조 초기화 완료")
     
@@ -100,8 +219,7 @@ class ZeroMQTopicManager:
             existing_xml = xml_file_manager.load_xml("applications.xml")
             if existing_xml:
                 print("📖 기존 XML 파일에서 데이터 로드 중...")
-                # TODO: XML을 Yjs 구조로 파싱하여 로드
-                # 현재는 구조만 유지
+                self.restore_from_xml(existing_xml)
                 print("✅ 기존 데이터 로드 완료")
             else:
                 print("📝 새로운 XML 문서로 시작")
@@ -131,72 +249,183 @@ class ZeroMQTopicManager:
             print(f"❌ 자동 저장 실패: {e}")
     
     def _structure_to_xml(self, structure: dict) -> str:
-        """구조를 XML 문자열로 변환"""
-        xml_lines = ['<?xml version="1.0" encoding="UTF-8"?>']
-        
-        def add_element(name, attrs, children=None, indent=0):
-            indent_str = "  " * indent
-            attr_str = ""
-            
-            for key, value in attrs.items():
-                if key.startswith('@'):
-                    attr_name = key[1:]
-                    attr_str += f' {attr_name}="{value}"'
-            
-            if children:
-                xml_lines.append(f"{indent_str}<{name}{attr_str}>")
-                for child in children:
-                    if isinstance(child, dict):
-                        for child_name, child_data in child.items():
-                            if not child_name.startswith('@'):
-                                if isinstance(child_data, list):
-                                    for item in child_data:
-                                        add_element(child_name, item, None, indent + 1)
-                                else:
-                                    add_element(child_name, child_data, None, indent + 1)
-                xml_lines.append(f"{indent_str}</{name}>")
-            else:
-                xml_lines.append(f"{indent_str}<{name}{attr_str}/>")
-        
-        # Applications 루트 추가
-        apps_data = structure.get("Applications", {})
-        apps_attrs = {k: v for k, v in apps_data.items() if k.startswith('@')}
-        
-        xml_lines.append(f'<Applications xmlns="{apps_attrs.get("@xmlns", "http://zeromq-topic-manager/schema")}" version="{apps_attrs.get("@version", "1.0")}">')
-        
-        # Application 요소들 추가
-        applications = apps_data.get("Application", [])
-        for app in applications:
-            app_attrs = {k: v for k, v in app.items() if k.startswith('@')}
-            app_name = app_attrs.get('@name', 'Unknown')
-            app_desc = app_attrs.get('@description', '')
-            
-            xml_lines.append(f'  <Application name="{app_name}" description="{app_desc}">')
-            
-            # Topic 요소들 추가
-            topics = app.get("Topic", [])
-            for topic in topics:
-                topic_name = topic.get('@name', '')
-                topic_proto = topic.get('@proto', '')
-                topic_direction = topic.get('@direction', '')
-                topic_desc = topic.get('@description', '')
-                
-                xml_lines.append(f'    <Topic name="{topic_name}" proto="{topic_proto}" direction="{topic_direction}" description="{topic_desc}"/>')
-            
-            xml_lines.append(f'  </Application>')
-        
-        xml_lines.append('</Applications>')
-        
-        return '\n'.join(xml_lines)
+        """구조를 저장 형식 XML 문자열로 변환 (XMLProcessor.format_xml, catalog_cli normalize와 같은 직렬화)"""
+        return XML_DECLARATION.decode() + self.xml_processor.dict_to_xml(structure)
     
-    def _on_document_change(self, event, transaction):
+    def _on_document_change(self, event):
         """문서 변경사항 감지 시 호출되는 콜백"""
-        if not transaction.local:
-            print(f"🔄 원격 변경사항 감지: {event}")
+        self._document_revision += 1
+        self._schedule_code_regeneration()
+        if self._transaction_origin == ORIGIN_REMOTE:
+            print(f"🔄 원격 변경사항 감지: {len(event.update)} bytes")
             # 자동 저장 트리거
             if self.auto_save_enabled:
                 asyncio.create_task(self._auto_save())
     
+    @contextmanager
+    def transaction(self, origin: str):
+        """origin을 기록하며 문서 트랜잭션 실행
+        
+        doc.observe 콜백의 event.transaction은 origin 값을 돌려주지 않으므로,
+        커밋 시 동기적으로 호출되는 콜백이 읽을 수 있도록 여기서 보관한다.
+        """
+        previous = self._transaction_origin
+        self._transaction_origin = origin
+        try:
+            with self.doc.transaction(origin=origin):
+                yield
+        finally:
+            self._transaction_origin = previous
+    
+    def apply_structure(self, structure: dict, origin: str = ORIGIN_RESTORE) -> Dict[str, int]:
+        """dict 구조와 라이브 문서의 최소 차이만 한 트랜잭션으로 적용
+        
+        이름을 키로 응용프로그램/토픽을 맞춰 보고, 사라진 항목 삭제, 바뀐 속성만 갱신,
+        새 항목 추가 후 배열을 대상 순서로 맞춘다. 이미 대상 순서대로 놓인 가장 긴
+        항목 열은 제자리에서 갱신하고, 나머지는 대상 위치에 다시 넣는다(moved).
+        """
+        stats = {
+            "applications_added": 0, "applications_removed": 0,
+            "applications_updated": 0, "applications_moved": 0,
+            "topics_added": 0, "topics_removed": 0, "topics_updated": 0, "topics_moved": 0
+        }
+        
+        target_root = structure.get("Applications") or {}
+        
+        with self.transaction(origin):
+            applications = self.root_map.get("Applications")
+            for key, default in (("xmlns", "http://zeromq-topic-manager/schema"), ("version", "1.0")):
+                value = target_root.get(f"@{key}", default)
+                if applications.get(key) != value:
+                    applications[key] = value
+            
+            def build_app(target_app: dict) -> Map:
+                target_topics = as_list(target_app.get("Topic"))
+                stats["topics_added"] += len(target_topics)
+                return Map({
+                    "name": target_app.get("@name", ""),
+                    "description": target_app.get("@description", ""),
+                    "Topic": Array([self._topic_to_map(topic) for topic in target_topics])
+                })
+            
+            def update_app(live_app: Map, target_app: dict):
+                if live_app.get("description", "") != target_app.get("@description", ""):
+                    live_app["description"] = target_app.get("@description", "")
+                    stats["applications_updated"] += 1
+                self._apply_topics(live_app, as_list(target_app.get("Topic")), stats)
+            
+            self._sync_named_array(applications.get("Application"), as_list(target_root.get("Application")),
+                                   "applications", stats, build_app, update_app)
+        
+        return stats
+    
+    def _sync_named_array(self, array: Array, targets: List[dict], kind: str, stats: Dict[str, int],
+                          build, update):
+        """name 키로 Yjs 배열을 대상 목록(xmltodict dict, 같은 이름은 첫 항목만)과 같은 순서·내용으로 맞춤"""
+        ordered: Dict[str, dict] = {}
+        for target in targets:
+            ordered.setdefault(target.get("@name", ""), target)
+        positions = {name: i for i, name in enumerate(ordered)}
+        
+        # 대상에 없거나 중복된 항목은 삭제 대상, 나머지는 (배열 인덱스, 이름)
+        live: List[tuple] = []
+        remove_indices = []
+        seen = set()
+        for i, item in enumerate(array):
+            name = item.get("name", "")
+            if name not in positions or name in seen:
+                remove_indices.append(i)
+            else:
+                seen.add(name)
+                live.append((i, name))
+        
+        # 대상 순서를 이미 지키는 가장 긴 열은 그대로 두고, 나머지는 빼서 제자리에 다시 넣음
+        keep = _longest_increasing_run([positions[name] for _, name in live])
+        kept: Dict[str, Map] = {}
+        moved: Dict[str, dict] = {}
+        for k, (i, name) in enumerate(live):
+            if k in keep:
+                kept[name] = array[i]
+            else:
+                # Yjs 배열에는 이동이 없으므로 삭제 전에 내용을 떠 두었다가 새 위치에 그대로 다시 넣음
+                moved[name] = array[i].to_py()
+                remove_indices.append(i)
+        
+        for i in sorted(remove_indices, reverse=True):
+            del array[i]
+        stats[f"{kind}_removed"] += len(remove_indices) - len(moved)
+        
+        # 남은 항목은 대상 순서이므로, 빠진 위치에 차례로 넣으면 대상 순서가 된다
+        for position, (name, target) in enumerate(ordered.items()):
+            item = kept.get(name)
+            if item is None and name in moved:
+                array.insert(position, _to_prelim(moved[name]))
+                item = array[position]
+                stats[f"{kind}_moved"] += 1
+            if item is not None:
+                update(item, target)
+            else:
+                array.insert(position, build(target))
+                stats[f"{kind}_added"] += 1
+    
+    def _topic_to_map(self, topic: dict) -> Map:
+        """xmltodict 토픽 dict를 Yjs Map으로 변환"""
+        return Map({
+            "name": topic.get("@name", ""),
+            "proto": topic.get("@proto", ""),
+            "direction": topic.get("@direction", ""),
+            "description": topic.get("@description", "")
+        })
+    
+    def _apply_topics(self, live_app: Map, target_topics: List[dict], stats: Dict[str, int]):
+        """응용프로그램 하나의 토픽 배열에 최소 차이 적용"""
+        topic_array = live_app.get("Topic")
+        if topic_array is None:
+            live_app["Topic"] = Array([self._topic_to_map(topic) for topic in target_topics])
+            stats["topics_added"] += len(target_topics)
+            return
+        
+        def update_topic(live_topic: Map, target: dict):
+            changed = False
+            for key in ("proto", "direction", "description"):
+                value = target.get(f"@{key}", "")
+                if live_topic.get(key, "") != value:
+                    live_topic[key] = value
+                    changed = True
+            if changed:
+                stats["topics_updated"] += 1
+        
+        self._sync_named_array(topic_array, target_topics, "topics", stats, self._topic_to_map, update_topic)
+    
+    def restore_from_xml(self, xml_content: str) -> Dict[str, Any]:
+        """XML을 파싱해 라이브 문서에 최소 차이로 반영하고, 그 변경분 업데이트를 반환"""
+        return self.restore_structure(self.xml_processor.xml_to_dict(xml_content))
+    
+    def restore_structure(self, structure: dict) -> Dict[str, Any]:
+        """파싱된 구조를 라이브 문서에 최소 차이로 반영하고, 그 변경분 업데이트를 반환"""
+        state_before = self.doc.get_state()
+        stats = self.apply_structure(structure, origin=ORIGIN_RESTORE)
+        update = self.doc.get_update(state_before)
+        
+        return {"stats": stats, "update": update}
+    
+    async def broadcast_update(self, update: bytes, exclude: Optional[str] = None):
+        """Yjs 업데이트 하나를 연결된 모든 클라이언트에게 전송"""
+        message = struct.pack('B', 2) + update
+        disconnected = []
+        
+        for client_id, websocket in list(self.connected_clients.items()):
+            if client_id == exclude:
+                continue
+            try:
+                await websocket.send_bytes(message)
+            except Exception as e:
+                print(f"❌ 클라이언트 {client_id}에게 업데이트 전송 실패: {e}")
+                disconnected.append(client_id)
+        
+        for client_id in disconnected:
+            self.connected_clients.pop(client_id, None)
+    
     def add_application(self, name: str, description: str = "") -> bool:
         """새 응용프로그램 추가"""
         try:
@@ -209,19 +438,15 @@ class ZeroMQTopicManager:
                 if existing_app.get("name") == name:
                     return False  # 이미 존재
             
-            # 새 응용프로그램 생성
-            new_app = Map(f"app_{name}_{datetime.now().timestamp()}")
-            self.doc.add(new_app)
-            new_app.set("name", name)
-            new_app.set("description", description)
-            
-            # 토픽 배열 생성
-            topic_array = Array(f"topics_{name}_{datetime.now().timestamp()}")
-            self.doc.add(topic_array)
-            new_app.set("Topic", topic_array)
+            # 새 응용프로그램 생성 (토픽 배열 포함)
+            new_app = Map({
+                "name": name,
+                "description": description,
+                "Topic": Array()
+            })
             
             # 배열에 추가
-            app_array.append([new_app])
+            app_array.append(new_app)
             
             print(f"✅ 응용프로그램 추가됨: {name}")
             return True
@@ -256,15 +481,15 @@ class ZeroMQTopicManager:
                     return False  # 이미 존재
             
             # 새 토픽 생성
-            new_topic = Map(f"topic_{app_name}_{topic.name}_{datetime.now().timestamp()}")
-            self.doc.add(new_topic)
-            new_topic.set("name", topic.name)
-            new_topic.set("proto", topic.proto)
-            new_topic.set("direction", topic.direction)
-            new_topic.set("description", topic.description)
+            new_topic = Map({
+                "name": topic.name,
+                "proto": topic.proto,
+                "direction": topic.direction,
+                "description": topic.description
+            })
             
             # 배열에 추가
-            topic_array.append([new_topic])
+            topic_array.append(new_topic)
             
             print(f"✅ 토픽 추가됨: {topic.name} → {app_name}")
             return True
@@ -353,35 +578,163 @@ class ZeroMQTopicManager:
             app_array = applications.get("Application")
             
             for i in range(len(app_array)):
-                app = app_array[i]
-                app_data = {
-                    "@name": app.get("name", ""),
-                    "@description": app.get("description", ""),
-                    "Topic": []
-                }
-                
-                topic_array = app.get("Topic")
-                if topic_array:
-                    for j in range(len(topic_array)):
-                        topic = topic_array[j]
-                        topic_data = {
-                            "@name": topic.get("name", ""),
-                            "@proto": topic.get("proto", ""),
-                            "@direction": topic.get("direction", ""),
-                            "@description": topic.get("description", "")
-                        }
-                        app_data["Topic"].append(topic_data)
-                
-                result["Applications"]["Application"].append(app_data)
+                result["Applications"]["Application"].append(self._application_to_dict(app_array[i]))
             
             return result
             
         except Exception as e:
             print(f"❌ XML 구조 변환 실패: {e}")
             return {"Applications": {"Application": []}}
+    
+    def _application_to_dict(self, app: Map) -> dict:
+        """Yjs 응용프로그램 Map을 Python dict로 변환"""
+        app_data = {
+            "@name": app.get("name", ""),
+            "@description": app.get("description", ""),
+            "Topic": []
+        }
+        
+        topic_array = app.get("Topic")
+        if topic_array:
+            for j in range(len(topic_array)):
+                topic = topic_array[j]
+                topic_data = {
+                    "@name": topic.get("name", ""),
+                    "@proto": topic.get("proto", ""),
+                    "@direction": topic.get("direction", ""),
+                    "@description": topic.get("description", "")
+                }
+                app_data["Topic"].append(topic_data)
+        
+        return app_data
+    
+    def _on_applications_change(self, events):
+        """문서 변경 이벤트로 영향받은 응용프로그램만 재검증"""
+        applications = self.root_map.get("Applications")
+        app_array = applications.get("Application")
+        touched = set()
+        structural = False
+        renamed = False
+        changed = False
+        
+        for event in events:
+            path = event.path
+            if not path:
+                # 응용프로그램 추가/삭제
+                structural = True
+                continue
+            
+            touched.add(path[0])
+            # 이름 변경 시 이전 이름의 결과 제거
+            if len(path) == 1 and "name" in (getattr(event, "keys", None) or {}):
+                renamed = True
+                old_name = event.keys["name"].get("oldValue")
+                if old_name is not None:
+                    changed |= self.validation.remove_application(old_name)
+        
+        if structural or renamed:
+            names = [app_array[i].get("name", "") for i in range(len(app_array))]
+            current = {}
+            for i, name in enumerate(names):
+                current.setdefault(name, i)
+            for name in self.validation.known_applications():
+                if name not in current:
+                    changed |= self.validation.remove_application(name)
+            known = set(self.validation.known_applications())
+            touched.update(i for name, i in current.items() if name not in known)
+            changed |= self.validation.update_application_names(names)
+        
+        for i in touched:
+            if i < len(app_array):
+                changed |= self.validation.update_application(self._application_to_dict(app_array[i]))
+        
+        if changed:
+            self._schedule_validation_broadcast()
+    
+    def _on_root_change(self, event):
+        """루트 속성(xmlns/version) 변경 시 재검증"""
+        applications = self.root_map.get("Applications")
+        if self.validation.update_root({
+            "@xmlns": applications.get("xmlns"),
+            "@version": applications.get("version")
+        }):
+            self._schedule_validation_broadcast()
+    
+    def get_document_version(self) -> str:
+        """문서 버전 식별자 (모든 업데이트마다 바뀜)
+        
+        삭제만 있는 업데이트는 Yjs 상태 벡터를 바꾸지 않으므로 변경 횟수를 함께 넣는다.
+        상태 벡터 해시는 서버 재시작 후 같은 횟수와 겹치지 않게 구분하는 역할.
+        """
+        return f"{hashlib.sha256(self.doc.get_state()).hexdigest()[:16]}-{self._document_revision}"
+    
+    def get_validation_state(self) -> Dict[str, Any]:
+        """현재 검증 결과 스냅샷"""
+        errors = self.validation.get_errors()
+        return {
+            "valid": len(errors) == 0,
+            "errors": errors,
+            "version": self.validation.version
+        }
+    
+    def _schedule_code_regeneration(self):
+        """변경이 잠잠해지면 코드 재생성 (디바운스, 이벤트 루프가 있을 때만)"""
+        if self.code_writer is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._codegen_handle is not None:
+            self._codegen_handle.cancel()
+        self._codegen_handle = loop.call_later(
+            CODEGEN_DEBOUNCE_SECONDS, lambda: loop.create_task(self.regenerate_code())
+        )
+    
+    async def regenerate_code(self) -> Dict[str, Dict[str, List[str]]]:
+        """현재 문서 기준으로 바뀐 응용프로그램 코드만 다시 생성"""
+        # 수동 동기화가 예약된 재생성을 대신함
+        if self._codegen_handle is not None:
+            self._codegen_handle.cancel()
+            self._codegen_handle = None
+        if self.code_writer is None:
+            return {}
+        # 문서는 이벤트 루프 스레드에서 읽고 파일 쓰기는 스레드로
+        structure = self.get_xml_structure()
+        try:
+            stats = await asyncio.to_thread(self.code_writer.sync, structure)
+        except Exception as e:
+            print(f"❌ 코드 재생성 실패: {e}")
+            return {}
+        for language, result in stats.items():
+            if result["written"] or result["removed"]:
+                print(f"🛠️ 코드 재생성 ({language}): 갱신 {len(result['written'])}개, "
+                      f"삭제 {len(result['removed'])}개, 유지 {len(result['unchanged'])}개")
+        return stats
+    
+    def _schedule_validation_broadcast(self):
+        """검증 결과 변경을 사용자 WebSocket으로 알림 (이벤트 루프가 있을 때만)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.create_task(user_manager.broadcast({
+            "type": "validation_changed",
+            **self.get_validation_state()
+        }))
 
 # 전역 매니저 인스턴스
 topic_manager = ZeroMQTopicManager()
+schema_manager = XMLSchemaManager()
+if CODEGEN_OUTPUT_DIR:
+    # 요청별 코드 생성과 같은 템플릿 엔진(조각 캐시)을 공유
+    topic_manager.code_writer = IncrementalCodeWriter(
+        CODEGEN_OUTPUT_DIR,
+        languages=CODEGEN_LANGUAGES,
+        engine=schema_manager.code_generator.template_engine,
+        serialization=CODEGEN_SERIALIZATION,
+        multiplex_publishers=CODEGEN_MULTIPLEX_PUBLISHERS
+    )
 
 # 정적 파일 서빙 (기존 프론트엔드 유지)
 app.mount("/static", StaticFiles(directory="public"), name="static")
@@ -484,6 +837,177 @@ async def get_xml_structure():
         "structure": structure
     }
 
+@app.get("/api/validation")
+async def get_validation():
+    """현재 문서의 증분 검증 결과 조회"""
+    return {
+        "success": True,
+        **topic_manager.get_validation_state()
+    }
+
+@app.post("/api/validate")
+async def validate_xml(request: Request, mode: str = Query("xsd")):
+    """업로드된 원본 XML 검증 (mode: xsd | python)"""
+    if mode not in ("xsd", "python"):
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 검증 모드: {mode}")
+    
+    body = await request.body()
+    if not body:
+        raise HTTPException(status_code=400, detail="검증할 XML이 필요합니다.")
+    
+    is_valid, errors = await asyncio.to_thread(schema_manager.validate_xml, body, mode)
+    return {
+        "success": True,
+        "mode": mode,
+        "valid": is_valid,
+        "errors": errors
+    }
+
+@app.post("/api/codegen")
+async def generate_code(request: CodegenRequest):
+    """코드 생성 (변경되지 않은 응용프로그램은 캐시된 조각 재사용)"""
+    structure = request.structure if request.structure is not None else topic_manager.get_xml_structure()
+    try:
+        code = await asyncio.to_thread(
+            schema_manager.generate_code,
+            structure,
+            language=request.language,
+            app_name=request.app_name,
+            include_comments=request.include_comments,
+            include_examples=request.include_examples,
+            deterministic=request.deterministic,
+            serialization=request.serialization,
+            multiplex_publishers=request.multiplex_publishers,
+            endpoint_plan=request.endpoint_plan
+        )
+        benchmarks = {}
+        if request.include_benchmarks:
+            benchmarks = await asyncio.to_thread(
+                schema_manager.generate_benchmarks,
+                structure,
+                app_name=request.app_name,
+                include_comments=request.include_comments,
+                deterministic=request.deterministic,
+                multiplex_publishers=request.multiplex_publishers,
+                endpoint_plan=request.endpoint_plan
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "success": True,
+        "language": request.language,
+        "code": code,
+        "endpoints": schema_manager.plan_endpoints(
+            structure,
+            multiplex_publishers=request.multiplex_publishers,
+            previous=request.endpoint_plan
+        ),
+        "project_files": schema_manager.project_files(
+            request.language,
+            include_comments=request.include_comments,
+            deterministic=request.deterministic
+        ),
+        "benchmarks": benchmarks,
+        "cache": schema_manager.get_codegen_cache_info()
+    }
+
+@app.get("/api/endpoints")
+async def get_endpoint_plan(multiplex_publishers: bool = Query(False)):
+    """라이브 문서의 엔드포인트 계획 (생성 코드가 바인딩/연결하는 포트)"""
+    structure = topic_manager.get_xml_structure()
+    try:
+        plan = schema_manager.plan_endpoints(structure, multiplex_publishers=multiplex_publishers)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "success": True,
+        "plan": plan,
+        "statistics": plan_statistics(plan)
+    }
+
+# 시뮬레이션은 CPU를 모두 쓰므로 한 번에 하나만 실행
+simulation_lock = asyncio.Lock()
+
+@app.post("/api/simulate")
+async def simulate_topology(request: SimulationRequest):
+    """카탈로그 토폴로지를 inproc 소켓으로 시뮬레이션 (토픽별 전달률, HWM 초과로 버려진 메시지, 지연)"""
+    if not simulator_available():
+        raise HTTPException(status_code=503, detail="pyzmq가 설치되지 않아 시뮬레이션을 실행할 수 없습니다.")
+    if request.duration > SIMULATION_MAX_SECONDS:
+        raise HTTPException(status_code=400, detail=f"시뮬레이션 시간은 최대 {SIMULATION_MAX_SECONDS}초입니다.")
+    if simulation_lock.locked():
+        raise HTTPException(status_code=409, detail="다른 시뮬레이션이 실행 중입니다.")
+    
+    structure = request.structure if request.structure is not None else topic_manager.get_xml_structure()
+    config = SimulationConfig(
+        duration=request.duration,
+        rate=request.rate,
+        payload_bytes=request.payload_bytes,
+        hwm=request.hwm,
+        multiplex_publishers=request.multiplex_publishers,
+        rates=request.rates,
+        payload_sizes=request.payload_sizes
+    )
+    async with simulation_lock:
+        try:
+            simulator = TopologySimulator(structure, config)
+            # 자체 이벤트 루프를 가진 스레드에서 실행 (서버 루프는 계속 응답)
+            result = await asyncio.to_thread(simulator.run)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    return {"success": True, **result}
+
+@app.post("/api/codegen/bundle")
+async def generate_code_bundle(request: CodegenBundleRequest):
+    """여러 언어/응용프로그램 코드를 ZIP으로 스트리밍 (<언어>/<응용프로그램> 파일, 완성되는 순서대로 전송)"""
+    # 문서는 이벤트 루프 스레드에서 스냅샷, 렌더링은 응답을 보내는 동안 서버의 프로세스 풀(작은 번들은 현재 스레드)에서
+    structure = request.structure if request.structure is not None else topic_manager.get_xml_structure()
+    try:
+        chunks = build_code_bundle(
+            structure,
+            request.languages,
+            app_names=request.app_names,
+            include_comments=request.include_comments,
+            include_examples=request.include_examples,
+            deterministic=request.deterministic,
+            serialization=request.serialization,
+            multiplex_publishers=request.multiplex_publishers,
+            endpoint_plan=request.endpoint_plan,
+            executor=getattr(app.state, "render_pool", None)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # 동기 이터레이터는 Starlette가 스레드 풀에서 소비하므로 이벤트 루프를 막지 않음
+    return StreamingResponse(
+        chunks,
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="codegen.zip"'}
+    )
+
+@app.post("/api/codegen/sync")
+async def sync_generated_code():
+    """CODEGEN_OUTPUT_DIR의 응용프로그램별 코드를 현재 문서와 즉시 동기화"""
+    if topic_manager.code_writer is None:
+        raise HTTPException(status_code=400, detail="CODEGEN_OUTPUT_DIR이 설정되지 않았습니다.")
+    
+    stats = await topic_manager.regenerate_code()
+    return {
+        "success": True,
+        "output_dir": str(topic_manager.code_writer.output_dir),
+        "languages": stats
+    }
+
+@app.get("/api/codegen/cache")
+async def get_codegen_cache():
+    """코드 생성 캐시 통계"""
+    return {
+        "success": True,
+        "cache": schema_manager.get_codegen_cache_info()
+    }
+
 @app.post("/api/xml/save")
 async def save_xml(data: dict):
     """XML 파일 저장"""
@@ -533,6 +1057,15 @@ async def load_file(request: dict):
     """XML 파일 로드"""
     try:
         filename = request.get("filename", "applications.xml")
+        
+        # 큰 파일은 JSON 이스케이프/복사 대신 스트리밍 다운로드로 유도
+        file_path = xml_file_manager.get_xml_path(filename)
+        if file_path and file_path.stat().st_size > JSON_LOAD_MAX_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"파일이 너무 큽니다. /api/files/{filename}/raw 를 사용하세요."
+            )
+        
         xml_content = await xml_file_manager.load_xml_async(filename)
         
         if xml_content:
@@ -551,6 +1084,77 @@ async def load_file(request: dict):
         print(f"❌ 파일 로드 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _file_etag(stat: os.stat_result, variant: str = "") -> str:
+    """파일 상태 기반 ETag 생성"""
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{variant}"'
+
+def _is_not_modified(request: Request, etag: str, stat: os.stat_result) -> bool:
+    """조건부 GET 판정 (If-None-Match 우선, 없으면 If-Modified-Since)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags or f"W/{etag}" in tags
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(stat.st_mtime) <= since
+    
+    return False
+
+@app.get("/api/files/{filename}/raw")
+async def download_file(filename: str, request: Request):
+    """XML 파일 원본 스트리밍 다운로드 (Range, gzip 사전 압축본, 조건부 GET 지원)"""
+    file_path = xml_file_manager.get_xml_path(filename)
+    if file_path is None:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    
+    stat = file_path.stat()
+    headers = {
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+    }
+    
+    # Range 요청은 항상 원본 바이트 기준으로 처리
+    use_gzip = (
+        "range" not in request.headers
+        and "gzip" in request.headers.get("accept-encoding", "").lower()
+    )
+    etag = _file_etag(stat, "-gz" if use_gzip else "")
+    headers["ETag"] = etag
+    
+    if _is_not_modified(request, etag, stat):
+        return Response(status_code=304, headers=headers)
+    
+    if use_gzip:
+        gzip_path = await asyncio.to_thread(xml_file_manager.get_gzip_variant, filename)
+        if gzip_path is not None:
+            headers["Content-Encoding"] = "gzip"
+            return FileResponse(gzip_path, media_type="application/xml", headers=headers)
+        headers["ETag"] = _file_etag(stat)
+    
+    # FileResponse가 sendfile/청크 스트리밍과 Range(206) 응답을 처리
+    return FileResponse(file_path, media_type="application/xml", filename=filename, headers=headers)
+
+@app.get("/api/files/{filename}/topic-index")
+async def download_topic_index(filename: str, request: Request):
+    """mmap 가능한 토픽 조회 인덱스 다운로드 (models/topic_index.py 의 TopicIndex로 읽음)"""
+    index_path = await asyncio.to_thread(xml_file_manager.get_topic_index, filename)
+    if index_path is None:
+        raise HTTPException(status_code=404, detail="토픽 인덱스를 만들 수 없습니다.")
+    
+    stat = index_path.stat()
+    headers = {"ETag": _file_etag(stat, "-idx"), "Cache-Control": "no-cache"}
+    if _is_not_modified(request, headers["ETag"], stat):
+        return Response(status_code=304, headers=headers)
+    
+    return FileResponse(index_path, media_type="application/octet-stream",
+                        filename=index_path.name, headers=headers)
+
 @app.post("/api/files/restore")
 async def restore_backup(request: dict):
     """백업에서 복원"""
@@ -561,14 +1165,34 @@ async def restore_backup(request: dict):
         if not backup_filename:
             raise HTTPException(status_code=400, detail="backup_filename이 필요합니다.")
         
+        # 라이브 문서에 반영할 백업은 파일을 바꾸기 전에 파싱해 둠 (실패 시 디스크와 문서 모두 그대로)
+        structure = None
+        if target_filename == "applications.xml" and request.get("apply_to_document", True):
+            backup_content = xml_file_manager.load_backup(backup_filename)
+            if backup_content is None:
+                raise HTTPException(status_code=404, detail=f"백업을 찾을 수 없습니다: {backup_filename}")
+            try:
+                structure = topic_manager.xml_processor.xml_to_dict(backup_content)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=f"백업을 문서에 반영할 수 없습니다: {e}")
+        
         success = xml_file_manager.restore_backup(backup_filename, target_filename)
         
         if success:
-            return {
+            result = {
                 "success": True,
                 "message": f"백업 '{backup_filename}'에서 '{target_filename}'으로 복원되었습니다.",
                 "timestamp": datetime.now().isoformat()
             }
+            
+            # 라이브 문서에도 최소 차이로 반영하고 단일 업데이트로 브로드캐스트
+            if structure is not None:
+                restored = topic_manager.restore_structure(structure)
+                if any(restored["stats"].values()):
+                    await topic_manager.broadcast_update(restored["update"])
+                result["document_changes"] = restored["stats"]
+            
+            return result
         else:
             raise HTTPException(status_code=500, detail="백업 복원에 실패했습니다.")
             
@@ -578,6 +1202,84 @@ async def restore_backup(request: dict):
         print(f"❌ 백업 복원 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _load_catalog_index(version: str) -> Dict[str, Any]:
+    """버전 식별자로 카탈로그 인덱스 로드 ("current"는 라이브 문서)"""
+    if version == "current":
+        return build_catalog_index(topic_manager.get_xml_structure())
+    
+    path = xml_file_manager.resolve_version_path(version)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"버전을 찾을 수 없습니다: {version}")
+    
+    return await asyncio.to_thread(catalog_differ.load_index, path)
+
+@app.get("/api/diff")
+async def diff_versions(
+    from_version: str = Query(..., alias="from"),
+    to_version: str = Query("current", alias="to")
+):
+    """두 카탈로그 버전 간 응용프로그램/토픽 구조 비교"""
+    try:
+        old_index = await _load_catalog_index(from_version)
+        new_index = await _load_catalog_index(to_version)
+        
+        return {
+            "success": True,
+            "from": from_version,
+            "to": to_version,
+            "diff": catalog_differ.diff(old_index, new_index),
+            "cache": catalog_differ.get_cache_info()
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ 버전 비교 오류: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/export/{fmt}")
+async def export_catalog(fmt: str, request: Request, version: str = Query("current")):
+    """카탈로그를 압축 포맷(json/msgpack/cbor)으로 내보내기 (버전별 인코딩 캐시, ETag 지원)"""
+    if fmt not in schema_manager.available_export_formats():
+        raise HTTPException(
+            status_code=404,
+            detail=f"지원하지 않는 내보내기 포맷: {fmt} (사용 가능: {', '.join(schema_manager.available_export_formats())})"
+        )
+    
+    try:
+        if version == "current":
+            cache_key = ("current", topic_manager.get_document_version())
+            etag = f'"doc-{cache_key[1]}-{fmt}"'
+        else:
+            path = xml_file_manager.resolve_version_path(version)
+            if path is None:
+                raise HTTPException(status_code=404, detail=f"버전을 찾을 수 없습니다: {version}")
+            stat = path.stat()
+            cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+            etag = _file_etag(stat, f"-{fmt}")
+        
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        
+        data = schema_manager.get_cached_export(fmt, cache_key)
+        if data is None:
+            if version == "current":
+                # Yjs 문서는 이벤트 루프 스레드에서만 읽고, 인코딩만 스레드로 넘김
+                source = topic_manager.get_xml_structure()
+            else:
+                source = lambda: schema_manager.import_xml(path.read_bytes())
+            data = await asyncio.to_thread(schema_manager.export_compact, source, fmt, cache_key)
+        
+        return Response(content=data, media_type=schema_manager.exporter.MEDIA_TYPES[fmt], headers=headers)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ 카탈로그 내보내기 오류: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.delete("/api/files/{filename}")
 async def delete_file(filename: str):
     """XML 파일 삭제"""
@@ -604,6 +1306,8 @@ async def delete_file(filename: str):
 async def yjs_websocket_endpoint(websocket: WebSocket):
     """Yjs 실시간 협업을 위한 WebSocket 엔드포인트"""
     await websocket.accept()
+    client_id = f"client_{id(websocket)}"
+    topic_manager.connected_clients[client_id] = websocket
     print("🔌 새로운 Yjs WebSocket 연결")
     
     try:
@@ -631,7 +1335,8 @@ async def yjs_websocket_endpoint(websocket: WebSocket):
                         # 클라이언트 업데이트 적용
                         if len(message) > 1:
                             update = message[1:]
-                            topic_manager.doc.apply_update(update)
+                            with topic_manager.transaction(ORIGIN_REMOTE):
+                                topic_manager.doc.apply_update(update)
                             print("✅ 문서 업데이트 적용됨")
                         
                     elif msg_type == 2:  # Update
@@ -639,7 +1344,8 @@ async def yjs_websocket_endpoint(websocket: WebSocket):
                         # 클라이언트 업데이트 적용
                         if len(message) > 1:
                             update = message[1:]
-                            topic_manager.doc.apply_update(update)
+                            with topic_manager.transaction(ORIGIN_REMOTE):
+                                topic_manager.doc.apply_update(update)
                             print("✅ 문서 업데이트 적용됨")
                             # 다른 클라이언트에게 브로드캐스트
                             broadcast_msg = struct.pack('B', 2) + update
@@ -665,7 +1371,7 @@ async def yjs_websocket_endpoint(websocket: WebSocket):
         traceback.print_exc()
     finally:
         # 정리 작업
-        pass
+        topic_manager.connected_clients.pop(client_id, None)
 
 # 사용자 상태 관리를 위한 Socket.IO 대체 WebSocket
 class UserManager:
@@ -714,6 +1420,12 @@ async def user_websocket(websocket: WebSocket, user_id: str):
     """사용자 상태 관리용 WebSocket"""
     await user_manager.connect(user_id, websocket)
     
+    # 현재 검증 결과 전달
+    await websocket.send_text(json.dumps({
+        "type": "validation_changed",
+        **topic_manager.get_validation_state()
+    }))
+    
     try:
         while True:
             data = await websocket.receive_text()
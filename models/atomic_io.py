@@ -0,0 +1,70 @@
+"""
+Atomic file writes
+임시 파일 + os.replace 기반 원자적 쓰기 (가져와도 디렉토리 생성 등 부수 효과 없음)
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+# 저장 내구성 수준
+DURABILITY_NONE = "none"              # OS 페이지 캐시에 맡김
+DURABILITY_FSYNC_FILE = "fsync_file"  # 임시 파일 fsync 후 교체
+DURABILITY_FSYNC_DIR = "fsync_dir"    # 교체 후 디렉토리 엔트리까지 fsync
+DURABILITY_LEVELS = (DURABILITY_NONE, DURABILITY_FSYNC_FILE, DURABILITY_FSYNC_DIR)
+
+# 프로세스 umask (읽으려면 바꿔야 하므로 스레드가 생기기 전인 임포트 시점에 한 번만)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write_bytes(path: Path, data: bytes, durability: str = DURABILITY_FSYNC_FILE):
+    """임시 파일에 쓴 뒤 os.replace로 원자적 교체"""
+    if durability not in DURABILITY_LEVELS:
+        raise ValueError(f"지원하지 않는 내구성 수준: {durability}")
+    
+    path = Path(path)
+    # 같은 디렉토리에 임시 파일을 만들어야 os.replace가 원자적으로 동작
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        # mkstemp는 0600으로 만들므로 기존 파일 권한 (새 파일은 umask 기본값)을 옮겨 둠
+        os.chmod(tmp_name, _target_mode(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            if durability != DURABILITY_NONE:
+                os.fsync(f.fileno())
+        
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    
+    if durability == DURABILITY_FSYNC_DIR:
+        _fsync_directory(path.parent)
+
+
+def _target_mode(path: Path) -> int:
+    """교체될 파일의 권한 (없으면 open()으로 새로 만들 때와 같은 0666 & ~umask)"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def _fsync_directory(directory: Path):
+    """디렉토리 엔트리 fsync (지원하지 않는 플랫폼은 무시)"""
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
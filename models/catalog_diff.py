@@ -0,0 +1,153 @@
+"""
+Catalog Diff for XML versions
+이름 기반 해시 조인으로 두 카탈로그 버전 간 구조적 차이 계산
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from models.structure_utils import as_list
+from models.xml_schema import XMLProcessor
+
+
+APP_ATTRIBUTES = ("description",)
+TOPIC_ATTRIBUTES = ("proto", "direction", "description")
+
+
+def build_catalog_index(structure: dict) -> Dict[str, Any]:
+    """구조 dict를 이름 → 속성 해시 인덱스로 변환 (한 번 순회)"""
+    root = structure.get("Applications") or {}
+    apps: Dict[str, Dict[str, Any]] = {}
+    
+    for app in as_list(root.get("Application")):
+        name = app.get("@name", "")
+        if name in apps:
+            continue  # 중복 이름은 첫 번째 선언 기준
+        
+        topics: Dict[str, Dict[str, str]] = {}
+        for topic in as_list(app.get("Topic")):
+            topic_name = topic.get("@name", "")
+            if topic_name not in topics:
+                topics[topic_name] = {key: topic.get(f"@{key}", "") or "" for key in TOPIC_ATTRIBUTES}
+        
+        apps[name] = {
+            "attrs": {key: app.get(f"@{key}", "") or "" for key in APP_ATTRIBUTES},
+            "topics": topics
+        }
+    
+    return {
+        "attrs": {"xmlns": root.get("@xmlns", ""), "version": root.get("@version", "")},
+        "apps": apps
+    }
+
+
+def _diff_attributes(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, Dict[str, str]]:
+    """바뀐 속성만 {key: {from, to}} 형태로 반환"""
+    return {
+        key: {"from": old.get(key, ""), "to": new.get(key, "")}
+        for key in sorted(old.keys() | new.keys())
+        if old.get(key, "") != new.get(key, "")
+    }
+
+
+def diff_catalogs(old_index: Dict[str, Any], new_index: Dict[str, Any]) -> Dict[str, Any]:
+    """두 카탈로그 인덱스의 추가/삭제/변경 항목 계산"""
+    old_apps = old_index["apps"]
+    new_apps = new_index["apps"]
+    
+    added = [name for name in new_apps if name not in old_apps]
+    removed = [name for name in old_apps if name not in new_apps]
+    changed: List[Dict[str, Any]] = []
+    summary = {
+        "applications_added": len(added), "applications_removed": len(removed),
+        "applications_changed": 0, "topics_added": 0, "topics_removed": 0, "topics_changed": 0
+    }
+    
+    for name in added:
+        summary["topics_added"] += len(new_apps[name]["topics"])
+    for name in removed:
+        summary["topics_removed"] += len(old_apps[name]["topics"])
+    
+    for name, new_app in new_apps.items():
+        old_app = old_apps.get(name)
+        if old_app is None or old_app == new_app:
+            continue
+        
+        old_topics = old_app["topics"]
+        new_topics = new_app["topics"]
+        topics_added = [t for t in new_topics if t not in old_topics]
+        topics_removed = [t for t in old_topics if t not in new_topics]
+        topics_changed = [
+            {"name": t, "attributes": _diff_attributes(old_topics[t], attrs)}
+            for t, attrs in new_topics.items()
+            if t in old_topics and old_topics[t] != attrs
+        ]
+        
+        changed.append({
+            "name": name,
+            "attributes": _diff_attributes(old_app["attrs"], new_app["attrs"]),
+            "topics": {"added": topics_added, "removed": topics_removed, "changed": topics_changed}
+        })
+        summary["applications_changed"] += 1
+        summary["topics_added"] += len(topics_added)
+        summary["topics_removed"] += len(topics_removed)
+        summary["topics_changed"] += len(topics_changed)
+    
+    return {
+        "root": _diff_attributes(old_index["attrs"], new_index["attrs"]),
+        "applications": {
+            "added": [{"name": n, "topics": list(new_apps[n]["topics"])} for n in added],
+            "removed": [{"name": n, "topics": list(old_apps[n]["topics"])} for n in removed],
+            "changed": changed
+        },
+        "summary": summary
+    }
+
+
+class CatalogDiffer:
+    """버전별 파싱 결과를 캐시하는 카탈로그 비교기"""
+    
+    def __init__(self, max_cached_versions: int = 32):
+        self.processor = XMLProcessor()
+        self.max_cached_versions = max_cached_versions
+        self._cache: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def load_index(self, path: Path) -> Dict[str, Any]:
+        """파일 인덱스 반환 (경로, mtime, 크기가 같으면 캐시 사용)"""
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        
+        with self._lock:
+            index = self._cache.get(key)
+            if index is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return index
+        
+        structure = self.processor.xml_to_dict(path.read_text(encoding='utf-8'))
+        index = build_catalog_index(structure)
+        
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = index
+            while len(self._cache) > self.max_cached_versions:
+                self._cache.popitem(last=False)
+        
+        return index
+    
+    def diff(self, old_index: Dict[str, Any], new_index: Dict[str, Any]) -> Dict[str, Any]:
+        """두 인덱스 비교"""
+        return diff_catalogs(old_index, new_index)
+    
+    def get_cache_info(self) -> Dict[str, int]:
+        """캐시 상태 조회"""
+        return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+# 전역 비교기 인스턴스
+catalog_differ = CatalogDiffer()
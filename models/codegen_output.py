@@ -0,0 +1,369 @@
+"""
+Per-application Code Output
+응용프로그램별 생성 코드를 <language>/<application> 파일 단위로 내보냄
+
+IncrementalCodeWriter
+    <output_dir>/<language>/ 에 파일 하나씩 기록 (언어별 빌드 파일 포함, 예: cpp/CMakeLists.txt)
+    내용 해시 매니페스트로 바뀐 응용프로그램만 다시 쓰고 나머지 파일은 건드리지 않음
+    (mtime이 유지되므로 증분 빌드가 불필요하게 다시 컴파일하지 않음)
+build_code_bundle
+    여러 언어/응용프로그램을 (서버 수명 동안 유지하는) 프로세스 풀로 나눠 렌더링하고
+    완성되는 파일부터 ZIP 스트림으로 흘려보냄 (전체 아카이브를 메모리에 만들지 않음)
+"""
+
+import json
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from models.atomic_io import DURABILITY_NONE, atomic_write_bytes
+from models.endpoint_planner import DEFAULT_BASE_PORT, dump_plan, load_plan, plan_endpoints
+from models.structure_utils import as_list
+from models.template_engine import (SERIALIZATIONS, TEMPLATE_DIR, TEMPLATE_LANGUAGES, TEMPLATE_PROJECT_FILES,
+                                    TemplateEngine, application_digest, get_worker_engine, option_flags,
+                                    to_identifier)
+
+
+MANIFEST_NAME = ".codegen-manifest.json"
+MANIFEST_FORMAT = 1
+# 모든 언어가 공유하는 엔드포인트 계획 파일
+ENDPOINTS_NAME = "endpoints.json"
+
+# 번들 생성 프로세스 수 (1이면 프로세스 풀 없이 현재 스레드에서 렌더링)
+CODEGEN_WORKERS = int(os.environ.get("CODEGEN_WORKERS", os.cpu_count() or 1))
+# 생성 파일이 이보다 적으면 프로세스 풀로 보내는 비용이 렌더링보다 커서 현재 스레드에서 렌더링
+BUNDLE_PARALLEL_MIN_FILES = int(os.environ.get("BUNDLE_PARALLEL_MIN_FILES", 256))
+# 워커 작업 하나가 렌더링하는 응용프로그램 수
+BUNDLE_CHUNK_SIZE = 64
+# ZIP 항목 시각 (결정적 모드, ZIP 형식의 최소값)
+DETERMINISTIC_ZIP_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def assign_file_names(names: List[str], extension: str, reserved: Tuple[str, ...] = ()) -> Dict[str, str]:
+    """응용프로그램 이름 → 파일명 (식별자가 겹치면 순서대로 번호를 붙임, reserved: 빌드 파일 등 피할 파일명)"""
+    files: Dict[str, str] = {}
+    used = {name[:-len(extension)] for name in reserved if name.endswith(extension)}
+    for name in names:
+        stem = to_identifier(name) or "application"
+        candidate, suffix = stem, 2
+        while candidate in used:
+            candidate, suffix = f"{stem}_{suffix}", suffix + 1
+        used.add(candidate)
+        files[name] = candidate + extension
+    return files
+
+
+def unique_applications(structure: dict) -> Dict[str, dict]:
+    """이름 → 응용프로그램 (같은 이름이 여러 번 나오면 첫 선언만, 일관성 검사가 중복을 따로 보고)"""
+    by_name: Dict[str, dict] = {}
+    for app in as_list(((structure or {}).get("Applications") or {}).get("Application")):
+        by_name.setdefault(app.get("@name", "Unknown"), app)
+    return by_name
+
+
+class IncrementalCodeWriter:
+    """언어별 출력 디렉토리를 카탈로그와 동기화 (변경/추가/삭제된 응용프로그램만 반영)"""
+    
+    def __init__(self, output_dir: Union[str, Path], languages: Optional[List[str]] = None,
+                 engine: Optional[TemplateEngine] = None,
+                 include_comments: bool = True, include_examples: bool = False,
+                 serialization: str = "json", multiplex_publishers: bool = False,
+                 base_port: int = DEFAULT_BASE_PORT):
+        self.output_dir = Path(output_dir)
+        self.languages = list(languages or ["python", "cpp"])
+        for language in self.languages:
+            if language not in TEMPLATE_LANGUAGES:
+                raise ValueError(f"지원하지 않는 언어: {language}")
+        if serialization not in SERIALIZATIONS:
+            raise ValueError(f"지원하지 않는 직렬화 방식: {serialization}")
+        self.engine = engine or TemplateEngine()
+        self.include_comments = include_comments
+        self.include_examples = include_examples
+        self.serialization = serialization
+        self.multiplex_publishers = multiplex_publishers
+        self.base_port = base_port
+        # 동시에 들어온 동기화 요청은 순서대로 처리 (나중 요청이 최신 구조를 반영)
+        self._lock = threading.Lock()
+    
+    def _options(self) -> Dict[str, Any]:
+        # 파일별 출력은 항상 결정적 (시각이 들어가면 매번 모든 파일이 바뀜)
+        return {
+            "include_comments": self.include_comments,
+            "include_examples": self.include_examples,
+            "serialization": self.serialization,
+            "multiplex_publishers": self.multiplex_publishers,
+            "generated_at": None
+        }
+    
+    def _load_manifest(self, language_dir: Path) -> Dict[str, Any]:
+        try:
+            with open(language_dir / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get("format") == MANIFEST_FORMAT:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"format": MANIFEST_FORMAT, "fingerprint": None, "applications": {}}
+    
+    def sync(self, structure: dict) -> Dict[str, Dict[str, List[str]]]:
+        """카탈로그 구조와 출력 디렉토리 동기화, 언어별 written/unchanged/removed 파일 목록 반환
+
+        엔드포인트 계획은 <output_dir>/endpoints.json 에 저장하고 다음 동기화에서 포트 배정을 이어받는다.
+        포트가 바뀐 응용프로그램은 내용이 같아도 다시 생성된다.
+        """
+        by_name = unique_applications(structure)
+        
+        with self._lock:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            plan_path = self.output_dir / ENDPOINTS_NAME
+            plan = plan_endpoints(structure, self.multiplex_publishers, self.base_port, load_plan(plan_path))
+            endpoints = plan["applications"]
+            digests = {name: application_digest(app, endpoints.get(name)) for name, app in by_name.items()}
+            
+            stats = {language: self._sync_language(language, by_name, digests, endpoints)
+                     for language in self.languages}
+            
+            data = dump_plan(plan)
+            try:
+                unchanged = plan_path.read_bytes() == data
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                atomic_write_bytes(plan_path, data, DURABILITY_NONE)
+            return stats
+    
+    def _sync_language(self, language: str, by_name: Dict[str, dict], digests: Dict[str, str],
+                       endpoints: Dict[str, dict]) -> Dict[str, List[str]]:
+        language_dir = self.output_dir / language
+        language_dir.mkdir(parents=True, exist_ok=True)
+        
+        options = self._options()
+        fingerprint = "|".join([self.engine.template_fingerprint(language)] +
+                               [f"{key}={value}" for key, value in option_flags(options)])
+        
+        manifest = self._load_manifest(language_dir)
+        previous = manifest["applications"] if manifest.get("fingerprint") == fingerprint else {}
+        files = assign_file_names(list(by_name), TEMPLATE_LANGUAGES[language],
+                                  TEMPLATE_PROJECT_FILES.get(language, ()))
+        stats: Dict[str, List[str]] = {"written": [], "unchanged": [], "removed": []}
+        entries: Dict[str, Dict[str, str]] = {}
+        
+        for name, app in by_name.items():
+            file_name = files[name]
+            target = language_dir / file_name
+            entries[name] = {"file": file_name, "digest": digests[name]}
+            
+            known = previous.get(name)
+            if known == entries[name] and target.exists():
+                stats["unchanged"].append(file_name)
+                continue
+            
+            data = self.engine.render(language, [app], options,
+                                      endpoints={name: endpoints.get(name)}).encode('utf-8')
+            # 해시가 바뀌어도 이 언어의 출력이 같으면 (예: 설명만 변경) 파일을 건드리지 않음
+            try:
+                if target.read_bytes() == data:
+                    stats["unchanged"].append(file_name)
+                    continue
+            except OSError:
+                pass
+            
+            atomic_write_bytes(target, data, DURABILITY_NONE)
+            stats["written"].append(file_name)
+        
+        # 빌드 파일은 응용프로그램과 무관하게 내용이 바뀔 때만 다시 씀
+        for file_name, content in self.engine.render_project_files(language, options).items():
+            target = language_dir / file_name
+            data = content.encode('utf-8')
+            try:
+                if target.read_bytes() == data:
+                    stats["unchanged"].append(file_name)
+                    continue
+            except OSError:
+                pass
+            atomic_write_bytes(target, data, DURABILITY_NONE)
+            stats["written"].append(file_name)
+        
+        # 카탈로그에서 사라졌거나 파일명이 바뀐 출력 제거
+        current_files = {entry["file"] for entry in entries.values()}
+        for entry in manifest["applications"].values():
+            file_name = entry.get("file")
+            if file_name and file_name not in current_files and Path(file_name).name == file_name:
+                try:
+                    (language_dir / file_name).unlink()
+                    stats["removed"].append(file_name)
+                except FileNotFoundError:
+                    pass
+        
+        if entries != manifest["applications"] or manifest.get("fingerprint") != fingerprint:
+            new_manifest = {"format": MANIFEST_FORMAT, "fingerprint": fingerprint, "applications": entries}
+            atomic_write_bytes(language_dir / MANIFEST_NAME,
+                               json.dumps(new_manifest, ensure_ascii=False, indent=2, sort_keys=True).encode('utf-8'),
+                               DURABILITY_NONE)
+        
+        return stats
+
+
+class _ZipChunkBuffer:
+    """zipfile이 쓰는 바이트를 모아 두었다가 한꺼번에 꺼내는 쓰기 전용 스트림
+
+    tell/seek이 없으므로 zipfile은 데이터 디스크립터 방식으로 기록한다 (되돌아가서 헤더를 고치지 않음)
+    """
+    
+    def __init__(self):
+        self._chunks: List[bytes] = []
+    
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def flush(self):
+        pass
+    
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _render_file_chunk(template_dir: str, language: str, files: List[Tuple[str, dict, dict]],
+                       options: Dict[str, Any]) -> List[Tuple[str, bytes]]:
+    """응용프로그램별 파일 렌더링 (프로세스 풀 작업, 각 파일은 (경로, 응용프로그램, 엔드포인트 항목))"""
+    engine = get_worker_engine(template_dir)
+    return [(path, engine.render(language, [app], options,
+                                 endpoints={app.get("@name", "Unknown"): entry}).encode('utf-8'))
+            for path, app, entry in files]
+
+
+def create_render_pool(workers: int = CODEGEN_WORKERS) -> Optional[ProcessPoolExecutor]:
+    """번들 렌더링용 프로세스 풀 (workers가 1 이하면 None, 호출자가 수명 동안 보유하고 shutdown)"""
+    if workers <= 1:
+        return None
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def build_code_bundle(structure: dict,
+                      languages: List[str],
+                      app_names: Optional[List[str]] = None,
+                      include_comments: bool = True,
+                      include_examples: bool = True,
+                      deterministic: bool = False,
+                      serialization: str = "json",
+                      multiplex_publishers: bool = False,
+                      endpoint_plan: Optional[dict] = None,
+                      executor: Optional[Executor] = None,
+                      workers: int = CODEGEN_WORKERS,
+                      template_dir: Path = TEMPLATE_DIR) -> Iterator[bytes]:
+    """<language>/<application>.<ext> 파일, 언어별 빌드 파일, endpoints.json을 담은 ZIP 스트림 (바이트 조각 이터레이터)
+
+    포트는 선택한 응용프로그램과 관계없이 카탈로그 전체로 계획한다 (endpoint_plan: 포트를 유지할 이전 계획).
+    executor(create_render_pool, 요청마다 만들지 않고 재사용)가 있고 생성 파일이 BUNDLE_PARALLEL_MIN_FILES 이상이면
+    작업을 나눠 보내고 동시에 workers × 2개까지만 맡긴다. 아니면 현재 스레드에서 렌더링한다.
+
+    언어/응용프로그램 검증은 호출 즉시 수행해 ValueError를 올리고,
+    렌더링은 이터레이터를 소비할 때 시작된다. 항목 순서는 렌더링이 끝난 순서.
+    """
+    languages = list(dict.fromkeys(languages))
+    if not languages:
+        raise ValueError("생성할 언어가 없습니다.")
+    for language in languages:
+        if language not in TEMPLATE_LANGUAGES:
+            raise ValueError(f"지원하지 않는 언어: {language}")
+    if serialization not in SERIALIZATIONS:
+        raise ValueError(f"지원하지 않는 직렬화 방식: {serialization}")
+    
+    plan = plan_endpoints(structure, multiplex_publishers,
+                          (endpoint_plan or {}).get("base_port", DEFAULT_BASE_PORT), endpoint_plan)
+    endpoints = plan["applications"]
+    
+    by_name = unique_applications(structure)
+    if app_names is not None:
+        missing = [name for name in app_names if name not in by_name]
+        if missing:
+            raise ValueError(f"응용프로그램을 찾을 수 없습니다: {', '.join(missing)}")
+        by_name = {name: by_name[name] for name in dict.fromkeys(app_names)}
+    
+    options = {
+        "include_comments": include_comments,
+        "include_examples": include_examples,
+        "serialization": serialization,
+        "multiplex_publishers": multiplex_publishers,
+        "generated_at": None if deterministic else datetime.now().isoformat()
+    }
+    
+    # (언어, [(아카이브 경로, 응용프로그램)]) 작업 단위
+    tasks: List[Tuple[str, List[Tuple[str, dict, dict]]]] = []
+    for language in languages:
+        files = assign_file_names(list(by_name), TEMPLATE_LANGUAGES[language],
+                                  TEMPLATE_PROJECT_FILES.get(language, ()))
+        entries = [(f"{language}/{files[name]}", app, endpoints.get(name)) for name, app in by_name.items()]
+        for start in range(0, len(entries), BUNDLE_CHUNK_SIZE):
+            tasks.append((language, entries[start:start + BUNDLE_CHUNK_SIZE]))
+    
+    # 빌드 파일과 엔드포인트 계획은 마지막에 추가
+    engine = get_worker_engine(str(template_dir))
+    extra_files = [(f"{language}/{name}", content.encode('utf-8'))
+                   for language in languages
+                   for name, content in engine.render_project_files(language, options).items()]
+    extra_files.append((ENDPOINTS_NAME, dump_plan(plan)))
+    
+    file_count = sum(len(files) for _, files in tasks)
+    if executor is None or workers <= 1 or len(tasks) == 1 or file_count < BUNDLE_PARALLEL_MIN_FILES:
+        executor = None
+    
+    return _stream_bundle(tasks, options, deterministic, executor, max(1, workers), str(template_dir), extra_files)
+
+
+def _stream_bundle(tasks: List[Tuple[str, List[Tuple[str, dict, dict]]]], options: Dict[str, Any],
+                   deterministic: bool, executor: Optional[Executor], workers: int, template_dir: str,
+                   extra_files: List[Tuple[str, bytes]]) -> Iterator[bytes]:
+    buffer = _ZipChunkBuffer()
+    archive = zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED)
+    date_time = DETERMINISTIC_ZIP_TIME if deterministic else time.localtime(time.time())[:6]
+    
+    def add_files(rendered: List[Tuple[str, bytes]]) -> bytes:
+        for path, data in rendered:
+            info = zipfile.ZipInfo(path, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            archive.writestr(info, data)
+        return buffer.drain()
+    
+    if executor is None:
+        for language, files in tasks:
+            chunk = add_files(_render_file_chunk(template_dir, language, files, options))
+            if chunk:
+                yield chunk
+    else:
+        # 진행 중인 작업 수를 제한해 렌더링 결과가 전송보다 앞서 메모리에 쌓이지 않게 함
+        pending = set()
+        try:
+            queue = iter(tasks)
+            for language, files in queue:
+                pending.add(executor.submit(_render_file_chunk, template_dir, language, files, options))
+                if len(pending) >= workers * 2:
+                    break
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = add_files(future.result())
+                    next_task = next(queue, None)
+                    if next_task is not None:
+                        pending.add(executor.submit(_render_file_chunk, template_dir, next_task[0], next_task[1],
+                                                    options))
+                    if chunk:
+                        yield chunk
+        finally:
+            # 클라이언트가 중간에 끊으면 이 요청의 남은 작업만 버림 (풀은 다른 요청과 공유)
+            for future in pending:
+                future.cancel()
+    
+    # 빌드 파일과 생성 코드가 가정하는 포트 배정 (다른 도구/배포 설정용)
+    chunk = add_files(extra_files)
+    archive.close()
+    yield chunk + buffer.drain()
@@ -0,0 +1,157 @@
+"""
+Endpoint Planner for generated code
+카탈로그 전체를 보고 발행 소켓마다 포트를 배정하고 구독자가 연결할 엔드포인트를 계산
+
+- 발행: (응용프로그램, 토픽)마다 PUB 포트 하나, multiplex_publishers이면 응용프로그램마다 PUB 포트 하나
+- 구독: 같은 이름의 토픽을 발행하는 모든 포트에 연결 (토픽 프레임 구독으로 다른 토픽은 libzmq가 걸러냄)
+- 이전 계획을 넘기면 남아 있는 발행자의 포트는 그대로 유지하고 새 발행자만 빈 포트를 받음
+
+계획은 JSON으로 저장하는 dict (endpoints.json):
+    {"format": 1, "base_port": 5555, "multiplex_publishers": false,
+     "applications": {"App": {"publish": {"topic": 5555}, "subscribe": {"other": [5556, 5557]}}}}
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.structure_utils import as_list
+
+
+PLAN_FORMAT = 1
+DEFAULT_BASE_PORT = 5555
+MAX_PORT = 65535
+
+
+def _previous_ports(previous: Optional[dict], multiplex_publishers: bool,
+                    base_port: int) -> Dict[Tuple[str, Optional[str]], int]:
+    """이전 계획의 발행 포트 ((응용프로그램, 토픽 또는 None) → 포트, 설정이 다르면 재사용하지 않음)"""
+    if (not previous or previous.get("format") != PLAN_FORMAT
+            or previous.get("multiplex_publishers", False) != multiplex_publishers
+            or previous.get("base_port", DEFAULT_BASE_PORT) != base_port):
+        return {}
+    
+    ports: Dict[Tuple[str, Optional[str]], int] = {}
+    for app_name, entry in (previous.get("applications") or {}).items():
+        publish = entry.get("publish") or {}
+        if multiplex_publishers:
+            if publish:
+                ports[(app_name, None)] = next(iter(publish.values()))
+        else:
+            for topic_name, port in publish.items():
+                ports[(app_name, topic_name)] = port
+    return ports
+
+
+def plan_endpoints(structure: dict,
+                   multiplex_publishers: bool = False,
+                   base_port: int = DEFAULT_BASE_PORT,
+                   previous: Optional[dict] = None) -> Dict[str, Any]:
+    """카탈로그 구조의 엔드포인트 계획 (같은 입력과 이전 계획이면 항상 같은 결과)"""
+    # 같은 이름의 응용프로그램/토픽은 첫 선언 기준 (일관성 검사가 중복을 따로 보고)
+    applications: Dict[str, Dict[str, List[str]]] = {}
+    for app in as_list(((structure or {}).get("Applications") or {}).get("Application")):
+        app_name = app.get("@name", "Unknown")
+        if app_name in applications:
+            continue
+        directions: Dict[str, str] = {}
+        for topic in as_list(app.get("Topic")):
+            directions.setdefault(topic.get("@name", ""), topic.get("@direction", "subscribe"))
+        applications[app_name] = {
+            "publish": [name for name, direction in directions.items() if direction == "publish"],
+            "subscribe": [name for name, direction in directions.items() if direction != "publish"]
+        }
+    
+    # 발행 소켓 목록 (선언 순서)
+    sockets: List[Tuple[str, Optional[str]]] = []
+    for app_name, topics in applications.items():
+        if multiplex_publishers:
+            if topics["publish"]:
+                sockets.append((app_name, None))
+        else:
+            sockets.extend((app_name, topic_name) for topic_name in topics["publish"])
+    
+    # 남아 있는 발행자는 이전 포트 유지, 새 발행자는 base_port부터 빈 포트
+    previous_ports = _previous_ports(previous, multiplex_publishers, base_port)
+    ports: Dict[Tuple[str, Optional[str]], int] = {}
+    used = set()
+    for key in sockets:
+        port = previous_ports.get(key)
+        if port is not None and port not in used:
+            ports[key] = port
+            used.add(port)
+    
+    next_port = base_port
+    for key in sockets:
+        if key in ports:
+            continue
+        while next_port in used:
+            next_port += 1
+        if next_port > MAX_PORT:
+            raise ValueError(f"포트 부족: {base_port}부터 {len(sockets)}개 발행 소켓을 배정할 수 없습니다.")
+        ports[key] = next_port
+        used.add(next_port)
+    
+    # 토픽 → 발행 포트 (선언 순서, 중복 제거)
+    publishers: Dict[str, Dict[int, None]] = {}
+    for app_name, topics in applications.items():
+        for topic_name in topics["publish"]:
+            port = ports[(app_name, None if multiplex_publishers else topic_name)]
+            publishers.setdefault(topic_name, {})[port] = None
+    
+    planned: Dict[str, Dict[str, Any]] = {}
+    for app_name, topics in applications.items():
+        planned[app_name] = {
+            "publish": {
+                topic_name: ports[(app_name, None if multiplex_publishers else topic_name)]
+                for topic_name in topics["publish"]
+            },
+            "subscribe": {
+                topic_name: list(publishers.get(topic_name, ()))
+                for topic_name in topics["subscribe"]
+            }
+        }
+    
+    return {
+        "format": PLAN_FORMAT,
+        "base_port": base_port,
+        "multiplex_publishers": multiplex_publishers,
+        "applications": planned
+    }
+
+
+def plan_statistics(plan: Dict[str, Any]) -> Dict[str, int]:
+    """계획 요약 (소켓/연결 수)"""
+    applications = plan.get("applications") or {}
+    publish_sockets = set()
+    subscribe_sockets = 0
+    connections = 0
+    unpublished = 0
+    for entry in applications.values():
+        for port in entry["publish"].values():
+            publish_sockets.add(port)
+        for ports in entry["subscribe"].values():
+            subscribe_sockets += 1
+            connections += len(ports)
+            unpublished += 0 if ports else 1
+    return {
+        "applications": len(applications),
+        "publish_sockets": len(publish_sockets),
+        "subscribe_sockets": subscribe_sockets,
+        "connections": connections,
+        "unpublished_subscriptions": unpublished
+    }
+
+
+def load_plan(path) -> Optional[Dict[str, Any]]:
+    """저장된 계획 읽기 (없거나 형식이 다르면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            plan = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return plan if isinstance(plan, dict) and plan.get("format") == PLAN_FORMAT else None
+
+
+def dump_plan(plan: Dict[str, Any]) -> bytes:
+    """계획 직렬화 (키 정렬 없이 선언 순서 유지, 같은 계획이면 같은 바이트)"""
+    return (json.dumps(plan, ensure_ascii=False, indent=2) + "\n").encode('utf-8')
@@ -4,20 +4,28 @@ XML 파일의 영구 저장, 백업, 버전 관리
 """
 
 import os
+import gzip
 import json
 import shutil
+import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 import asyncio
 import aiofiles
-from xml.dom import minidom
+
+from models.atomic_io import (
+    DURABILITY_FSYNC_FILE, DURABILITY_LEVELS, DURABILITY_NONE, atomic_write_bytes
+)
+from models.topic_index import build_topic_index
+from models.xml_schema import XMLProcessor
 
 
 class XMLFileManager:
     """XML 파일 저장 및 관리 클래스"""
     
-    def __init__(self, base_dir: str = "data"):
+    def __init__(self, base_dir: str = "data", durability: Optional[str] = None):
         self.base_dir = Path(base_dir)
         self.xml_dir = self.base_dir / "xml"
         self.backup_dir = self.base_dir / "backups"
@@ -28,6 +36,25 @@ class XMLFileManager:
         
         # 메타데이터 로드
         self.metadata = self._load_metadata()
+        
+        # 저장 내구성 수준 (인자 > 메타데이터 > 기본값)
+        self.durability = durability or self.metadata.get("durability", DURABILITY_FSYNC_FILE)
+        if self.durability not in DURABILITY_LEVELS:
+            raise ValueError(f"지원하지 않는 내구성 수준: {self.durability}")
+        
+        # 파일별 쓰기 직렬화 및 저장 요청 병합 상태
+        self._file_locks: Dict[str, threading.Lock] = {}
+        self._file_locks_guard = threading.Lock()
+        self._async_locks: Dict[str, asyncio.Lock] = {}
+        self._pending_saves: Dict[str, str] = {}
+        self._requested_seq: Dict[str, int] = {}
+        self._written_seq: Dict[str, int] = {}
+        self._last_save_result: Dict[str, bool] = {}
+        
+        # 저장 직후 호출할 후처리 훅 (filename, file_path, data)
+        self._post_save_hooks: List[Callable[[str, Path, bytes], None]] = []
+        self._processor = XMLProcessor()
+        self.add_post_save_hook(self._write_topic_index)
     
     def _ensure_directories(self):
         """필요한 디렉토리 생성"""
@@ -55,64 +82,99 @@ class XMLFileManager:
             "files": {},
             "auto_backup": True,
             "backup_interval": 300,  # 5분
-            "max_backups": 10
+            "max_backups": 10,
+            "durability": DURABILITY_FSYNC_FILE
         }
     
     def _save_metadata(self):
         """메타데이터 파일 저장"""
         try:
             self.metadata["last_modified"] = datetime.now().isoformat()
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata, f, indent=2, ensure_ascii=False)
+            data = json.dumps(self.metadata, indent=2, ensure_ascii=False).encode('utf-8')
+            atomic_write_bytes(self.metadata_file, data, self.durability)
         except Exception as e:
             print(f"❌ 메타데이터 저장 실패: {e}")
     
-    async def save_xml_async(self, xml_content: str, filename: str = "applications.xml") -> bool:
-        """XML 파일 비동기 저장"""
-        try:
-            file_path = self.xml_dir / filename
-            
+    def _get_file_lock(self, filename: str) -> threading.Lock:
+        """파일별 쓰기 락 반환 (스레드 간 직렬화)"""
+        with self._file_locks_guard:
+            lock = self._file_locks.get(filename)
+            if lock is None:
+                lock = self._file_locks[filename] = threading.Lock()
+            return lock
+    
+    def _get_async_lock(self, filename: str) -> asyncio.Lock:
+        """파일별 asyncio 락 반환 (저장 요청 병합용)"""
+        lock = self._async_locks.get(filename)
+        if lock is None:
+            lock = self._async_locks[filename] = asyncio.Lock()
+        return lock
+    
+    def add_post_save_hook(self, hook: Callable[[str, Path, bytes], None]):
+        """저장/복원 직후 실행할 훅 등록 (파일 락 안에서 저장 순서대로 호출)"""
+        self._post_save_hooks.append(hook)
+    
+    def _run_post_save_hooks(self, filename: str, file_path: Path, data: bytes):
+        """후처리 훅 실행 (실패해도 저장 결과에는 영향 없음)"""
+        for hook in self._post_save_hooks:
+            try:
+                hook(filename, file_path, data)
+            except Exception as e:
+                print(f"⚠️ 저장 후처리 실패 ({getattr(hook, '__name__', hook)}): {e}")
+    
+    def _write_xml_file(self, xml_content: str, filename: str):
+        """백업 → 포맷팅 → 원자적 교체 순서의 쓰기 파이프라인"""
+        file_path = self.xml_dir / filename
+        
+        with self._get_file_lock(filename):
             # 기존 파일 백업
             if file_path.exists() and self.metadata.get("auto_backup", True):
-                await self._create_backup_async(filename)
+                self._create_backup(filename)
             
             # XML 포맷팅
             formatted_xml = self._format_xml(xml_content)
+            data = formatted_xml.encode('utf-8')
             
-            # 비동기 파일 쓰기
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(formatted_xml)
+            # 임시 파일 + fsync + os.replace
+            atomic_write_bytes(file_path, data, self.durability)
             
             # 메타데이터 업데이트
-            self._update_file_metadata(filename, len(formatted_xml))
+            self._update_file_metadata(filename, len(data))
             
-            print(f"✅ XML 저장 완료: {file_path}")
-            return True
+            self._run_post_save_hooks(filename, file_path, data)
+        
+        print(f"✅ XML 저장 완료: {file_path}")
+    
+    async def save_xml_async(self, xml_content: str, filename: str = "applications.xml") -> bool:
+        """XML 파일 비동기 저장 (같은 파일의 동시 요청은 최신 내용만 기록)"""
+        # 최신 요청 내용으로 대기 슬롯 갱신
+        seq = self._requested_seq.get(filename, 0) + 1
+        self._requested_seq[filename] = seq
+        self._pending_saves[filename] = xml_content
+        
+        async with self._get_async_lock(filename):
+            # 대기 중에 더 새로운 내용이 이미 기록되었으면 병합 처리
+            if self._written_seq.get(filename, 0) >= seq:
+                return self._last_save_result.get(filename, False)
             
-        except Exception as e:
-            print(f"❌ XML 저장 실패: {e}")
-            return False
+            content = self._pending_saves.pop(filename)
+            target_seq = self._requested_seq[filename]
+            
+            try:
+                await asyncio.to_thread(self._write_xml_file, content, filename)
+                success = True
+            except Exception as e:
+                print(f"❌ XML 저장 실패: {e}")
+                success = False
+            
+            self._written_seq[filename] = target_seq
+            self._last_save_result[filename] = success
+            return success
     
     def save_xml(self, xml_content: str, filename: str = "applications.xml") -> bool:
         """XML 파일 동기 저장"""
         try:
-            file_path = self.xml_dir / filename
-            
-            # 기존 파일 백업
-            if file_path.exists() and self.metadata.get("auto_backup", True):
-                self._create_backup(filename)
-            
-            # XML 포맷팅
-            formatted_xml = self._format_xml(xml_content)
-            
-            # 파일 쓰기
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(formatted_xml)
-            
-            # 메타데이터 업데이트
-            self._update_file_metadata(filename, len(formatted_xml))
-            
-            print(f"✅ XML 저장 완료: {file_path}")
+            self._write_xml_file(xml_content, filename)
             return True
             
         except Exception as e:
@@ -157,16 +219,115 @@ class XMLFileManager:
             print(f"❌ XML 로드 실패: {e}")
             return None
     
-    def _format_xml(self, xml_content: str) -> str:
-        """XML 예쁘게 포맷팅"""
+    def load_backup(self, backup_filename: str) -> Optional[str]:
+        """백업 파일 동기 로드 (디렉토리 탈출 방지, 없으면 None)"""
         try:
-            # XML 선언이 없으면 추가
-            if not xml_content.startswith('<?xml'):
-                xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n' + xml_content
+            if not backup_filename or Path(backup_filename).name != backup_filename:
+                return None
+            
+            backup_path = self.backup_dir / backup_filename
+            if not backup_path.is_file():
+                print(f"⚠️ 백업 파일 없음: {backup_filename}")
+                return None
+            
+            return backup_path.read_text(encoding='utf-8')
+            
+        except Exception as e:
+            print(f"❌ 백업 로드 실패: {e}")
+            return None
+    
+    def get_xml_path(self, filename: str) -> Optional[Path]:
+        """XML 파일 경로 반환 (디렉토리 탈출 방지, 없으면 None)"""
+        if not filename or Path(filename).name != filename:
+            return None
+        
+        file_path = self.xml_dir / filename
+        return file_path if file_path.is_file() else None
+    
+    def resolve_version_path(self, version: str) -> Optional[Path]:
+        """버전 식별자(XML 파일명 또는 백업 파일명)를 파일 경로로 변환"""
+        if not version or Path(version).name != version:
+            return None
+        
+        for directory in (self.xml_dir, self.backup_dir):
+            candidate = directory / version
+            if candidate.is_file():
+                return candidate
+        return None
+    
+    def get_gzip_variant(self, filename: str) -> Optional[Path]:
+        """파일 옆에 캐시된 gzip 사전 압축본 반환 (원본이 바뀌었으면 재생성)"""
+        source_path = self.get_xml_path(filename)
+        if source_path is None:
+            return None
+        
+        gzip_path = source_path.with_name(source_path.name + ".gz")
+        
+        with self._get_file_lock(f"{filename}.gz"):
+            source_stat = source_path.stat()
+            # 압축본의 mtime을 원본과 맞춰 두어 최신 여부를 판별
+            if gzip_path.exists() and gzip_path.stat().st_mtime_ns == source_stat.st_mtime_ns:
+                return gzip_path
             
-            # minidom으로 예쁘게 포맷팅
-            dom = minidom.parseString(xml_content)
-            return dom.toprettyxml(indent="  ", encoding=None)
+            fd, tmp_name = tempfile.mkstemp(prefix=f".{gzip_path.name}.", suffix=".tmp", dir=gzip_path.parent)
+            try:
+                with os.fdopen(fd, 'wb') as raw, open(source_path, 'rb') as src:
+                    with gzip.GzipFile(filename=source_path.name, mode='wb', fileobj=raw,
+                                       mtime=int(source_stat.st_mtime)) as gz:
+                        shutil.copyfileobj(src, gz, 1024 * 1024)
+                os.utime(tmp_name, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+                os.replace(tmp_name, gzip_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+        
+        print(f"🗜️ gzip 압축본 생성: {gzip_path.name}")
+        return gzip_path
+    
+    def _topic_index_path(self, file_path: Path) -> Path:
+        return file_path.with_name(file_path.name + ".idx")
+    
+    def _write_topic_index(self, filename: str, file_path: Path, data: bytes):
+        """저장된 XML로 mmap 토픽 인덱스 재생성 (mtime을 원본과 맞춤)"""
+        index_path = self._topic_index_path(file_path)
+        try:
+            structure = self._processor.xml_to_dict(data)
+        except ValueError:
+            structure = None
+        
+        if not structure or "Applications" not in structure:
+            # 파싱할 수 없는 카탈로그면 오래된 인덱스를 남기지 않음
+            if index_path.exists():
+                index_path.unlink()
+            print(f"⚠️ 토픽 인덱스 생략 (카탈로그 파싱 실패): {filename}")
+            return
+        
+        # 교체는 원자적이므로 이미 mmap 중인 소비자는 이전 파일을 그대로 읽음
+        atomic_write_bytes(index_path, build_topic_index(structure), DURABILITY_NONE)
+        source_stat = file_path.stat()
+        os.utime(index_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    
+    def get_topic_index(self, filename: str) -> Optional[Path]:
+        """파일의 토픽 인덱스 경로 반환 (없거나 원본보다 오래되었으면 재생성)"""
+        source_path = self.get_xml_path(filename)
+        if source_path is None:
+            return None
+        
+        index_path = self._topic_index_path(source_path)
+        with self._get_file_lock(filename):
+            if not (index_path.exists()
+                    and index_path.stat().st_mtime_ns == source_path.stat().st_mtime_ns):
+                self._write_topic_index(filename, source_path, source_path.read_bytes())
+        
+        return index_path if index_path.exists() else None
+    
+    def _format_xml(self, xml_content: str) -> str:
+        """XML 예쁘게 포맷팅 (catalog_cli normalize와 같은 XMLProcessor.format_xml 형식)"""
+        try:
+            return self._processor.format_xml(xml_content)
             
         except Exception as e:
             print(f"⚠️ XML 포맷팅 실패: {e}")
@@ -319,16 +480,22 @@ class XMLFileManager:
                 print(f"❌ 백업 파일 없음: {backup_filename}")
                 return False
             
-            # 현재 파일 백업
-            if target_path.exists():
-                self._create_backup(target_filename)
-            
-            # 백업에서 복원
-            shutil.copy2(backup_path, target_path)
-            
-            # 메타데이터 업데이트
-            stat = target_path.stat()
-            self._update_file_metadata(target_filename, stat.st_size)
+            with self._get_file_lock(target_filename):
+                # 현재 파일 백업 전에 읽어 둠 (같은 초에 만든 백업 이름이 겹칠 수 있음)
+                backup_data = backup_path.read_bytes()
+                
+                # 현재 파일 백업
+                if target_path.exists():
+                    self._create_backup(target_filename)
+                
+                # 백업에서 복원 (원자적 교체)
+                atomic_write_bytes(target_path, backup_data, self.durability)
+                
+                # 메타데이터 업데이트
+                stat = target_path.stat()
+                self._update_file_metadata(target_filename, stat.st_size)
+                
+                self._run_post_save_hooks(target_filename, target_path, backup_data)
             
             print(f"🔄 백업에서 복원 완료: {backup_filename} → {target_filename}")
             return True
@@ -349,8 +516,11 @@ class XMLFileManager:
             # 삭제 전 백업
             self._create_backup(filename)
             
-            # 파일 삭제
+            # 파일 삭제 (캐시된 압축본/토픽 인덱스 포함)
             file_path.unlink()
+            for derived_path in (file_path.with_name(file_path.name + ".gz"), self._topic_index_path(file_path)):
+                if derived_path.exists():
+                    derived_path.unlink()
             
             # 메타데이터에서 제거
             if filename in self.metadata.get("files", {}):
@@ -0,0 +1,11 @@
+"""
+Catalog structure helpers
+xmltodict 형식 카탈로그 구조(dict)를 다루는 모듈 간 공용 함수
+"""
+
+
+def as_list(value) -> list:
+    """xmltodict 단일 요소(dict)/누락(None)을 리스트로 정규화"""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
@@ -0,0 +1,403 @@
+"""
+Template-based Code Generation Engine
+models/templates/<language>/ 의 jinja2 템플릿을 한 번 컴파일해 캐시하고 응용프로그램 단위로 렌더링
+
+언어별 템플릿 구성:
+    header.j2       파일 머리말 (import/include)
+    application.j2  응용프로그램 하나의 클라이언트 코드
+    footer.j2       사용 예제 등 전체 응용프로그램 목록이 필요한 꼬리말
+언어에 따라 생성 파일 옆에 둘 빌드 파일 템플릿 (TEMPLATE_PROJECT_FILES, 예: cpp/CMakeLists.txt.j2)
+응용프로그램별 벤치마크 프로그램은 대상 언어와 무관하게 python/benchmark.j2 (pyzmq, inproc/ipc)
+새 언어는 디렉토리를 추가하고 TEMPLATE_LANGUAGES에 확장자를 등록하면 됨
+"""
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template
+
+from models.endpoint_planner import plan_endpoints
+from models.structure_utils import as_list
+
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+# 언어 → 생성 파일 확장자
+TEMPLATE_LANGUAGES = {
+    "python": ".py",
+    "cpp": ".hpp",
+    "java": ".java",
+    "csharp": ".cs",
+    "go": ".go",
+    "rust": ".rs"
+}
+
+TEMPLATE_PARTS = ("header", "application", "footer")
+
+# 언어 → 생성 파일과 같은 디렉토리에 두는 빌드 파일 이름 (템플릿은 <이름>.j2)
+TEMPLATE_PROJECT_FILES = {
+    "cpp": ("CMakeLists.txt",),
+    "go": ("go.mod", "zmqtopics.go"),
+    "rust": ("Cargo.toml", "build.rs", "lib.rs")
+}
+
+# 응용프로그램별 벤치마크 프로그램 템플릿과 파일 이름 접미사 (<응용프로그램>_benchmark.py)
+BENCHMARK_TEMPLATE = ("python", "benchmark")
+BENCHMARK_SUFFIX = "_benchmark.py"
+
+# 생성 코드 캐시 기본 한도 (문자 수 기준)
+DEFAULT_CACHE_MAX_SIZE = 64 * 1024 * 1024
+
+# 메시지 직렬화 방식 (json: 기존 JSON 문자열, protobuf/raw: 토픽 프레임 + 바이너리 페이로드 멀티파트)
+SERIALIZATIONS = ("json", "protobuf", "raw")
+
+
+@lru_cache(maxsize=65536)
+def to_pascal_case(text: str) -> str:
+    """문자열을 PascalCase로 변환"""
+    return ''.join(word.capitalize() for word in text.replace('_', ' ').replace('-', ' ').split())
+
+
+@lru_cache(maxsize=65536)
+def to_camel_case(text: str) -> str:
+    """문자열을 camelCase로 변환"""
+    pascal = to_pascal_case(text)
+    return pascal[:1].lower() + pascal[1:]
+
+
+@lru_cache(maxsize=65536)
+def to_identifier(text: str) -> str:
+    """식별자로 쓸 수 있는 소문자 이름 (영숫자/밑줄 외 문자는 밑줄로)"""
+    identifier = re.sub(r'\W', '_', text).lower()
+    return f"_{identifier}" if identifier[:1].isdigit() else identifier
+
+
+@lru_cache(maxsize=65536)
+def proto_names(proto: str) -> tuple:
+    """@proto 값 → (protoc 출력 파일 이름, 메시지 타입 이름)
+
+    "video.proto" → ("video", "Video") 처럼 파일 이름이면 파일당 같은 이름의 메시지 하나를,
+    "Video" / "pkg.Video" 처럼 메시지 이름이면 messages.proto 에 정의된 것으로 본다.
+    """
+    if proto.endswith(".proto"):
+        stem = proto[:-len(".proto")].replace("\\", "/").replace("-", "_")
+        return stem, to_pascal_case(stem.rsplit("/", 1)[-1])
+    return "messages", proto.rsplit(".", 1)[-1] if proto else "Message"
+
+
+# 템플릿 뷰 모델: jinja2의 속성 접근이 dict 키 조회 폴백(예외) 없이 바로 성공하도록 NamedTuple 사용
+class TopicView(NamedTuple):
+    name: str
+    proto: str
+    direction: str
+    description: str
+    index: int
+    var_name: str
+    class_name: str
+    proto_file: str
+    message_type: str
+    port: int                   # 발행 토픽이 바인딩할 포트 (구독 토픽은 0)
+    connect_ports: List[int]    # 구독 토픽이 연결할 발행 포트들
+
+
+class ApplicationView(NamedTuple):
+    name: str
+    description: str
+    class_name: str
+    var_name: str
+    topics: List[TopicView]
+    publish_topics: List[TopicView]
+    subscribe_topics: List[TopicView]
+    publish_port: int           # 첫 발행 토픽 포트 (multiplex_publishers이면 모든 발행 토픽이 공유)
+
+
+def application_context(app: dict, endpoints: Optional[dict] = None) -> ApplicationView:
+    """템플릿에 넘길 응용프로그램 뷰 모델 (이름 변환은 여기서 한 번만 수행)
+
+    endpoints는 엔드포인트 계획의 응용프로그램 항목 ({"publish": {토픽: 포트}, "subscribe": {토픽: [포트]}})
+    """
+    app_name = app.get("@name", "Unknown")
+    publish_ports = (endpoints or {}).get("publish") or {}
+    subscribe_ports = (endpoints or {}).get("subscribe") or {}
+    topics = []
+    for index, topic in enumerate(as_list(app.get("Topic"))):
+        topic_name = topic.get("@name", f"topic_{index}")
+        proto = topic.get("@proto", "")
+        proto_file, message_type = proto_names(proto)
+        direction = topic.get("@direction", "subscribe")
+        topics.append(TopicView(
+            name=topic_name,
+            proto=proto,
+            direction=direction,
+            description=topic.get("@description", ""),
+            index=index,
+            var_name=to_identifier(topic_name),
+            class_name=to_pascal_case(topic_name),
+            proto_file=proto_file,
+            message_type=message_type,
+            port=publish_ports.get(topic_name, 0) if direction == "publish" else 0,
+            connect_ports=list(subscribe_ports.get(topic_name, ())) if direction != "publish" else []
+        ))
+    
+    publish_topics = [topic for topic in topics if topic.direction == "publish"]
+    return ApplicationView(
+        name=app_name,
+        description=app.get("@description", ""),
+        class_name=to_pascal_case(app_name),
+        var_name=to_identifier(app_name),
+        topics=topics,
+        publish_topics=publish_topics,
+        subscribe_topics=[topic for topic in topics if topic.direction == "subscribe"],
+        publish_port=publish_topics[0].port if publish_topics else 0
+    )
+
+
+@lru_cache(maxsize=None)
+def _module_source() -> bytes:
+    """필터/뷰 모델 등 렌더링 코드 (템플릿 지문에 포함)"""
+    return Path(__file__).read_bytes()
+
+
+def application_digest(app: dict, endpoints: Optional[dict] = None) -> str:
+    """응용프로그램 내용 해시 (키 순서와 무관, 엔드포인트 계획 항목 포함)"""
+    canonical = json.dumps(app if endpoints is None else [app, endpoints],
+                           ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def option_flags(options: Dict[str, Any]) -> tuple:
+    """생성 결과에 영향을 주는 옵션 (캐시 키/매니페스트용, 시각 제외)"""
+    return tuple(sorted((key, value) for key, value in options.items() if key != "generated_at"))
+
+
+class CodeCache:
+    """생성된 코드 조각 LRU 캐시 (전체 문자 수 한도를 넘으면 오래된 항목부터 제거)"""
+    
+    def __init__(self, max_size: int = DEFAULT_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[tuple, str]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    def get(self, key: tuple) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+    
+    def put(self, key: tuple, value: str):
+        # 한도보다 큰 조각은 저장하지 않음 (캐시 전체를 밀어내지 않도록)
+        if len(value) > self.max_size:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = value
+            self._size += len(value)
+            while self._size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self._evictions += 1
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+    
+    def get_info(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "size": self._size,
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0
+            }
+
+
+class TemplateEngine:
+    """언어별 템플릿 렌더러 (컴파일된 템플릿은 인스턴스 수명 동안 재사용)"""
+    
+    def __init__(self, template_dir: Path = TEMPLATE_DIR, cache_max_size: int = DEFAULT_CACHE_MAX_SIZE):
+        self.template_dir = Path(template_dir)
+        self.cache = CodeCache(cache_max_size)
+        self.environment = Environment(
+            loader=FileSystemLoader(str(self.template_dir)),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            keep_trailing_newline=True,
+            undefined=StrictUndefined,
+            autoescape=False,
+            auto_reload=False
+        )
+        self.environment.filters["pascal_case"] = to_pascal_case
+        self.environment.filters["camel_case"] = to_camel_case
+        self.environment.filters["identifier"] = to_identifier
+        self._templates: Dict[tuple, Template] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._lock = threading.Lock()
+    
+    def supports(self, language: str) -> bool:
+        return language in TEMPLATE_LANGUAGES
+    
+    def precompile(self, languages: Optional[List[str]] = None):
+        """템플릿을 미리 컴파일 (첫 요청 지연 제거)"""
+        for language in languages or TEMPLATE_LANGUAGES:
+            for part in TEMPLATE_PARTS + TEMPLATE_PROJECT_FILES.get(language, ()):
+                self.get_template(language, part)
+    
+    def get_template(self, language: str, part: str) -> Template:
+        """컴파일된 템플릿 반환 (최초 요청 시 한 번만 컴파일)"""
+        key = (language, part)
+        template = self._templates.get(key)
+        if template is None:
+            if language not in TEMPLATE_LANGUAGES:
+                raise ValueError(f"지원하지 않는 언어: {language}")
+            with self._lock:
+                template = self._templates.get(key)
+                if template is None:
+                    template = self._templates[key] = self.environment.get_template(f"{language}/{part}.j2")
+        return template
+    
+    def template_fingerprint(self, language: str) -> str:
+        """언어 템플릿 소스와 렌더링 코드(이 모듈) 해시 (어느 쪽이 바뀌어도 생성 결과가 바뀜)"""
+        if language not in TEMPLATE_LANGUAGES:
+            raise ValueError(f"지원하지 않는 언어: {language}")
+        return self._fingerprint(language, [
+            f"{language}/{part}.j2" for part in TEMPLATE_PARTS + TEMPLATE_PROJECT_FILES.get(language, ())
+        ])
+    
+    def benchmark_fingerprint(self) -> str:
+        """벤치마크 템플릿 소스와 렌더링 코드 해시"""
+        language, part = BENCHMARK_TEMPLATE
+        return self._fingerprint(f"{language}/{part}", [f"{language}/{part}.j2"])
+    
+    def _fingerprint(self, key: str, template_names: List[str]) -> str:
+        fingerprint = self._fingerprints.get(key)
+        if fingerprint is None:
+            digest = hashlib.blake2b(_module_source(), digest_size=16)
+            for name in template_names:
+                source, _, _ = self.environment.loader.get_source(self.environment, name)
+                digest.update(source.encode('utf-8'))
+            fingerprint = self._fingerprints[key] = digest.hexdigest()
+        return fingerprint
+    
+    def render_project_files(self, language: str, options: Dict[str, Any]) -> Dict[str, str]:
+        """생성 파일 옆에 둘 빌드 파일 (파일 이름 → 내용, 응용프로그램과 무관)"""
+        if language not in TEMPLATE_LANGUAGES:
+            raise ValueError(f"지원하지 않는 언어: {language}")
+        return {name: self.get_template(language, name).render(**options)
+                for name in TEMPLATE_PROJECT_FILES.get(language, ())}
+    
+    def render_application(self, language: str, app: dict, options: Dict[str, Any],
+                           endpoints: Optional[dict] = None) -> str:
+        """응용프로그램 하나의 코드 조각 렌더링 (endpoints: 계획의 응용프로그램 항목)"""
+        return self.get_template(language, "application").render(app=application_context(app, endpoints), **options)
+    
+    def render_benchmark(self, app: dict, options: Dict[str, Any], endpoints: Optional[dict] = None) -> str:
+        """응용프로그램 하나의 토픽별 처리량/지연 벤치마크 프로그램 렌더링 (endpoints: 계획의 응용프로그램 항목)"""
+        return self.get_template(*BENCHMARK_TEMPLATE).render(app=application_context(app, endpoints), **options)
+    
+    def render_applications(self, language: str, applications: List[ApplicationView],
+                            options: Dict[str, Any]) -> List[str]:
+        """응용프로그램 뷰 모델별 코드 조각을 순서대로 렌더링
+        
+        Template.render()는 호출마다 전역/옵션 dict를 복사해 컨텍스트를 만드므로,
+        옵션을 담은 부모 dict 하나를 공유하고 조각마다 빈 컨텍스트만 새로 만든다.
+        """
+        template = self.get_template(language, "application")
+        parent = dict(template.globals, **options)
+        concat = self.environment.concat
+        parts = []
+        for app in applications:
+            parent["app"] = app
+            parts.append(concat(template.root_render_func(template.new_context(parent, shared=True))))
+        return parts
+    
+    def render(self, language: str, applications: List[dict], options: Dict[str, Any],
+               use_cache: bool = True, endpoints: Optional[Dict[str, dict]] = None) -> str:
+        """머리말 + 응용프로그램별 조각 + 꼬리말을 이어 붙인 전체 코드
+        
+        endpoints는 엔드포인트 계획의 applications (응용프로그램 이름 → 포트 항목),
+        없으면 넘겨받은 응용프로그램만으로 계획한다.
+        응용프로그램 조각과 꼬리말은 (언어, 내용+포트 해시, 생성 옵션)으로 캐시하며
+        시각이 들어가는 머리말은 매번 렌더링 (deterministic 모드에서는 시각 없음)
+        """
+        if endpoints is None:
+            endpoints = plan_endpoints(
+                {"Applications": {"Application": applications}},
+                multiplex_publishers=bool(options.get("multiplex_publishers"))
+            )["applications"]
+        entries = [endpoints.get(app.get("@name", "Unknown")) for app in applications]
+        flags = option_flags(options)
+        header = self.get_template(language, "header").render(**options)
+        
+        if not use_cache:
+            views = [application_context(app, entry) for app, entry in zip(applications, entries)]
+            parts = self.render_applications(language, views, options)
+            footer = self.get_template(language, "footer").render(applications=views, **options)
+            return self._join(header, parts, footer)
+        
+        digests = [application_digest(app, entry) for app, entry in zip(applications, entries)]
+        parts: List[Optional[str]] = []
+        missing = []
+        for index, digest in enumerate(digests):
+            part = self.cache.get((language, "application", digest) + flags)
+            parts.append(part)
+            if part is None:
+                missing.append(index)
+        
+        if missing:
+            views = [application_context(applications[index], entries[index]) for index in missing]
+            for index, part in zip(missing, self.render_applications(language, views, options)):
+                parts[index] = part
+                self.cache.put((language, "application", digests[index]) + flags, part)
+        
+        # 꼬리말은 응용프로그램 목록 전체에 의존
+        footer_key = (language, "footer", hashlib.blake2b(''.join(digests).encode(), digest_size=16).hexdigest()) + flags
+        footer = self.cache.get(footer_key)
+        if footer is None:
+            views = [application_context(app, entry) for app, entry in zip(applications, entries)]
+            footer = self.get_template(language, "footer").render(applications=views, **options)
+            self.cache.put(footer_key, footer)
+        
+        return self._join(header, parts, footer)
+    
+    @staticmethod
+    def _join(header: str, parts: List[str], footer: str) -> str:
+        """조각을 이어 붙이고 파일 끝 줄바꿈을 하나로 정리 (전체 문자열 복사 없이 마지막 조각만)"""
+        pieces = [header, *parts, footer]
+        while len(pieces) > 1 and not pieces[-1].strip('\n'):
+            pieces.pop()
+        pieces[-1] = pieces[-1].rstrip('\n') + '\n'
+        return ''.join(pieces)
+
+
+# 워커 프로세스별 엔진 (프로세스당 한 번 컴파일)
+_worker_engines: Dict[str, TemplateEngine] = {}
+
+
+def get_worker_engine(template_dir: str) -> TemplateEngine:
+    """현재 프로세스의 템플릿 엔진 (프로세스 풀 작업에서 사용)"""
+    engine = _worker_engines.get(template_dir)
+    if engine is None:
+        engine = _worker_engines[template_dir] = TemplateEngine(Path(template_dir))
+    return engine
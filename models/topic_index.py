@@ -0,0 +1,228 @@
+"""
+Memory-mappable Topic Index
+토픽 이름 → proto/발행자/구독자 조회용 고정 레이아웃 바이너리 인덱스
+소비자는 파일을 mmap 한 뒤 역직렬화 없이 이진 탐색으로 조회
+
+파일 레이아웃 (리틀 엔디언):
+    헤더     magic(8s) format_version(I) topic_count(I) ref_count(I) strings_offset(I) strings_size(I)
+    레코드   topic_count × (name_off, name_len, proto_off, proto_len,
+                            pub_start, pub_count, sub_start, sub_count)  각 u32, UTF-8 이름 바이트 순 정렬
+    참조     ref_count × (app_off, app_len)  각 u32, 레코드의 pub/sub 구간이 가리키는 응용프로그램 이름
+    문자열   중복 제거된 UTF-8 문자열 테이블 (오프셋은 테이블 시작 기준)
+"""
+
+import mmap
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from models.structure_utils import as_list
+
+
+MAGIC = b"ZMQTIDX\0"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIIII")
+_RECORD = struct.Struct("<IIIIIIII")
+_REF = struct.Struct("<II")
+
+
+@dataclass
+class TopicEntry:
+    """인덱스 조회 결과"""
+    name: str
+    proto: str
+    publishers: List[str] = field(default_factory=list)
+    subscribers: List[str] = field(default_factory=list)
+
+
+def build_topic_index(structure: dict) -> bytes:
+    """카탈로그 구조에서 인덱스 바이트 생성 (같은 토픽의 proto는 처음 선언된 값 사용)"""
+    # 발행자/구독자는 선언 순서를 유지하는 dict로 중복 제거
+    topics: Dict[str, Tuple[str, Dict[str, None], Dict[str, None]]] = {}
+    
+    applications = (structure or {}).get("Applications") or {}
+    for app in as_list(applications.get("Application")):
+        app_name = app.get("@name", "")
+        for topic in as_list(app.get("Topic")):
+            topic_name = topic.get("@name", "")
+            if not topic_name:
+                continue
+            entry = topics.get(topic_name)
+            if entry is None:
+                entry = topics[topic_name] = (topic.get("@proto", ""), {}, {})
+            
+            direction = topic.get("@direction")
+            if direction == "publish":
+                entry[1][app_name] = None
+            elif direction == "subscribe":
+                entry[2][app_name] = None
+    
+    strings = bytearray()
+    string_offsets: Dict[str, Tuple[int, int]] = {}
+    
+    def intern(value: str) -> Tuple[int, int]:
+        location = string_offsets.get(value)
+        if location is None:
+            encoded = value.encode('utf-8')
+            location = string_offsets[value] = (len(strings), len(encoded))
+            strings.extend(encoded)
+        return location
+    
+    records = bytearray()
+    refs = bytearray()
+    ref_count = 0
+    
+    # 소비자가 memcmp로 이진 탐색할 수 있도록 UTF-8 바이트 순으로 정렬
+    for topic_name in sorted(topics, key=lambda name: name.encode('utf-8')):
+        proto, publishers, subscribers = topics[topic_name]
+        name_off, name_len = intern(topic_name)
+        proto_off, proto_len = intern(proto)
+        
+        pub_start = ref_count
+        for app_name in publishers:
+            refs.extend(_REF.pack(*intern(app_name)))
+        ref_count += len(publishers)
+        
+        sub_start = ref_count
+        for app_name in subscribers:
+            refs.extend(_REF.pack(*intern(app_name)))
+        ref_count += len(subscribers)
+        
+        records.extend(_RECORD.pack(name_off, name_len, proto_off, proto_len,
+                                    pub_start, len(publishers), sub_start, len(subscribers)))
+    
+    strings_offset = _HEADER.size + len(records) + len(refs)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(topics), ref_count, strings_offset, len(strings))
+    return b"".join((header, records, refs, strings))
+
+
+class TopicIndex:
+    """mmap 기반 토픽 인덱스 리더 (파일을 읽어 들이지 않고 필요한 레코드만 디코딩)"""
+    
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"토픽 인덱스 형식 오류: 빈 파일 ({self.path})")
+        
+        try:
+            self._read_header()
+        except ValueError:
+            self.close()
+            raise
+    
+    def _read_header(self):
+        if len(self._mm) < _HEADER.size:
+            raise ValueError(f"토픽 인덱스 형식 오류: 헤더 없음 ({self.path})")
+        
+        magic, version, topic_count, ref_count, strings_offset, strings_size = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"토픽 인덱스 형식 오류: 잘못된 매직 값 ({self.path})")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 토픽 인덱스 버전: {version} ({self.path})")
+        
+        self._topic_count = topic_count
+        self._refs_offset = _HEADER.size + topic_count * _RECORD.size
+        self._strings_offset = strings_offset
+        if (self._refs_offset + ref_count * _REF.size != strings_offset
+                or strings_offset + strings_size > len(self._mm)):
+            raise ValueError(f"토픽 인덱스 형식 오류: 크기 불일치 ({self.path})")
+    
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._mm[start:start + length].decode('utf-8')
+    
+    def _name_bytes(self, index: int) -> bytes:
+        name_off, name_len = struct.unpack_from("<II", self._mm, _HEADER.size + index * _RECORD.size)
+        start = self._strings_offset + name_off
+        return self._mm[start:start + name_len]
+    
+    def _refs(self, start: int, count: int) -> List[str]:
+        names = []
+        for i in range(start, start + count):
+            offset, length = _REF.unpack_from(self._mm, self._refs_offset + i * _REF.size)
+            names.append(self._string(offset, length))
+        return names
+    
+    def find(self, name: str) -> int:
+        """토픽 레코드 번호 이진 탐색 (없으면 -1)"""
+        target = name.encode('utf-8')
+        low, high = 0, self._topic_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name_bytes(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._topic_count and self._name_bytes(low) == target:
+            return low
+        return -1
+    
+    def _entry(self, index: int) -> TopicEntry:
+        (name_off, name_len, proto_off, proto_len,
+         pub_start, pub_count, sub_start, sub_count) = _RECORD.unpack_from(self._mm, _HEADER.size + index * _RECORD.size)
+        return TopicEntry(
+            name=self._string(name_off, name_len),
+            proto=self._string(proto_off, proto_len),
+            publishers=self._refs(pub_start, pub_count),
+            subscribers=self._refs(sub_start, sub_count)
+        )
+    
+    def get(self, name: str) -> Optional[TopicEntry]:
+        """토픽 조회 (없으면 None)"""
+        index = self.find(name)
+        return self._entry(index) if index >= 0 else None
+    
+    def __getitem__(self, name: str) -> TopicEntry:
+        entry = self.get(name)
+        if entry is None:
+            raise KeyError(name)
+        return entry
+    
+    def __contains__(self, name: str) -> bool:
+        return self.find(name) >= 0
+    
+    def __len__(self) -> int:
+        return self._topic_count
+    
+    def __iter__(self) -> Iterator[str]:
+        """정렬 순서대로 토픽 이름 반환"""
+        for index in range(self._topic_count):
+            yield self._name_bytes(index).decode('utf-8')
+    
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self) -> "TopicIndex":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# 사용 예제
+if __name__ == "__main__":
+    import sys
+    
+    if len(sys.argv) < 3:
+        print("사용법: python -m models.topic_index <index 파일> <토픽 이름>...")
+        sys.exit(1)
+    
+    with TopicIndex(sys.argv[1]) as index:
+        print(f"📇 토픽 {len(index)}개")
+        for topic_name in sys.argv[2:]:
+            entry = index.get(topic_name)
+            if entry is None:
+                print(f"❌ {topic_name}: 없음")
+            else:
+                print(f"✅ {entry.name}: proto={entry.proto} publishers={entry.publishers} subscribers={entry.subscribers}")
@@ -0,0 +1,318 @@
+"""
+Topology Simulator
+카탈로그의 발행/구독 선언대로 응용프로그램을 asyncio 태스크로 띄우고 pyzmq inproc:// 소켓으로 연결해
+토픽마다 설정한 전송률로 메시지를 흘려보내고 토픽별 전달률, HWM 초과로 버려진 메시지, 종단 간 지연을 측정
+
+- 배선은 엔드포인트 계획을 그대로 따름: 발행 포트마다 PUB 소켓 하나 (inproc://<포트>),
+  구독 토픽은 계획된 모든 발행 포트에 connect 하고 토픽 이름으로 SUBSCRIBE (생성 코드와 같은 [토픽, 페이로드] 형식)
+- 응용프로그램마다 발행 토픽별 송신 태스크와 구독 소켓 전체를 읽는 수신 태스크 하나
+- 모든 태스크가 한 이벤트 루프에서 돌기 때문에 송신이 목표 전송률에 못 미치면 (publisher_limited)
+  토폴로지가 아니라 시뮬레이터가 포화된 것
+"""
+
+import asyncio
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.endpoint_planner import plan_endpoints
+
+# 선택 의존성: 설치된 경우에만 시뮬레이션 제공
+try:
+    import zmq
+    import zmq.asyncio
+except ImportError:
+    zmq = None
+
+
+# 페이로드 머리말: 송신 시각 (perf_counter ns)
+HEADER = struct.Struct("<q")
+
+# 구독 전파 확인용 탐침 페이로드: 발행 포트 (HEADER보다 짧아 측정에서 제외)
+PROBE = struct.Struct("<I")
+
+# 전송률 0 (제한 없음)일 때 한 번에 보내고 다른 태스크에 양보하는 메시지 수
+UNTHROTTLED_BATCH = 256
+
+# 송신 태스크가 깨어나는 최소 간격 (그 사이 밀린 메시지는 한꺼번에 전송)
+MIN_SEND_INTERVAL = 0.001
+
+# 송신 종료 후 이만큼 아무것도 도착하지 않으면 나머지는 버려진 것으로 봄
+DRAIN_IDLE_SECONDS = 0.2
+DRAIN_TIMEOUT_SECONDS = 2.0
+
+# 버려진 비율이 이보다 크거나 송신이 목표의 SEND_SHORTFALL 미만이면 포화로 판정
+SATURATION_DROP_RATIO = 0.001
+SEND_SHORTFALL = 0.95
+
+
+def is_available() -> bool:
+    """pyzmq가 설치되어 시뮬레이션을 실행할 수 있는지"""
+    return zmq is not None
+
+
+@dataclass
+class SimulationConfig:
+    """시뮬레이션 설정 (전송률은 발행자 하나당 초당 메시지 수, 0이면 제한 없음)"""
+    duration: float = 2.0
+    rate: float = 1000.0
+    payload_bytes: int = 64
+    hwm: int = 1000
+    multiplex_publishers: bool = False
+    rates: Dict[str, float] = field(default_factory=dict)          # 토픽 → 전송률
+    payload_sizes: Dict[str, int] = field(default_factory=dict)    # 토픽 → 페이로드 크기
+    
+    def topic_rate(self, topic: str) -> float:
+        return float(self.rates.get(topic, self.rate))
+    
+    def topic_payload_bytes(self, topic: str) -> int:
+        return max(HEADER.size, int(self.payload_sizes.get(topic, self.payload_bytes)))
+
+
+class _TopicStats:
+    """토픽 하나의 누적 카운터 (한 이벤트 루프에서만 갱신)"""
+    
+    __slots__ = ("sent", "delivered", "latencies", "publishers", "subscribers")
+    
+    def __init__(self):
+        self.sent: Dict[str, int] = {}          # 발행 응용프로그램 → 보낸 수
+        self.delivered: Dict[str, int] = {}     # 구독 응용프로그램 → 받은 수
+        self.latencies: List[int] = []
+        self.publishers: List[str] = []
+        self.subscribers: List[str] = []
+
+
+def _percentile(latencies: List[int], p: float) -> float:
+    """지연 백분위 (µs, latencies는 정렬된 상태)"""
+    return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] / 1000, 1) if latencies else 0.0
+
+
+class TopologySimulator:
+    """카탈로그 구조 하나의 inproc 시뮬레이션 (인스턴스당 한 번 실행)"""
+    
+    def __init__(self, structure: dict, config: Optional[SimulationConfig] = None):
+        if zmq is None:
+            raise RuntimeError("pyzmq가 설치되지 않아 시뮬레이션을 실행할 수 없습니다.")
+        self.config = config or SimulationConfig()
+        if self.config.duration <= 0:
+            raise ValueError("시뮬레이션 시간은 0보다 커야 합니다.")
+        if self.config.hwm < 0:
+            raise ValueError("HWM은 0 이상이어야 합니다.")
+        self.plan = plan_endpoints(structure, self.config.multiplex_publishers)
+        self.stats: Dict[str, _TopicStats] = {}
+        for app_name, entry in self.plan["applications"].items():
+            for topic in entry.get("publish") or {}:
+                self._topic(topic).publishers.append(app_name)
+            for topic in entry.get("subscribe") or {}:
+                self._topic(topic).subscribers.append(app_name)
+    
+    def _topic(self, topic: str) -> _TopicStats:
+        stats = self.stats.get(topic)
+        if stats is None:
+            stats = self.stats[topic] = _TopicStats()
+        return stats
+    
+    def run(self) -> Dict[str, Any]:
+        """새 이벤트 루프에서 시뮬레이션 실행 (서버 루프를 막지 않도록 별도 스레드에서 호출)"""
+        return asyncio.run(self.simulate())
+    
+    async def simulate(self) -> Dict[str, Any]:
+        """모든 응용프로그램을 띄우고 duration 동안 발행한 뒤 결과 집계"""
+        context = zmq.asyncio.Context()
+        sockets = []
+        try:
+            # 발행 소켓을 먼저 bind (inproc는 bind 전에 connect 해도 되지만 계획 순서를 따름)
+            publishers: Dict[int, Any] = {}
+            for entry in self.plan["applications"].values():
+                for port in dict.fromkeys((entry.get("publish") or {}).values()):
+                    socket = context.socket(zmq.PUB)
+                    socket.setsockopt(zmq.SNDHWM, self.config.hwm)
+                    socket.setsockopt(zmq.LINGER, 0)
+                    socket.bind(f"inproc://{port}")
+                    publishers[port] = socket
+                    sockets.append(socket)
+            
+            listeners: Dict[str, List[Tuple[Any, str]]] = {}
+            for app_name, entry in self.plan["applications"].items():
+                for topic, ports in (entry.get("subscribe") or {}).items():
+                    if not ports:
+                        continue
+                    socket = context.socket(zmq.SUB)
+                    socket.setsockopt(zmq.RCVHWM, self.config.hwm)
+                    socket.setsockopt(zmq.LINGER, 0)
+                    for port in ports:
+                        socket.connect(f"inproc://{port}")
+                    socket.setsockopt(zmq.SUBSCRIBE, topic.encode())
+                    listeners.setdefault(app_name, []).append((socket, topic))
+                    sockets.append(socket)
+            
+            await self._wait_joined(publishers, listeners)
+            
+            running = asyncio.Event()
+            running.set()
+            receive_tasks = [asyncio.create_task(self._listen(app_name, subscriptions, running))
+                             for app_name, subscriptions in listeners.items()]
+            started = time.perf_counter()
+            send_tasks = [asyncio.create_task(self._publish(app_name, topic, publishers[port], started))
+                          for app_name, entry in self.plan["applications"].items()
+                          for topic, port in (entry.get("publish") or {}).items()]
+            await asyncio.gather(*send_tasks)
+            elapsed = time.perf_counter() - started
+            
+            await self._drain()
+            running.clear()
+            for task in receive_tasks:
+                task.cancel()
+            await asyncio.gather(*receive_tasks, return_exceptions=True)
+        finally:
+            for socket in sockets:
+                socket.close(linger=0)
+            context.term()
+        
+        return self._report(elapsed)
+    
+    async def _wait_joined(self, publishers: Dict[int, Any], listeners: Dict[str, List[Tuple[Any, str]]]):
+        """구독이 모든 발행 소켓에 전파될 때까지 대기 (slow joiner, 측정 전에 끝냄)
+
+        발행 포트마다 구독자가 있는 토픽으로 탐침 (페이로드: 포트 번호, 머리말보다 짧아 측정에서 제외)을 보내고
+        모든 (응용프로그램, 토픽, 포트) 연결에서 탐침이 도착하면 끝낸다.
+        """
+        links = {(app_name, topic, port): socket
+                 for app_name, subscriptions in listeners.items()
+                 for socket, topic in subscriptions
+                 for port in self.plan["applications"][app_name]["subscribe"][topic]}
+        probes: Dict[int, List[str]] = {}
+        for _, topic, port in links:
+            probes.setdefault(port, []).append(topic)
+        
+        joined = set()
+        deadline = time.perf_counter() + DRAIN_TIMEOUT_SECONDS
+        while len(joined) < len(links) and time.perf_counter() < deadline:
+            for port, topics in probes.items():
+                for topic in dict.fromkeys(topics):
+                    await publishers[port].send_multipart([topic.encode(), PROBE.pack(port)], zmq.NOBLOCK)
+            await asyncio.sleep(0.01)
+            for (app_name, topic, _), socket in links.items():
+                while True:
+                    try:
+                        frames = await socket.recv_multipart(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    if frames[0] == topic.encode() and len(frames[-1]) == PROBE.size:
+                        joined.add((app_name, topic, PROBE.unpack(frames[-1])[0]))
+    
+    async def _publish(self, app_name: str, topic: str, socket, started: float):
+        """토픽 하나를 목표 전송률로 발행 (밀린 메시지는 한꺼번에 보내 평균 전송률 유지)"""
+        rate = self.config.topic_rate(topic)
+        padding = bytes(self.config.topic_payload_bytes(topic) - HEADER.size)
+        topic_frame = topic.encode()
+        stats = self._topic(topic)
+        duration = self.config.duration
+        sent = 0
+        while True:
+            elapsed = time.perf_counter() - started
+            if elapsed >= duration:
+                break
+            due = sent + UNTHROTTLED_BATCH if not rate else min(int(elapsed * rate) + 1, int(duration * rate))
+            while sent < due:
+                # PUB는 막히지 않음: 큐가 가득 찬 구독자에게 갈 메시지는 버려짐
+                await socket.send_multipart([topic_frame, HEADER.pack(time.perf_counter_ns()) + padding], zmq.NOBLOCK)
+                sent += 1
+            if rate:
+                if sent >= duration * rate:
+                    break
+                await asyncio.sleep(max(MIN_SEND_INTERVAL, sent / rate - (time.perf_counter() - started)))
+            else:
+                await asyncio.sleep(0)
+        stats.sent[app_name] = sent
+    
+    async def _listen(self, app_name: str, subscriptions: List[Tuple[Any, str]], running: asyncio.Event):
+        """응용프로그램 하나의 구독 소켓 전체를 읽어 토픽별 전달 수와 지연 기록"""
+        poller = zmq.asyncio.Poller()
+        topics = {}
+        for socket, topic in subscriptions:
+            poller.register(socket, zmq.POLLIN)
+            topics[socket] = (topic, topic.encode(), self._topic(topic))
+            self._topic(topic).delivered[app_name] = 0
+        while running.is_set():
+            for socket, _ in await poller.poll():
+                topic, topic_frame, stats = topics[socket]
+                delivered = 0
+                while True:
+                    try:
+                        frames = await socket.recv_multipart(zmq.NOBLOCK, copy=False)
+                    except zmq.Again:
+                        break
+                    now = time.perf_counter_ns()
+                    # 구독은 접두사 일치: 이름이 더 긴 다른 토픽과 전파 확인용 탐침은 건너뜀
+                    if frames[0].bytes != topic_frame or len(frames[-1]) < HEADER.size:
+                        continue
+                    stats.latencies.append(now - HEADER.unpack_from(frames[-1].buffer)[0])
+                    delivered += 1
+                stats.delivered[app_name] += delivered
+    
+    async def _drain(self):
+        """송신이 끝난 뒤 큐에 남은 메시지가 도착할 때까지 대기"""
+        deadline = time.perf_counter() + DRAIN_TIMEOUT_SECONDS
+        last, idle_since = -1, time.perf_counter()
+        while time.perf_counter() < deadline:
+            delivered = sum(sum(stats.delivered.values()) for stats in self.stats.values())
+            now = time.perf_counter()
+            if delivered != last:
+                last, idle_since = delivered, now
+            elif now - idle_since >= DRAIN_IDLE_SECONDS:
+                return
+            await asyncio.sleep(0.02)
+    
+    def _report(self, elapsed: float) -> Dict[str, Any]:
+        topics = []
+        for topic, stats in self.stats.items():
+            rate = self.config.topic_rate(topic)
+            sent = sum(stats.sent.values())
+            # 모든 구독자가 모든 발행자에 연결되므로 구독자마다 전체 발행량을 받아야 함
+            expected = sent * len(stats.subscribers) if stats.publishers else 0
+            delivered = sum(stats.delivered.values())
+            dropped = max(0, expected - delivered)
+            drop_ratio = dropped / expected if expected else 0.0
+            target = rate * self.config.duration * len(stats.publishers)
+            publisher_limited = bool(rate) and sent < target * SEND_SHORTFALL
+            latencies = sorted(stats.latencies)
+            topics.append({
+                "topic": topic,
+                "publishers": stats.publishers,
+                "subscribers": stats.subscribers,
+                "rate": rate,
+                "payload_bytes": self.config.topic_payload_bytes(topic),
+                "sent": sent,
+                "offered_rate": round(sent / elapsed, 1) if elapsed else 0.0,
+                "delivered": delivered,
+                "delivered_rate": round(delivered / elapsed, 1) if elapsed else 0.0,
+                "dropped": dropped,
+                "drop_ratio": round(drop_ratio, 4),
+                "per_subscriber": {app_name: {"delivered": count, "dropped": max(0, sent - count)}
+                                   for app_name, count in stats.delivered.items()},
+                "latency_p50_us": _percentile(latencies, 0.50),
+                "latency_p99_us": _percentile(latencies, 0.99),
+                "latency_p999_us": _percentile(latencies, 0.999),
+                "latency_max_us": _percentile(latencies, 1.0),
+                "publisher_limited": publisher_limited,
+                "saturated": drop_ratio > SATURATION_DROP_RATIO or publisher_limited
+            })
+        return {
+            "duration": round(elapsed, 4),
+            "hwm": self.config.hwm,
+            "multiplex_publishers": self.config.multiplex_publishers,
+            "topics": topics,
+            "totals": {
+                "sent": sum(entry["sent"] for entry in topics),
+                "delivered": sum(entry["delivered"] for entry in topics),
+                "dropped": sum(entry["dropped"] for entry in topics)
+            },
+            "saturated_topics": [entry["topic"] for entry in topics if entry["saturated"]]
+        }
+
+
+def simulate_topology(structure: dict, config: Optional[SimulationConfig] = None) -> Dict[str, Any]:
+    """카탈로그 구조를 시뮬레이션하고 토픽별 결과 반환 (블로킹, 새 이벤트 루프 사용)"""
+    return TopologySimulator(structure, config).run()
@@ -3,16 +3,37 @@ XML Schema and Data Model for ZeroMQ Topic Management (Python)
 pycrdt와 통합된 고급 XML 처리 기능
 """
 
+import hashlib
 import json
+import re
+import sys
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
 import xmltodict
 from lxml import etree
 from pydantic import BaseModel, Field, validator
 
+from models.endpoint_planner import DEFAULT_BASE_PORT, plan_endpoints
+from models.codegen_output import assign_file_names
+from models.template_engine import BENCHMARK_SUFFIX, SERIALIZATIONS, TemplateEngine, to_pascal_case
+
+# 선택 의존성: 설치된 경우에만 해당 내보내기 포맷 제공
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
 
 @dataclass
 class TopicInfo:
@@ -57,13 +78,8 @@ class XMLSchemaValidator:
         
         applications = data["Applications"]
         
-        # 네임스페이스 검증
-        if applications.get("@xmlns") != self.schema_namespace:
-            errors.append(f"Invalid namespace. Expected: {self.schema_namespace}")
-        
-        # 버전 검증
-        if applications.get("@version") != self.schema_version:
-            errors.append(f"Invalid version. Expected: {self.schema_version}")
+        # 네임스페이스/버전 검증
+        errors.extend(self._validate_root_attributes(applications))
         
         # 응용프로그램 검증
         if "Application" in applications:
@@ -77,10 +93,24 @@ class XMLSchemaValidator:
         
         return errors
     
-    def _validate_application(self, app: dict, index: int) -> List[str]:
+    def _validate_root_attributes(self, applications: dict) -> List[str]:
+        """루트 요소 네임스페이스/버전 검증"""
+        errors = []
+        
+        # 네임스페이스 검증
+        if applications.get("@xmlns") != self.schema_namespace:
+            errors.append(f"Invalid namespace. Expected: {self.schema_namespace}")
+        
+        # 버전 검증
+        if applications.get("@version") != self.schema_version:
+            errors.append(f"Invalid version. Expected: {self.schema_version}")
+        
+        return errors
+    
+    def _validate_application(self, app: dict, index: int, prefix: Optional[str] = None) -> List[str]:
         """개별 응용프로그램 검증"""
         errors = []
-        prefix = f"Application[{index}]"
+        prefix = prefix or f"Application[{index}]"
         
         # 필수 속성 검증
         if "@name" not in app:
@@ -127,29 +157,696 @@ class XMLSchemaValidator:
         return errors
 
 
+# 저장되는 카탈로그 파일의 XML 선언
+XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8"?>\n'
+
+# 배포되는 카탈로그 XSD
+SCHEMA_XSD_PATH = Path(__file__).parent / "schemas" / "applications.xsd"
+
+
+@lru_cache(maxsize=None)
+def validator_fingerprint() -> str:
+    """검증 규칙 버전: 검증기/직렬화 코드(이 모듈)와 배포 XSD의 해시 (결과 캐시 키용)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (Path(__file__), SCHEMA_XSD_PATH):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _load_compiled_schema(xsd_path: str) -> "etree.XMLSchema":
+    """XSD를 한 번만 컴파일하여 재사용"""
+    return etree.XMLSchema(etree.parse(xsd_path))
+
+
+class XSDSchemaValidator:
+    """lxml로 컴파일한 XSD 기반 검증기 (XMLSchemaValidator와 같은 오류 형식 반환)"""
+    
+    _ATTRIBUTE_RE = re.compile(r"attribute '([^']+)'")
+    _VALUE_RE = re.compile(r"The value '([^']*)'")
+    _PATH_INDEX_RE = re.compile(r"\[(\d+)\]$")
+    
+    def __init__(self, xsd_path: Union[str, Path] = SCHEMA_XSD_PATH):
+        self.schema_namespace = XMLSchemaValidator().schema_namespace
+        self.schema_version = XMLSchemaValidator().schema_version
+        self.schema = _load_compiled_schema(str(xsd_path))
+        self._parser = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True)
+        # XMLSchema 인스턴스의 error_log는 공유 상태이므로 검증을 직렬화
+        self._lock = threading.Lock()
+    
+    def validate_bytes(self, xml_bytes: Union[bytes, str],
+                       consistency: Optional["ConsistencyChecker"] = None) -> List[str]:
+        """원본 XML 바이트 검증 (consistency를 주면 파싱된 트리로 일관성 검사도 수행)"""
+        if isinstance(xml_bytes, str):
+            xml_bytes = xml_bytes.encode('utf-8')
+        
+        try:
+            root = etree.fromstring(xml_bytes, self._parser)
+        except etree.XMLSyntaxError as e:
+            return [f"XML 파싱 실패: {e}"]
+        
+        errors = self._schema_errors(root)
+        if consistency is not None:
+            errors.extend(self._check_consistency(root, consistency))
+        return errors
+    
+    def _schema_errors(self, root) -> List[str]:
+        """스키마 오류를 Python 검증기의 오류 분류로 변환
+        
+        네임스페이스가 다르면 libxml2는 루트에서 멈추므로, 기대 네임스페이스로 바꿔 다시 검증하여
+        Python 검증기처럼 응용프로그램/토픽 오류까지 보고한다.
+        """
+        with self._lock:
+            entries = [] if self.schema.validate(root) else list(self.schema.error_log)
+        
+        qname = etree.QName(root)
+        if (qname.localname == "Applications" and qname.namespace != self.schema_namespace
+                and any("No matching global declaration" in entry.message for entry in entries)):
+            self._replace_namespace(root, qname.namespace)
+            return [f"Invalid namespace. Expected: {self.schema_namespace}"] + self._schema_errors(root)
+        
+        errors = []
+        for entry in entries:
+            errors.extend(self._translate(entry, root))
+        return errors
+    
+    def _replace_namespace(self, root, namespace: Optional[str]):
+        """루트 네임스페이스(없으면 네임스페이스 없음)의 요소를 기대 네임스페이스로 옮김"""
+        old_prefix = f"{{{namespace}}}" if namespace else ""
+        new_prefix = f"{{{self.schema_namespace}}}"
+        for elem in root.iter(tag=etree.Element):
+            tag = elem.tag
+            if namespace is None and tag.startswith("{"):
+                continue
+            if tag.startswith(old_prefix):
+                elem.tag = new_prefix + tag[len(old_prefix):]
+    
+    def _check_consistency(self, root, consistency: "ConsistencyChecker") -> List[str]:
+        """트리에서 이름/proto만 읽어 일관성 검사 (Python 검증기와 같이 루트 네임스페이스의 요소만)"""
+        namespace = etree.QName(root).namespace
+        ns = f"{{{namespace}}}" if namespace else ""
+        topic_tag = f"{ns}Topic"
+        scan = consistency.scan()
+        for app in root.iterchildren(f"{ns}Application"):
+            scan.add_topics(app.get("name", ""),
+                            [(topic.get("name", ""), topic.get("proto", "")) for topic in app.iterchildren(topic_tag)])
+        return scan.errors()
+    
+    def _translate(self, entry, root) -> List[str]:
+        """libxml2 오류를 Python 검증기의 오류 분류로 변환"""
+        message = entry.message
+        
+        # 루트 요소 불일치 (네임스페이스 불일치는 _schema_errors에서 처리)
+        if "No matching global declaration" in message:
+            if etree.QName(root).localname != "Applications":
+                return ["Root element 'Applications' is missing"]
+            return [f"Invalid namespace. Expected: {self.schema_namespace}"]
+        
+        prefix = self._path_to_prefix(entry.path)
+        attr_match = self._ATTRIBUTE_RE.search(message)
+        attr = attr_match.group(1) if attr_match else None
+        value_match = self._VALUE_RE.search(message)
+        value = value_match.group(1) if value_match else None
+        
+        if prefix is None:
+            # 루트 요소의 version 속성
+            if attr == "version":
+                return [f"Invalid version. Expected: {self.schema_version}"]
+            return [message]
+        
+        if "is required but missing" in message:
+            return [f"{prefix}: Missing '{attr}' attribute"]
+        
+        if attr == "direction" and "[facet 'enumeration']" in message:
+            errors = []
+            if value is not None and not value.strip():
+                errors.append(f"{prefix}: Empty 'direction' attribute")
+            errors.append(f"{prefix}: Invalid direction '{value}'. Must be 'publish' or 'subscribe'")
+            return errors
+        
+        if "[facet 'pattern']" in message and attr:
+            errors = []
+            if value is not None and not value.strip():
+                errors.append(f"{prefix}: Empty '{attr}' attribute")
+            # Python 검증기는 공백만 있는 proto도 확장자 오류로 보고 (빈 문자열은 제외)
+            if attr == "proto" and value:
+                errors.append(f"{prefix}: Proto file '{value}' should end with '.proto'")
+            if errors:
+                return errors
+        
+        if "This element is not expected" in message:
+            return [f"{prefix}: Unexpected element"]
+        
+        return [f"{prefix}: {message}"]
+    
+    def _path_to_prefix(self, path: Optional[str]) -> Optional[str]:
+        """'/*/*[2]/*[1]' (접두어가 있으면 '/ns0:Applications/ns0:Application[2]/...') 형태 경로를
+        'Application[1].Topic[0]'으로 변환"""
+        if not path:
+            return None
+        
+        steps = path.strip("/").split("/")[1:]
+        if not steps:
+            return None
+        
+        names = ("Application", "Topic")
+        parts = []
+        for depth, step in enumerate(steps[:2]):
+            match = self._PATH_INDEX_RE.search(step)
+            index = int(match.group(1)) - 1 if match and match.group(1) else 0
+            parts.append(f"{names[depth]}[{index}]")
+        return ".".join(parts)
+
+
+class ConsistencyChecker:
+    """응용프로그램 간 일관성 검사 (해시 인덱스 기반, 전체/증분 모드)"""
+    
+    def __init__(self):
+        # 증분 모드 인덱스
+        self._app_topics: Dict[str, Dict[str, str]] = {}              # 앱 → {토픽: proto}
+        self._app_duplicate_errors: Dict[str, tuple] = {}             # 앱 → 앱 내부 중복 토픽 오류
+        self._topic_protos: Dict[str, Dict[str, Dict[str, None]]] = {}  # 토픽 → {proto: {앱: None}}
+        self._conflict_errors: Dict[str, str] = {}                    # 토픽 → proto 충돌 오류
+        self._duplicate_app_errors: tuple = ()
+    
+    def check(self, data: dict) -> List[str]:
+        """전체 카탈로그를 한 번 순회하며 일관성 오류 수집"""
+        applications = data.get("Applications") or {}
+        apps = applications.get("Application") or []
+        if not isinstance(apps, list):
+            apps = [apps]
+        
+        scan = self.scan()
+        for app in apps:
+            scan.add(app)
+        return scan.errors()
+    
+    def scan(self) -> "ConsistencyScan":
+        """응용프로그램을 하나씩 넣는 전체 모드 검사 (스트리밍 검증용, check()와 같은 결과)"""
+        return ConsistencyScan(self)
+    
+    @staticmethod
+    def _topic_pairs(topics: List[dict]) -> List[Tuple[str, str]]:
+        """토픽 dict 목록 → (이름, proto) 목록"""
+        return [(topic.get("@name", ""), topic.get("@proto", "") or "") for topic in topics]
+    
+    def _index_topics(self, topics: Iterable[Tuple[str, str]], prefix: str) -> tuple[Dict[str, str], List[str]]:
+        """앱 하나의 (토픽명, proto) 목록으로 토픽 인덱스와 앱 내부 중복 토픽 오류 생성"""
+        topic_map: Dict[str, str] = {}
+        errors = []
+        for j, (topic_name, proto) in enumerate(topics):
+            if not topic_name:
+                continue
+            if topic_name in topic_map:
+                errors.append(f"{prefix}.Topic[{j}]: Duplicate topic '{topic_name}'")
+                continue
+            # 반복되는 토픽명/proto 문자열은 인덱스에서 하나만 유지
+            topic_map[sys.intern(topic_name)] = sys.intern(proto)
+        return topic_map, errors
+    
+    def _format_duplicate_name(self, name: str, indices: List[int]) -> str:
+        positions = ", ".join(f"Application[{i}]" for i in indices)
+        return f"Duplicate application name '{name}' ({positions})"
+    
+    def _format_conflict(self, topic_name: str, protos: Dict[str, Dict[str, None]]) -> str:
+        declarations = ", ".join(
+            f"{proto} ({', '.join(apps)})" for proto, apps in sorted(protos.items())
+        )
+        return f"Topic '{topic_name}' declared with conflicting proto values: {declarations}"
+    
+    # 증분 모드
+    
+    def update_application(self, app: dict, prefix: Optional[str] = None) -> bool:
+        """응용프로그램 하나의 인덱스 갱신, 오류가 바뀌었으면 True"""
+        name = app.get("@name", "")
+        topics = app.get("Topic") or []
+        if not isinstance(topics, list):
+            topics = [topics]
+        
+        topic_map, duplicate_errors = self._index_topics(self._topic_pairs(topics),
+                                                         prefix or f"Application[{name!r}]")
+        changed = self._app_duplicate_errors.get(name, ()) != tuple(duplicate_errors)
+        self._app_duplicate_errors[name] = tuple(duplicate_errors)
+        
+        old_map = self._app_topics.get(name, {})
+        if old_map == topic_map:
+            return changed
+        
+        touched = set()
+        for topic_name, proto in old_map.items():
+            if topic_map.get(topic_name) != proto:
+                self._unlink(topic_name, proto, name)
+                touched.add(topic_name)
+        for topic_name, proto in topic_map.items():
+            if old_map.get(topic_name) != proto:
+                self._topic_protos.setdefault(topic_name, {}).setdefault(proto, {})[name] = None
+                touched.add(topic_name)
+        self._app_topics[name] = topic_map
+        
+        return self._refresh_conflicts(touched) or changed
+    
+    def remove_application(self, name: str) -> bool:
+        """응용프로그램을 인덱스에서 제거, 오류가 바뀌었으면 True"""
+        changed = bool(self._app_duplicate_errors.pop(name, ()))
+        old_map = self._app_topics.pop(name, {})
+        for topic_name, proto in old_map.items():
+            self._unlink(topic_name, proto, name)
+        return self._refresh_conflicts(old_map.keys()) or changed
+    
+    def set_application_names(self, names: List[str]) -> bool:
+        """현재 응용프로그램 이름 목록으로 중복 이름 오류 갱신, 바뀌었으면 True"""
+        app_indices: Dict[str, List[int]] = {}
+        for i, name in enumerate(names):
+            app_indices.setdefault(name, []).append(i)
+        errors = tuple(
+            self._format_duplicate_name(name, indices)
+            for name, indices in app_indices.items() if len(indices) > 1
+        )
+        if errors == self._duplicate_app_errors:
+            return False
+        self._duplicate_app_errors = errors
+        return True
+    
+    def get_errors(self) -> List[str]:
+        """증분 모드의 현재 일관성 오류 (check()와 같은 순서: 중복 토픽, 중복 이름, proto 충돌)"""
+        errors = []
+        for duplicate_errors in self._app_duplicate_errors.values():
+            errors.extend(duplicate_errors)
+        errors.extend(self._duplicate_app_errors)
+        if self._conflict_errors:
+            # 토픽이 처음 선언된 순서
+            errors.extend(self._conflict_errors[topic_name] for topic_name in self._topic_protos
+                          if topic_name in self._conflict_errors)
+        return errors
+    
+    def _unlink(self, topic_name: str, proto: str, app_name: str):
+        protos = self._topic_protos.get(topic_name)
+        if not protos or proto not in protos:
+            return
+        protos[proto].pop(app_name, None)
+        if not protos[proto]:
+            del protos[proto]
+        if not protos:
+            del self._topic_protos[topic_name]
+    
+    def _refresh_conflicts(self, topic_names) -> bool:
+        changed = False
+        for topic_name in topic_names:
+            protos = self._topic_protos.get(topic_name)
+            error = self._format_conflict(topic_name, protos) if protos and len(protos) > 1 else None
+            if self._conflict_errors.get(topic_name) != error:
+                changed = True
+                if error is None:
+                    del self._conflict_errors[topic_name]
+                else:
+                    self._conflict_errors[topic_name] = error
+        return changed
+
+
+class ConsistencyScan:
+    """전체 모드 일관성 검사 상태 (선언 순서대로 add() 후 errors())"""
+    
+    def __init__(self, checker: ConsistencyChecker):
+        self._checker = checker
+        self._duplicate_topic_errors: List[str] = []
+        self._app_indices: Dict[str, List[int]] = {}
+        self._topic_protos: Dict[str, Dict[str, Dict[str, None]]] = {}
+        self._count = 0
+    
+    def add(self, app: dict):
+        """다음 응용프로그램 추가 (같은 이름이 다시 나와도 모두 검사)"""
+        topics = app.get("Topic") or []
+        if not isinstance(topics, list):
+            topics = [topics]
+        self.add_topics(app.get("@name", ""), self._checker._topic_pairs(topics))
+    
+    def add_topics(self, name: str, topics: Iterable[Tuple[str, str]]):
+        """다음 응용프로그램을 이름과 (토픽명, proto) 목록으로 추가 (dict를 만들지 않는 경로)"""
+        index = self._count
+        self._count += 1
+        self._app_indices.setdefault(name, []).append(index)
+        
+        topic_map, duplicate_errors = self._checker._index_topics(topics, f"Application[{index}]")
+        self._duplicate_topic_errors.extend(duplicate_errors)
+        for topic_name, proto in topic_map.items():
+            self._topic_protos.setdefault(topic_name, {}).setdefault(proto, {})[name] = None
+    
+    def errors(self) -> List[str]:
+        """지금까지 추가한 응용프로그램의 일관성 오류"""
+        errors = list(self._duplicate_topic_errors)
+        
+        for name, indices in self._app_indices.items():
+            if len(indices) > 1:
+                errors.append(self._checker._format_duplicate_name(name, indices))
+        
+        for topic_name, protos in self._topic_protos.items():
+            if len(protos) > 1:
+                errors.append(self._checker._format_conflict(topic_name, protos))
+        
+        return errors
+
+
+class IncrementalValidator:
+    """응용프로그램별 검증 결과를 유지하고 변경된 응용프로그램만 재검증"""
+    
+    def __init__(self, validator: Optional[XMLSchemaValidator] = None):
+        self.validator = validator or XMLSchemaValidator()
+        self.consistency = ConsistencyChecker()
+        self._root_errors: tuple = ()
+        self._app_errors: Dict[str, tuple] = {}
+        self._flat_errors: Optional[List[str]] = None
+        self.version = 0
+    
+    def reset(self, data: dict):
+        """전체 구조로 결과 초기화"""
+        self._app_errors.clear()
+        self.consistency = ConsistencyChecker()
+        applications = data.get("Applications")
+        if applications is None:
+            self._root_errors = ("Root element 'Applications' is missing",)
+        else:
+            self._root_errors = tuple(self.validator._validate_root_attributes(applications))
+            apps = applications.get("Application") or []
+            if not isinstance(apps, list):
+                apps = [apps]
+            for app in apps:
+                name = app.get("@name", "")
+                if name in self._app_errors:
+                    continue  # 같은 이름은 첫 번째 선언 기준 (중복은 이름 검사에서 보고)
+                self._app_errors[name] = self._validate(app, name)
+                self.consistency.update_application(app)
+            self.consistency.set_application_names([app.get("@name", "") for app in apps])
+        self._mark_changed()
+    
+    def update_root(self, applications: dict) -> bool:
+        """루트 속성 재검증, 결과가 바뀌었으면 True"""
+        errors = tuple(self.validator._validate_root_attributes(applications))
+        if errors == self._root_errors:
+            return False
+        self._root_errors = errors
+        self._mark_changed()
+        return True
+    
+    def update_application(self, app: dict) -> bool:
+        """응용프로그램 하나 재검증, 결과가 바뀌었으면 True"""
+        name = app.get("@name", "")
+        errors = self._validate(app, name)
+        consistency_changed = self.consistency.update_application(app)
+        if self._app_errors.get(name) == errors and name in self._app_errors and not consistency_changed:
+            return False
+        self._app_errors[name] = errors
+        self._mark_changed()
+        return True
+    
+    def remove_application(self, name: str) -> bool:
+        """응용프로그램 결과 제거, 제거되었으면 True"""
+        if name not in self._app_errors:
+            return False
+        del self._app_errors[name]
+        self.consistency.remove_application(name)
+        self._mark_changed()
+        return True
+    
+    def update_application_names(self, names: List[str]) -> bool:
+        """응용프로그램 이름 목록으로 중복 이름 검사, 결과가 바뀌었으면 True"""
+        if not self.consistency.set_application_names(names):
+            return False
+        self._mark_changed()
+        return True
+    
+    def known_applications(self) -> List[str]:
+        """결과를 보유 중인 응용프로그램 이름 목록"""
+        return list(self._app_errors)
+    
+    def get_errors(self) -> List[str]:
+        """현재 오류 전체 (변경이 없으면 이전 리스트 재사용)"""
+        if self._flat_errors is None:
+            flat = list(self._root_errors)
+            for errors in self._app_errors.values():
+                flat.extend(errors)
+            flat.extend(self.consistency.get_errors())
+            self._flat_errors = flat
+        return self._flat_errors
+    
+    def _validate(self, app: dict, name: str) -> tuple:
+        # 인덱스 대신 이름으로 위치를 표시해야 다른 응용프로그램 변경에 영향받지 않음
+        return tuple(self.validator._validate_application(app, 0, prefix=f"Application[{name!r}]"))
+    
+    def _mark_changed(self):
+        self._flat_errors = None
+        self.version += 1
+
+
+class StreamingValidator:
+    """iterparse 기반 대용량 카탈로그 스트리밍 검증 (응용프로그램 단위로 메모리 해제)"""
+    
+    def __init__(self, validator: Optional[XMLSchemaValidator] = None, check_consistency: bool = True):
+        self.validator = validator or XMLSchemaValidator()
+        self.check_consistency = check_consistency
+    
+    def iter_errors(self, source: Union[str, Path, IO[bytes]], fail_fast: bool = False) -> Iterator[str]:
+        """발견 즉시 오류를 하나씩 반환 (fail_fast면 첫 오류에서 중단)"""
+        for error in self._iter_errors(source):
+            yield error
+            if fail_fast:
+                return
+    
+    def _iter_errors(self, source) -> Iterator[str]:
+        if isinstance(source, Path):
+            source = str(source)
+        
+        # 전체 모드와 같은 검사기: 중복 이름인 응용프로그램도 모두 넣어 충돌까지 같은 결과
+        consistency = ConsistencyChecker().scan() if self.check_consistency else None
+        index = 0
+        root = None
+        topic_tag = "Topic"
+        
+        # Topic 이벤트는 C 레벨에서 걸러내고 루트/Application 이벤트만 받음
+        context = etree.iterparse(
+            source, events=("start", "end"), tag=("{*}Applications", "{*}Application"),
+            huge_tree=True, resolve_entities=False, no_network=True
+        )
+        
+        try:
+            for event, elem in context:
+                if root is None:
+                    if event != "start" or elem.getparent() is not None:
+                        break
+                    root = elem
+                    namespace = etree.QName(elem).namespace
+                    topic_tag = f"{{{namespace}}}Topic" if namespace else "Topic"
+                    yield from self.validator._validate_root_attributes({
+                        "@xmlns": namespace,
+                        "@version": elem.get("version")
+                    })
+                    continue
+                
+                if event != "end" or elem.getparent() is not root:
+                    continue
+                
+                # 루트 바로 아래 Application 처리 후 즉시 해제
+                if etree.QName(elem).localname == "Application":
+                    app = self._element_to_dict(elem, topic_tag)
+                    yield from self.validator._validate_application(app, index)
+                    
+                    if consistency is not None:
+                        consistency.add(app)
+                    index += 1
+                
+                elem.clear(keep_tail=False)
+                while elem.getprevious() is not None:
+                    del root[0]
+                    
+        except etree.XMLSyntaxError as e:
+            yield f"XML 파싱 실패: {e}"
+            return
+        
+        if root is None:
+            yield "Root element 'Applications' is missing"
+            return
+        
+        # 응용프로그램 간 충돌은 전체를 본 뒤에만 확정 가능 (python/xsd 모드와 같은 순서로 마지막에)
+        if consistency is not None:
+            yield from consistency.errors()
+    
+    def _element_to_dict(self, elem, topic_tag: str) -> dict:
+        """Application 요소를 xmltodict와 같은 형태의 dict로 변환"""
+        app = {"@" + key: value for key, value in elem.items()}
+        topics = [
+            {"@" + key: value for key, value in child.items()}
+            for child in elem.iterchildren(topic_tag)
+        ]
+        if topics:
+            app["Topic"] = topics
+        return app
+
+
+class CatalogParser:
+    """lxml 기반 카탈로그 전용 XML → dict 파서
+    
+    xmltodict와 같은 키 형식("@속성", "#text")을 쓰되 Application/Topic은
+    개수와 관계없이 항상 리스트로 반환한다. 반복되는 속성 키는 intern하여 공유한다.
+    """
+    
+    def __init__(self):
+        self._parser = etree.XMLParser(
+            resolve_entities=False, no_network=True, huge_tree=True, remove_comments=True
+        )
+        # 문자열은 이미 디코딩되어 있으므로 선언된 encoding을 무시하고 UTF-8로 해석
+        self._str_parser = etree.XMLParser(
+            resolve_entities=False, no_network=True, huge_tree=True, remove_comments=True,
+            encoding='utf-8'
+        )
+        self._keys: Dict[str, str] = {}
+        self._key_tuples: Dict[tuple, tuple] = {}
+    
+    def parse(self, xml: Union[str, bytes]) -> Optional[dict]:
+        """카탈로그 파싱 (루트가 Applications가 아니면 None)"""
+        if isinstance(xml, str):
+            root = etree.fromstring(xml.encode('utf-8'), self._str_parser)
+        else:
+            root = etree.fromstring(xml, self._parser)
+        
+        qname = etree.QName(root)
+        if qname.localname != "Applications":
+            return None
+        
+        # 태그 비교를 문자열 비교로 끝내기 위해 네임스페이스 포함 태그를 미리 계산
+        ns = f"{{{qname.namespace}}}" if qname.namespace else ""
+        app_tag = f"{ns}Application"
+        topic_tag = f"{ns}Topic"
+        
+        applications = self._attributes(root)
+        for prefix, uri in root.nsmap.items():
+            applications[self._key(f"xmlns:{prefix}" if prefix else "xmlns")] = uri
+        
+        apps = []
+        for child in root.iterchildren(tag=etree.Element):
+            if child.tag == app_tag:
+                apps.append(self._application(child, topic_tag))
+            else:
+                self._add_generic_child(applications, child)
+        applications["Application"] = apps
+        
+        return {"Applications": applications}
+    
+    def _key(self, name: str) -> str:
+        key = self._keys.get(name)
+        if key is None:
+            key = self._keys[name] = sys.intern(f"@{name}")
+        return key
+    
+    def _attributes(self, elem) -> dict:
+        # 속성 이름 조합별로 키 튜플을 캐시 (같은 조합이 반복되는 카탈로그에서 유리)
+        names = tuple(elem.keys())
+        keys = self._key_tuples.get(names)
+        if keys is None:
+            keys = self._key_tuples[names] = tuple(self._key(name) for name in names)
+        return dict(zip(keys, elem.values()))
+    
+    def _application(self, elem, topic_tag: str) -> dict:
+        app = self._attributes(elem)
+        topics = []
+        for child in elem.iterchildren(tag=etree.Element):
+            if child.tag == topic_tag:
+                topic = self._attributes(child)
+                if len(child) or (child.text and child.text.strip()):
+                    self._add_content(topic, child)
+                topics.append(topic)
+            else:
+                self._add_generic_child(app, child)
+        app["Topic"] = topics
+        return app
+    
+    def _add_generic_child(self, parent: dict, elem):
+        """스키마 밖의 요소도 잃지 않도록 리스트 형태로 보존"""
+        node = self._attributes(elem)
+        self._add_content(node, elem)
+        parent.setdefault(etree.QName(elem).localname, []).append(node)
+    
+    def _add_content(self, node: dict, elem):
+        if elem.text and elem.text.strip():
+            node["#text"] = elem.text.strip()
+        for child in elem.iterchildren(tag=etree.Element):
+            self._add_generic_child(node, child)
+
+
 class XMLProcessor:
     """고급 XML 처리 클래스"""
     
     def __init__(self):
         self.validator = XMLSchemaValidator()
+        self.catalog_parser = CatalogParser()
     
     def dict_to_xml(self, data: dict, pretty_print: bool = True) -> str:
         """Python dict를 XML 문자열로 변환"""
         try:
-            # lxml 사용한 고품질 XML 생성
+            # lxml 사용한 고품질 XML 생성 (들여쓰기도 lxml이 직접 처리)
             root = self._build_xml_element(data)
             
             if pretty_print:
-                # 예쁘게 포맷팅
-                rough_string = etree.tostring(root, encoding='unicode')
-                reparsed = minidom.parseString(rough_string)
-                return reparsed.toprettyxml(indent="  ")[23:]  # XML 선언 제거
+                etree.indent(root, space="  ")
+                return etree.tostring(root, encoding='unicode', pretty_print=True)
             else:
                 return etree.tostring(root, encoding='unicode')
                 
         except Exception as e:
             raise ValueError(f"XML 변환 실패: {e}")
     
+    def format_xml(self, xml_content: Union[str, bytes]) -> str:
+        """카탈로그 XML을 저장 형식으로 정규화 (서버 저장과 CLI normalize가 공유하는 직렬화)
+        
+        XML 선언(UTF-8) + 두 칸 들여쓰기 + 끝 줄바꿈, 파싱할 수 없으면 ValueError
+        """
+        return XML_DECLARATION.decode() + self.dict_to_xml(self.xml_to_dict(xml_content))
+    
+    def write_xml_stream(self, data: dict, target: Union[str, Path, IO[bytes]],
+                         pretty_print: bool = True, xml_declaration: bool = True):
+        """dict를 요소 단위로 직렬화해 파일/소켓 등에 바로 기록 (전체 트리를 만들지 않음)"""
+        if isinstance(target, (str, Path)):
+            with open(target, 'wb') as f:
+                self.write_xml_stream(data, f, pretty_print, xml_declaration)
+            return
+        
+        root_name = next((key for key in data if not key.startswith('@')), None)
+        if root_name is None:
+            raise ValueError("XML 변환 실패: 루트 요소가 없습니다")
+        root_value = data[root_name]
+        
+        if xml_declaration:
+            target.write(XML_DECLARATION)
+        
+        if not isinstance(root_value, dict) or not any(
+                value != [] for key, value in root_value.items() if not key.startswith('@')):
+            # 자식이 없는 루트는 <Applications .../> 형태로 한 번에 기록
+            root = self._build_xml_element({root_name: root_value})
+            target.write(etree.tostring(root, encoding='utf-8'))
+            if pretty_print:
+                target.write(b"\n")
+            return
+        
+        attrs = {key[1:]: str(value) for key, value in self._xmlns_first(root_value).items() if key.startswith('@')}
+        newline = "\n" if pretty_print else ""
+        
+        with etree.xmlfile(target, encoding='utf-8') as xf:
+            with xf.element(root_name, attrs):
+                for key, value in root_value.items():
+                    if key.startswith('@'):
+                        continue
+                    items = value if isinstance(value, list) else [value]
+                    for item in items:
+                        # 자식 하나씩 작은 트리로 만들어 기록하고 바로 버림
+                        child = etree.Element(key)
+                        self._add_attributes_and_children(child, item)
+                        if pretty_print:
+                            etree.indent(child, space="  ", level=1)
+                            xf.write(newline + "  ")
+                        xf.write(child)
+                xf.write(newline)
+        
+        if pretty_print:
+            target.write(b"\n")
+    
     def _build_xml_element(self, data: dict, parent=None) -> Element:
         """재귀적으로 XML 요소 생성"""
         if parent is None:
@@ -157,11 +854,18 @@ class XMLProcessor:
             for key, value in data.items():
                 if not key.startswith('@'):
                     root = etree.Element(key)
-                    self._add_attributes_and_children(root, value)
+                    self._add_attributes_and_children(root, self._xmlns_first(value))
                     return root
         
         return parent
     
+    @staticmethod
+    def _xmlns_first(value):
+        """루트의 xmlns 속성을 맨 앞으로 (기존 저장 파일과 같은 속성 순서 유지)"""
+        if isinstance(value, dict) and '@xmlns' in value:
+            return {'@xmlns': value['@xmlns'], **{k: v for k, v in value.items() if k != '@xmlns'}}
+        return value
+    
     def _add_attributes_and_children(self, element: Element, data: Union[dict, list, str]):
         """요소에 속성과 자식 추가"""
         if isinstance(data, dict):
@@ -188,10 +892,21 @@ class XMLProcessor:
         elif isinstance(data, str):
             element.text = data
     
-    def xml_to_dict(self, xml_string: str) -> dict:
-        """XML 문자열을 Python dict로 변환"""
+    def xml_to_dict(self, xml_string: Union[str, bytes], parser: str = "lxml") -> dict:
+        """XML 문자열을 Python dict로 변환
+        
+        parser="lxml"은 카탈로그 전용 파서(항상 리스트), 카탈로그가 아니거나
+        parser="xmltodict"이면 기존 xmltodict 변환을 사용한다.
+        """
         try:
-            # xmltodict 사용하여 변환
+            if parser == "lxml":
+                result = self.catalog_parser.parse(xml_string)
+                if result is not None:
+                    return result
+            elif parser != "xmltodict":
+                raise ValueError(f"지원하지 않는 파서: {parser}")
+            
+            # xmltodict 사용하여 변환 (호환 경로)
             result = xmltodict.parse(xml_string)
             return result
         except Exception as e:
@@ -213,34 +928,197 @@ class XMLProcessor:
             return False, "", [f"XML 변환 실패: {e}"]
 
 
+class CompactExporter:
+    """카탈로그를 압축 포맷(JSON/MessagePack/CBOR)으로 인코딩하고 문서 버전별로 캐시"""
+    
+    MEDIA_TYPES = {
+        "json": "application/json",
+        "msgpack": "application/msgpack",
+        "cbor": "application/cbor"
+    }
+    
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 같은 버전에 동시 요청이 몰려도 인코딩은 한 번만 수행
+        self._encode_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    @staticmethod
+    def available_formats() -> List[str]:
+        """현재 환경에서 사용 가능한 포맷 목록"""
+        formats = ["json"]
+        if msgpack is not None:
+            formats.append("msgpack")
+        if cbor2 is not None:
+            formats.append("cbor")
+        return formats
+    
+    @staticmethod
+    def _sorted(value):
+        """키를 정렬한 사본 (같은 내용이면 항상 같은 바이트)"""
+        if isinstance(value, dict):
+            return {key: CompactExporter._sorted(value[key]) for key in sorted(value)}
+        if isinstance(value, list):
+            return [CompactExporter._sorted(item) for item in value]
+        return value
+    
+    def encode(self, structure: dict, fmt: str) -> bytes:
+        """구조를 지정 포맷으로 인코딩 (캐시 없음)"""
+        if fmt == "json":
+            # 정규화된 최소 JSON: 키 정렬, 공백 없음, UTF-8 그대로
+            return json.dumps(structure, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode('utf-8')
+        if fmt == "msgpack" and msgpack is not None:
+            return msgpack.packb(self._sorted(structure), use_bin_type=True)
+        if fmt == "cbor" and cbor2 is not None:
+            return cbor2.dumps(structure, canonical=True)
+        raise ValueError(f"지원하지 않는 내보내기 포맷: {fmt}")
+    
+    def get_cached(self, fmt: str, version: Hashable) -> Optional[bytes]:
+        """캐시된 인코딩 조회 (없으면 None)"""
+        with self._lock:
+            data = self._cache.get((version, fmt))
+            if data is not None:
+                self._cache.move_to_end((version, fmt))
+                self._hits += 1
+            return data
+    
+    def export(self, structure: Union[dict, Callable[[], dict]], fmt: str,
+               version: Optional[Hashable] = None) -> bytes:
+        """인코딩 결과 반환 (version이 주어지면 캐시, structure는 dict 또는 로더 함수)"""
+        if fmt not in self.available_formats():
+            raise ValueError(f"지원하지 않는 내보내기 포맷: {fmt}")
+        
+        if version is None:
+            return self.encode(structure() if callable(structure) else structure, fmt)
+        
+        data = self.get_cached(fmt, version)
+        if data is not None:
+            return data
+        
+        with self._encode_lock:
+            # 대기 중 다른 요청이 이미 인코딩했을 수 있음
+            data = self.get_cached(fmt, version)
+            if data is not None:
+                return data
+            
+            data = self.encode(structure() if callable(structure) else structure, fmt)
+            with self._lock:
+                self._misses += 1
+                self._cache[(version, fmt)] = data
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+            return data
+    
+    def get_cache_info(self) -> Dict[str, int]:
+        """캐시 통계"""
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "max_entries": self.max_entries,
+                "bytes": sum(len(data) for data in self._cache.values()),
+                "hits": self._hits,
+                "misses": self._misses
+            }
+
+
 class CodeGenerator:
-    """다중 언어 코드 생성기"""
+    """다중 언어 코드 생성기 (모든 언어를 템플릿 엔진으로 렌더링)"""
     
     def __init__(self):
         self.xml_processor = XMLProcessor()
+        self.template_engine = TemplateEngine()
     
     def generate_code(self, 
                      structure: dict, 
                      language: str, 
                      app_name: str = "all",
                      include_comments: bool = True,
-                     include_examples: bool = True) -> str:
-        """지정된 언어로 코드 생성"""
-        
-        generators = {
-            "python": self._generate_python_code,
-            "cpp": self._generate_cpp_code,
-            "java": self._generate_java_code,
-            "csharp": self._generate_csharp_code,
-            "go": self._generate_go_code,
-            "rust": self._generate_rust_code
-        }
+                     include_examples: bool = True,
+                     deterministic: bool = False,
+                     use_cache: bool = True,
+                     serialization: str = "json",
+                     multiplex_publishers: bool = False,
+                     endpoint_plan: Optional[dict] = None) -> str:
+        """지정된 언어로 코드 생성
         
-        if language not in generators:
+        deterministic이면 생성 시각을 넣지 않아 같은 입력에 항상 같은 출력,
+        serialization은 python 메시지 형식 (json | protobuf | raw),
+        포트는 카탈로그 전체 엔드포인트 계획으로 배정 (endpoint_plan: 포트를 유지할 이전 계획)
+        """
+        
+        if not self.template_engine.supports(language):
             raise ValueError(f"지원하지 않는 언어: {language}")
+        if serialization not in SERIALIZATIONS:
+            raise ValueError(f"지원하지 않는 직렬화 방식: {serialization}")
         
         applications = self._filter_applications(structure, app_name)
-        return generators[language](applications, include_comments, include_examples)
+        
+        # 응용프로그램 하나만 생성해도 포트는 전체 카탈로그 기준
+        plan = self.plan_endpoints(structure, multiplex_publishers, previous=endpoint_plan)
+        options = {
+            "include_comments": include_comments,
+            "include_examples": include_examples,
+            "serialization": serialization,
+            "multiplex_publishers": multiplex_publishers,
+            "generated_at": None if deterministic else datetime.now().isoformat()
+        }
+        return self.template_engine.render(language, applications, options,
+                                           use_cache=use_cache, endpoints=plan["applications"])
+    
+    def project_files(self, language: str, include_comments: bool = True,
+                      deterministic: bool = False) -> Dict[str, str]:
+        """생성 코드 옆에 둘 빌드 파일 (예: cpp → CMakeLists.txt, 없는 언어는 빈 dict)"""
+        if not self.template_engine.supports(language):
+            return {}
+        options = {
+            "include_comments": include_comments,
+            "generated_at": None if deterministic else datetime.now().isoformat()
+        }
+        return self.template_engine.render_project_files(language, options)
+    
+    def generate_benchmarks(self,
+                            structure: dict,
+                            app_name: str = "all",
+                            include_comments: bool = True,
+                            deterministic: bool = False,
+                            multiplex_publishers: bool = False,
+                            endpoint_plan: Optional[dict] = None) -> Dict[str, str]:
+        """응용프로그램별 벤치마크 프로그램 (파일 이름 → 코드, 예: camera_benchmark.py)
+        
+        대상 언어와 무관한 pyzmq 프로그램으로, 토픽마다 inproc/ipc 발행-구독 쌍을 세우고
+        페이로드 크기/전송률별 처리량과 p50/p99/p999 지연을 JSON 한 줄씩 출력한다.
+        구독 토픽의 발행자 수(fan-in)는 엔드포인트 계획을 따른다.
+        """
+        by_name: Dict[str, dict] = {}
+        for app in self._filter_applications(structure, app_name):
+            by_name.setdefault(app.get("@name", "Unknown"), app)
+        
+        plan = self.plan_endpoints(structure, multiplex_publishers, previous=endpoint_plan)
+        options = {
+            "include_comments": include_comments,
+            "multiplex_publishers": multiplex_publishers,
+            "generated_at": None if deterministic else datetime.now().isoformat()
+        }
+        files = assign_file_names(list(by_name), BENCHMARK_SUFFIX)
+        return {files[name]: self.template_engine.render_benchmark(app, options, plan["applications"].get(name))
+                for name, app in by_name.items()}
+    
+    def plan_endpoints(self, structure: dict, multiplex_publishers: bool = False,
+                       previous: Optional[dict] = None) -> Dict[str, Any]:
+        """카탈로그 전체 엔드포인트 계획 (previous의 포트 배정은 가능한 한 유지)"""
+        base_port = (previous or {}).get("base_port", DEFAULT_BASE_PORT)
+        return plan_endpoints(structure, multiplex_publishers, base_port, previous)
+    
+    def get_cache_info(self) -> Dict[str, Any]:
+        """생성 코드 캐시 통계"""
+        return self.template_engine.cache.get_info()
+    
+    def clear_cache(self):
+        """생성 코드 캐시 비우기"""
+        self.template_engine.cache.clear()
     
     def _filter_applications(self, structure: dict, app_name: str) -> List[dict]:
         """필터링된 응용프로그램 목록 반환"""
@@ -256,457 +1134,9 @@ class CodeGenerator:
         
         return [app for app in apps if app.get("@name") == app_name]
     
-    def _generate_python_code(self, applications: List[dict], include_comments: bool, include_examples: bool) -> str:
-        """Python 코드 생성 (향상된 버전)"""
-        code = []
-        
-        if include_comments:
-            code.extend([
-                '"""',
-                'Auto-generated ZeroMQ Topic Manager Code (Python)',
-                f'Generated at: {datetime.now().isoformat()}',
-                'Features: Type hints, async/await, error handling',
-                '"""',
-                '',
-                'import zmq',
-                'import zmq.asyncio',
-                'import asyncio',
-                'import json',
-                'import logging',
-                'from typing import Optional, Callable, Any',
-                'from dataclasses import dataclass',
-                'from datetime import datetime',
-                '',
-                '# 로깅 설정',
-                'logging.basicConfig(level=logging.INFO)',
-                'logger = logging.getLogger(__name__)',
-                '',
-            ])
-        else:
-            code.extend([
-                'import zmq',
-                'import zmq.asyncio',
-                'import asyncio',
-                'import json',
-                'from typing import Optional, Callable, Any',
-                '',
-            ])
-        
-        # 각 응용프로그램별 클래스 생성
-        for app in applications:
-            app_name = app.get("@name", "Unknown")
-            app_description = app.get("@description", "")
-            
-            if include_comments:
-                code.extend([
-                    f'@dataclass',
-                    f'class {self._to_pascal_case(app_name)}Config:',
-                    f'    """Configuration for {app_name}"""',
-                    f'    host: str = "localhost"',
-                    f'    base_port: int = 5555',
-                    f'    timeout: int = 1000',
-                    '',
-                ])
-            
-            if include_comments:
-                code.extend([
-                    f'class {self._to_pascal_case(app_name)}:',
-                    f'    """',
-                    f'    {app_name} - ZeroMQ Topic Manager',
-                    f'    Description: {app_description}',
-                    f'    """',
-                    '',
-                ])
-            else:
-                code.extend([
-                    f'class {self._to_pascal_case(app_name)}:',
-                    '',
-                ])
-            
-            # 초기화 메서드
-            code.extend([
-                f'    def __init__(self, config: Optional[{self._to_pascal_case(app_name)}Config] = None):',
-                f'        self.config = config or {self._to_pascal_case(app_name)}Config()',
-                f'        self.context = zmq.asyncio.Context()',
-                f'        self.sockets = {{}}',
-                f'        self.running = False',
-                f'        self.message_handlers: dict[str, Callable] = {{}}',
-                '',
-            ])
-            
-            # 소켓 초기화
-            if "Topic" in app:
-                topics = app["Topic"]
-                if not isinstance(topics, list):
-                    topics = [topics]
-                
-                code.extend([
-                    f'    async def initialize(self):',
-                    f'        """Initialize all sockets"""',
-                    f'        try:',
-                ])
-                
-                for i, topic in enumerate(topics):
-                    topic_name = topic.get("@name", f"topic_{i}")
-                    direction = topic.get("@direction", "subscribe")
-                    proto = topic.get("@proto", "")
-                    
-                    socket_type = "zmq.PUB" if direction == "publish" else "zmq.SUB"
-                    port = f"self.config.base_port + {i}"
-                    
-                    if include_comments:
-                        code.extend([
-                            f'            # {topic_name} ({direction}) - {proto}',
-                        ])
-                    
-                    code.extend([
-                        f'            self.sockets["{topic_name}"] = self.context.socket({socket_type})',
-                    ])
-                    
-                    if direction == "publish":
-                        code.extend([
-                            f'            self.sockets["{topic_name}"].bind(f"tcp://{{self.config.host}}:{{' + port + '}}")',
-                        ])
-                    else:
-                        code.extend([
-                            f'            self.sockets["{topic_name}"].connect(f"tcp://{{self.config.host}}:{{' + port + '}}")',
-                            f'            self.sockets["{topic_name}"].setsockopt(zmq.SUBSCRIBE, b"")',
-                        ])
-                
-                code.extend([
-                    f'            self.running = True',
-                    f'            logger.info(f"{app_name} initialized successfully")',
-                    f'        except Exception as e:',
-                    f'            logger.error(f"Failed to initialize {app_name}: {{e}}")',
-                    f'            raise',
-                    '',
-                ])
-                
-                # 메시지 처리 메서드들
-                for topic in topics:
-                    topic_name = topic.get("@name", "")
-                    direction = topic.get("@direction", "subscribe")
-                    description = topic.get("@description", "")
-                    
-                    if direction == "publish":
-                        code.extend([
-                            f'    async def publish_{topic_name.lower()}(self, data: Any, topic: str = ""):',
-                            f'        """Publish to {topic_name}',
-                            f'        Description: {description}"""',
-                            f'        try:',
-                            f'            message = json.dumps({{',
-                            f'                "topic": topic,',
-                            f'                "data": data,',
-                            f'                "timestamp": datetime.now().isoformat()',
-                            f'            }})',
-                            f'            await self.sockets["{topic_name}"].send_string(message)',
-                            f'            logger.debug(f"Published to {topic_name}: {{message}}")',
-                            f'        except Exception as e:',
-                            f'            logger.error(f"Failed to publish to {topic_name}: {{e}}")',
-                            f'            raise',
-                            '',
-                        ])
-                    else:
-                        code.extend([
-                            f'    async def receive_{topic_name.lower()}(self) -> Optional[dict]:',
-                            f'        """Receive from {topic_name}',
-                            f'        Description: {description}"""',
-                            f'        try:',
-                            f'            message = await self.sockets["{topic_name}"].recv_string(zmq.NOBLOCK)',
-                            f'            data = json.loads(message)',
-                            f'            logger.debug(f"Received from {topic_name}: {{data}}")',
-                            f'            return data',
-                            f'        except zmq.Again:',
-                            f'            return None',
-                            f'        except Exception as e:',
-                            f'            logger.error(f"Failed to receive from {topic_name}: {{e}}")',
-                            f'            return None',
-                            '',
-                        ])
-                
-                # 메시지 핸들러 등록
-                code.extend([
-                    f'    def set_message_handler(self, topic: str, handler: Callable[[dict], None]):',
-                    f'        """Set message handler for specific topic"""',
-                    f'        self.message_handlers[topic] = handler',
-                    '',
-                    f'    async def start_listening(self):',
-                    f'        """Start listening for messages"""',
-                    f'        while self.running:',
-                    f'            try:',
-                ])
-                
-                # 모든 subscribe 토픽에 대해 리스닝
-                for topic in topics:
-                    if topic.get("@direction") == "subscribe":
-                        topic_name = topic.get("@name", "")
-                        code.extend([
-                            f'                # Listen to {topic_name}',
-                            f'                data = await self.receive_{topic_name.lower()}()',
-                            f'                if data and "{topic_name}" in self.message_handlers:',
-                            f'                    await self.message_handlers["{topic_name}"](data)',
-                        ])
-                
-                code.extend([
-                    f'                await asyncio.sleep(0.01)  # Small delay to prevent busy loop',
-                    f'            except Exception as e:',
-                    f'                logger.error(f"Error in message loop: {{e}}")',
-                    f'                await asyncio.sleep(1)',
-                    '',
-                ])
-            
-            # 정리 메서드
-            code.extend([
-                f'    async def close(self):',
-                f'        """Clean up resources"""',
-                f'        self.running = False',
-                f'        for socket in self.sockets.values():',
-                f'            socket.close()',
-                f'        self.context.term()',
-                f'        logger.info(f"{app_name} closed")',
-                '',
-                f'    async def __aenter__(self):',
-                f'        await self.initialize()',
-                f'        return self',
-                '',
-                f'    async def __aexit__(self, exc_type, exc_val, exc_tb):',
-                f'        await self.close()',
-                '',
-            ])
-        
-        # 사용 예제
-        if include_examples:
-            code.extend([
-                '',
-                '# Usage Example',
-                'async def main():',
-                '    """Example usage"""',
-            ])
-            
-            for app in applications:
-                app_name = app.get("@name", "Unknown")
-                class_name = self._to_pascal_case(app_name)
-                
-                code.extend([
-                    f'    # {app_name} example',
-                    f'    async with {class_name}() as {app_name.lower()}:',
-                ])
-                
-                # 예제 핸들러
-                if "Topic" in app:
-                    topics = app["Topic"]
-                    if not isinstance(topics, list):
-                        topics = [topics]
-                    
-                    for topic in topics:
-                        if topic.get("@direction") == "subscribe":
-                            topic_name = topic.get("@name", "")
-                            code.extend([
-                                f'        # Set handler for {topic_name}',
-                                f'        {app_name.lower()}.set_message_handler("{topic_name}", ',
-                                f'            lambda data: print(f"Received: {{data}}"))',
-                            ])
-                
-                code.extend([
-                    f'        ',
-                    f'        # Start background listening',
-                    f'        listening_task = asyncio.create_task({app_name.lower()}.start_listening())',
-                    f'        ',
-                ])
-                
-                # Publish 예제
-                if "Topic" in app:
-                    for topic in topics:
-                        if topic.get("@direction") == "publish":
-                            topic_name = topic.get("@name", "")
-                            code.extend([
-                                f'        # Publish example',
-                                f'        await {app_name.lower()}.publish_{topic_name.lower()}(',
-                                f'            {{"message": "Hello from {app_name}!"}}, topic="example")',
-                            ])
-                
-                code.extend([
-                    f'        ',
-                    f'        # Run for a while',
-                    f'        await asyncio.sleep(5)',
-                    f'        ',
-                    f'        # Stop listening',
-                    f'        listening_task.cancel()',
-                    '',
-                ])
-            
-            code.extend([
-                '',
-                'if __name__ == "__main__":',
-                '    asyncio.run(main())',
-            ])
-        
-        return '\n'.join(code)
-    
-    def _generate_cpp_code(self, applications: List[dict], include_comments: bool, include_examples: bool) -> str:
-        """C++ 코드 생성 (기존 로직 유지)"""
-        # 기존 C++ 생성 로직 (향상 가능)
-        code = []
-        
-        if include_comments:
-            code.extend([
-                "// Auto-generated ZeroMQ Topic Manager Code (C++)",
-                f"// Generated at: {datetime.now().isoformat()}",
-                "",
-                "#include <zmq.hpp>",
-                "#include <string>",
-                "#include <iostream>",
-                "#include <thread>",
-                "#include <chrono>",
-                "#include <functional>",
-                "#include <memory>",
-                "",
-            ])
-        else:
-            code.extend([
-                "#include <zmq.hpp>",
-                "#include <string>",
-                "#include <iostream>",
-                "",
-            ])
-        
-        # 응용프로그램별 클래스 생성
-        for app in applications:
-            app_name = app.get("@name", "Unknown")
-            class_name = self._to_pascal_case(app_name)
-            
-            if include_comments:
-                code.extend([
-                    f"// {app_name} - {app.get('@description', '')}",
-                    f"class {class_name} {{",
-                    "private:",
-                    "    zmq::context_t context;",
-                ])
-            else:
-                code.extend([
-                    f"class {class_name} {{",
-                    "private:",
-                    "    zmq::context_t context;",
-                ])
-            
-            # 소켓 선언
-            if "Topic" in app:
-                topics = app["Topic"]
-                if not isinstance(topics, list):
-                    topics = [topics]
-                
-                for topic in topics:
-                    topic_name = topic.get("@name", "")
-                    code.append(f"    zmq::socket_t {topic_name.lower()}_socket;")
-            
-            code.extend([
-                "",
-                "public:",
-                f"    {class_name}() : context(1)",
-            ])
-            
-            # 소켓 초기화
-            if "Topic" in app:
-                for i, topic in enumerate(topics):
-                    topic_name = topic.get("@name", "")
-                    direction = topic.get("@direction", "subscribe")
-                    socket_type = "ZMQ_PUB" if direction == "publish" else "ZMQ_SUB"
-                    
-                    if i == 0:
-                        code.append(f"        , {topic_name.lower()}_socket(context, {socket_type})")
-                    else:
-                        code.append(f"        , {topic_name.lower()}_socket(context, {socket_type})")
-            
-            code.extend([
-                "    {",
-                "        // TODO: Configure socket connections",
-                "    }",
-                "",
-            ])
-            
-            # 메서드 생성
-            if "Topic" in app:
-                for topic in topics:
-                    topic_name = topic.get("@name", "")
-                    direction = topic.get("@direction", "subscribe")
-                    
-                    if include_comments:
-                        code.extend([
-                            f"    // {topic_name} ({direction}) - {topic.get('@proto', '')}",
-                        ])
-                    
-                    if direction == "publish":
-                        code.extend([
-                            f"    void publish_{topic_name.lower()}(const std::string& data) {{",
-                            f"        zmq::message_t message(data.size());",
-                            f"        memcpy(message.data(), data.c_str(), data.size());",
-                            f"        {topic_name.lower()}_socket.send(message, zmq::send_flags::dontwait);",
-                            f"    }}",
-                            "",
-                        ])
-                    else:
-                        code.extend([
-                            f"    std::string receive_{topic_name.lower()}() {{",
-                            f"        zmq::message_t message;",
-                            f"        auto result = {topic_name.lower()}_socket.recv(message, zmq::recv_flags::dontwait);",
-                            f"        if (result) {{",
-                            f"            return std::string(static_cast<char*>(message.data()), message.size());",
-                            f"        }}",
-                            f"        return \"\";",
-                            f"    }}",
-                            "",
-                        ])
-            
-            code.extend([
-                "};",
-                "",
-            ])
-        
-        # 사용 예제
-        if include_examples:
-            code.extend([
-                "// Usage Example",
-                "int main() {",
-            ])
-            
-            for app in applications:
-                app_name = app.get("@name", "Unknown")
-                class_name = self._to_pascal_case(app_name)
-                code.append(f"    {class_name} {app_name.lower()};")
-            
-            code.extend([
-                "    ",
-                "    // TODO: Implement your logic here",
-                "    ",
-                "    return 0;",
-                "}",
-            ])
-        
-        return '\n'.join(code)
-    
-    def _generate_java_code(self, applications: List[dict], include_comments: bool, include_examples: bool) -> str:
-        """Java 코드 생성"""
-        # Java 코드 생성 로직
-        return "// Java code generation not yet implemented"
-    
-    def _generate_csharp_code(self, applications: List[dict], include_comments: bool, include_examples: bool) -> str:
-        """C# 코드 생성"""
-        # C# 코드 생성 로직
-        return "// C# code generation not yet implemented"
-    
-    def _generate_go_code(self, applications: List[dict], include_comments: bool, include_examples: bool) -> str:
-        """Go 코드 생성"""
-        # Go 코드 생성 로직
-        return "// Go code generation not yet implemented"
-    
-    def _generate_rust_code(self, applications: List[dict], include_comments: bool, include_examples: bool) -> str:
-        """Rust 코드 생성"""
-        # Rust 코드 생성 로직
-        return "// Rust code generation not yet implemented"
-    
     def _to_pascal_case(self, text: str) -> str:
         """문자열을 PascalCase로 변환"""
-        return ''.join(word.capitalize() for word in text.replace('_', ' ').replace('-', ' ').split())
+        return to_pascal_case(text)
     
     def _to_snake_case(self, text: str) -> str:
         """문자열을 snake_case로 변환"""
@@ -722,6 +1152,9 @@ class XMLSchemaManager:
         self.processor = XMLProcessor()
         self.validator = XMLSchemaValidator()
         self.code_generator = CodeGenerator()
+        self.consistency_checker = ConsistencyChecker()
+        self.exporter = CompactExporter()
+        self._xsd_validator: Optional[XSDSchemaValidator] = None
     
     def create_default_structure(self) -> dict:
         """기본 XML 구조 생성"""
@@ -764,17 +1197,79 @@ class XMLSchemaManager:
         """XML 문자열로 내보내기"""
         return self.processor.dict_to_xml(structure, pretty_print)
     
-    def import_xml(self, xml_string: str) -> dict:
+    def export_xml_stream(self, structure: dict, target: Union[str, Path, IO[bytes]], pretty_print: bool = True):
+        """대용량 구조를 파일/스트림에 점진적으로 내보내기"""
+        self.processor.write_xml_stream(structure, target, pretty_print)
+    
+    def export_compact(self, structure: Union[dict, Callable[[], dict]], fmt: str = "json",
+                       version: Optional[Hashable] = None) -> bytes:
+        """압축 포맷(json/msgpack/cbor)으로 내보내기 (version별 캐시)"""
+        return self.exporter.export(structure, fmt, version)
+    
+    def get_cached_export(self, fmt: str, version: Hashable) -> Optional[bytes]:
+        """캐시된 압축 포맷 조회 (구조 변환 없이)"""
+        return self.exporter.get_cached(fmt, version)
+    
+    def available_export_formats(self) -> List[str]:
+        """사용 가능한 압축 포맷 목록"""
+        return self.exporter.available_formats()
+    
+    def import_xml(self, xml_string: Union[str, bytes], parser: str = "lxml") -> dict:
         """XML 문자열에서 가져오기"""
-        return self.processor.xml_to_dict(xml_string)
+        return self.processor.xml_to_dict(xml_string, parser=parser)
     
     def generate_code(self, structure: dict, **kwargs) -> str:
         """코드 생성"""
         return self.code_generator.generate_code(structure, **kwargs)
     
-    def validate(self, structure: dict) -> tuple[bool, List[str]]:
-        """구조 검증"""
+    def plan_endpoints(self, structure: dict, **kwargs) -> Dict[str, Any]:
+        """생성 코드의 엔드포인트 계획"""
+        return self.code_generator.plan_endpoints(structure, **kwargs)
+    
+    def project_files(self, language: str, **kwargs) -> Dict[str, str]:
+        """생성 코드의 빌드 파일"""
+        return self.code_generator.project_files(language, **kwargs)
+    
+    def generate_benchmarks(self, structure: dict, **kwargs) -> Dict[str, str]:
+        """응용프로그램별 벤치마크 프로그램"""
+        return self.code_generator.generate_benchmarks(structure, **kwargs)
+    
+    def get_codegen_cache_info(self) -> Dict[str, Any]:
+        """코드 생성 캐시 통계"""
+        return self.code_generator.get_cache_info()
+    
+    def validate(self, structure: dict, check_consistency: bool = True) -> tuple[bool, List[str]]:
+        """구조 검증 (응용프로그램 간 일관성 검사 포함)"""
         errors = self.validator.validate_structure(structure)
+        if check_consistency and "Applications" in structure:
+            errors.extend(self.consistency_checker.check(structure))
+        return len(errors) == 0, errors
+    
+    def iter_validation_errors(self, source: Union[str, Path, IO[bytes]], fail_fast: bool = False) -> Iterator[str]:
+        """파일/스트림을 메모리에 올리지 않고 검증 오류를 순차 반환"""
+        return StreamingValidator(self.validator).iter_errors(source, fail_fast=fail_fast)
+    
+    def validate_file(self, source: Union[str, Path, IO[bytes]], fail_fast: bool = False) -> tuple[bool, List[str]]:
+        """대용량 파일 스트리밍 검증"""
+        errors = list(self.iter_validation_errors(source, fail_fast=fail_fast))
+        return len(errors) == 0, errors
+    
+    def validate_xml(self, xml: Union[str, bytes], mode: str = "xsd") -> tuple[bool, List[str]]:
+        """원본 XML 검증 (mode: "xsd"는 컴파일된 스키마, "python"은 dict 기반 검증기)"""
+        if mode == "xsd":
+            if self._xsd_validator is None:
+                self._xsd_validator = XSDSchemaValidator()
+            errors = self._xsd_validator.validate_bytes(xml, consistency=self.consistency_checker)
+        elif mode == "python":
+            if isinstance(xml, bytes):
+                xml = xml.decode('utf-8')
+            try:
+                errors = self.validate(self.processor.xml_to_dict(xml))[1]
+            except ValueError as e:
+                errors = [str(e)]
+        else:
+            raise ValueError(f"지원하지 않는 검증 모드: {mode}")
+        
         return len(errors) == 0, errors
 
 
@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+
+# 저장소 루트의 models/ 와 main.py 를 임포트할 수 있도록
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import importlib
+import os
+import shutil
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def main_module(tmp_path_factory):
+    """임시 작업 디렉터리(data/, public/ 복사본)에서 main 모듈 임포트
+
+    main은 임포트 시 상대 경로 data/ 와 public/ 을 사용하므로 세션 동안 그 디렉터리에 머문다.
+    """
+    workdir = tmp_path_factory.mktemp("server")
+    (workdir / "data" / "xml").mkdir(parents=True)
+    shutil.copy(ROOT / "data" / "xml" / "applications.xml", workdir / "data" / "xml" / "applications.xml")
+    shutil.copytree(ROOT / "public", workdir / "public")
+    previous = os.getcwd()
+    os.chdir(workdir)
+    try:
+        yield importlib.import_module("main")
+    finally:
+        os.chdir(previous)
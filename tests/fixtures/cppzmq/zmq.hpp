@@ -0,0 +1,191 @@
+// Minimal cppzmq-compatible subset for tests/test_cpp_codegen.py
+//
+// Used only when the real cppzmq package is not installed. It covers exactly the API the generated
+// headers use (context_t, socket_t, message_t, const_buffer, sockopt, poll) and declares the few libzmq
+// C functions it needs itself, so only the shared library is required (pyzmq ships one).
+#pragma once
+
+#include <chrono>
+#include <cstddef>
+#include <cstring>
+#include <optional>
+#include <stdexcept>
+#include <string>
+#include <string_view>
+
+extern "C" {
+typedef struct zmq_msg_t { alignas(8) unsigned char _[64]; } zmq_msg_t;
+typedef struct zmq_pollitem_t { void* socket; int fd; short events; short revents; } zmq_pollitem_t;
+typedef void(zmq_free_fn)(void* data, void* hint);
+
+void* zmq_ctx_new(void);
+int zmq_ctx_set(void* context, int option, int value);
+int zmq_ctx_term(void* context);
+void* zmq_socket(void* context, int type);
+int zmq_close(void* socket);
+int zmq_bind(void* socket, const char* endpoint);
+int zmq_connect(void* socket, const char* endpoint);
+int zmq_setsockopt(void* socket, int option, const void* value, size_t size);
+int zmq_msg_init(zmq_msg_t* msg);
+int zmq_msg_init_size(zmq_msg_t* msg, size_t size);
+int zmq_msg_init_data(zmq_msg_t* msg, void* data, size_t size, zmq_free_fn* ffn, void* hint);
+int zmq_msg_close(zmq_msg_t* msg);
+void* zmq_msg_data(zmq_msg_t* msg);
+size_t zmq_msg_size(const zmq_msg_t* msg);
+int zmq_msg_more(const zmq_msg_t* msg);
+int zmq_msg_send(zmq_msg_t* msg, void* socket, int flags);
+int zmq_msg_recv(zmq_msg_t* msg, void* socket, int flags);
+int zmq_send(void* socket, const void* buffer, size_t size, int flags);
+int zmq_poll(zmq_pollitem_t* items, int count, long timeout);
+int zmq_errno(void);
+const char* zmq_strerror(int errnum);
+}
+
+#define ZMQ_PUB 1
+#define ZMQ_SUB 2
+#define ZMQ_POLLIN 1
+
+namespace zmq {
+
+constexpr int EAGAIN_ERRNO = 11;
+
+struct error_t : std::runtime_error {
+    error_t() : std::runtime_error(zmq_strerror(zmq_errno())) {}
+};
+
+typedef zmq_pollitem_t pollitem_t;
+typedef zmq_free_fn free_fn;
+
+enum class send_flags : int { none = 0, dontwait = 1, sndmore = 2 };
+enum class recv_flags : int { none = 0, dontwait = 1 };
+
+inline send_flags operator|(send_flags a, send_flags b) { return send_flags(int(a) | int(b)); }
+
+struct const_buffer {
+    constexpr const_buffer(const void* data, size_t size) noexcept : data(data), size(size) {}
+    const void* data;
+    size_t size;
+};
+
+using send_result_t = std::optional<size_t>;
+using recv_result_t = std::optional<size_t>;
+
+// EAGAIN becomes an empty result like in cppzmq; other errors throw
+inline std::optional<size_t> result(int rc) {
+    if (rc >= 0) {
+        return size_t(rc);
+    }
+    if (zmq_errno() == EAGAIN_ERRNO) {
+        return {};
+    }
+    throw error_t();
+}
+
+class message_t {
+public:
+    message_t() { zmq_msg_init(&msg_); }
+    message_t(const void* data, size_t size) {
+        zmq_msg_init_size(&msg_, size);
+        if (size) {
+            std::memcpy(zmq_msg_data(&msg_), data, size);
+        }
+    }
+    message_t(void* data, size_t size, free_fn* ffn, void* hint = nullptr) {
+        if (zmq_msg_init_data(&msg_, data, size, ffn, hint)) {
+            throw error_t();
+        }
+    }
+    message_t(message_t&& other) noexcept : msg_(other.msg_) { zmq_msg_init(&other.msg_); }
+    message_t& operator=(message_t&& other) noexcept {
+        zmq_msg_close(&msg_);
+        msg_ = other.msg_;
+        zmq_msg_init(&other.msg_);
+        return *this;
+    }
+    message_t(const message_t&) = delete;
+    message_t& operator=(const message_t&) = delete;
+    ~message_t() { zmq_msg_close(&msg_); }
+
+    void* data() { return zmq_msg_data(&msg_); }
+    const void* data() const { return zmq_msg_data(const_cast<zmq_msg_t*>(&msg_)); }
+    size_t size() const { return zmq_msg_size(&msg_); }
+    bool more() const { return zmq_msg_more(&msg_) != 0; }
+    std::string to_string() const { return std::string(static_cast<const char*>(data()), size()); }
+    zmq_msg_t* handle() { return &msg_; }
+
+private:
+    zmq_msg_t msg_;
+};
+
+class context_t {
+public:
+    explicit context_t(int io_threads = 1) : ptr_(zmq_ctx_new()) { zmq_ctx_set(ptr_, 1, io_threads); }
+    context_t(const context_t&) = delete;
+    ~context_t() { zmq_ctx_term(ptr_); }
+    void* handle() { return ptr_; }
+
+private:
+    void* ptr_;
+};
+
+namespace sockopt {
+template <int Option> struct integer_option {};
+struct subscribe_option {};
+constexpr integer_option<23> sndhwm{};
+constexpr integer_option<24> rcvhwm{};
+constexpr integer_option<17> linger{};
+constexpr subscribe_option subscribe{};
+}  // namespace sockopt
+
+class socket_t {
+public:
+    socket_t(context_t& context, int type) : ptr_(zmq_socket(context.handle(), type)) {
+        if (!ptr_) {
+            throw error_t();
+        }
+    }
+    socket_t(const socket_t&) = delete;
+    ~socket_t() { zmq_close(ptr_); }
+
+    template <int Option> void set(sockopt::integer_option<Option>, int value) {
+        if (zmq_setsockopt(ptr_, Option, &value, sizeof value)) {
+            throw error_t();
+        }
+    }
+    void set(sockopt::subscribe_option, std::string_view prefix) {
+        if (zmq_setsockopt(ptr_, 6, prefix.data(), prefix.size())) {
+            throw error_t();
+        }
+    }
+    void bind(const std::string& endpoint) {
+        if (zmq_bind(ptr_, endpoint.c_str())) {
+            throw error_t();
+        }
+    }
+    void connect(const std::string& endpoint) {
+        if (zmq_connect(ptr_, endpoint.c_str())) {
+            throw error_t();
+        }
+    }
+    send_result_t send(message_t& msg, send_flags flags) { return result(zmq_msg_send(msg.handle(), ptr_, int(flags))); }
+    send_result_t send(const_buffer buffer, send_flags flags) {
+        return result(zmq_send(ptr_, buffer.data, buffer.size, int(flags)));
+    }
+    recv_result_t recv(message_t& msg, recv_flags flags = recv_flags::none) {
+        return result(zmq_msg_recv(msg.handle(), ptr_, int(flags)));
+    }
+    void* handle() { return ptr_; }
+
+private:
+    void* ptr_;
+};
+
+inline int poll(pollitem_t* items, size_t count, std::chrono::milliseconds timeout) {
+    const int rc = zmq_poll(items, int(count), long(timeout.count()));
+    if (rc < 0) {
+        throw error_t();
+    }
+    return rc;
+}
+
+}  // namespace zmq
@@ -0,0 +1,4 @@
+// Minimal cppzmq-compatible subset for tests/test_cpp_codegen.py (see zmq.hpp)
+#pragma once
+
+#include "zmq.hpp"
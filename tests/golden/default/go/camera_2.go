@@ -0,0 +1,93 @@
+// Auto-generated ZeroMQ Topic Manager Code (Go)
+// Shared types and socket goroutines: zmqtopics.go
+
+package zmqtopics
+
+// Camera2Options configures a Camera2 client.
+type Camera2Options struct {
+	// Host is where publishers bind and subscribers connect.
+	Host string
+	// PortOffset is added to every planned port (run several deployments side by side).
+	PortOffset int
+	// IOThreads is the number of libzmq I/O threads.
+	IOThreads int
+	// Queue limits and channel buffers per socket.
+	SensorRawSocket SocketOptions
+	TypeSocket      SocketOptions
+}
+
+// NewCamera2Options returns the default options.
+func NewCamera2Options() Camera2Options {
+	return Camera2Options{
+		Host:            "localhost",
+		IOThreads:       1,
+		SensorRawSocket: DefaultSocketOptions,
+		TypeSocket:      DefaultSocketOptions,
+	}
+}
+
+// Camera2 is the ZeroMQ client of camera-2.
+// 두 번째 발행자
+type Camera2 struct {
+	*client
+	sensorRawPublisher *publisher
+	typePublisher      *publisher
+}
+
+// NewCamera2 binds and connects every socket of camera-2 and starts their goroutines.
+func NewCamera2(options Camera2Options) (*Camera2, error) {
+	c, err := newClient(options.Host, options.PortOffset, options.IOThreads)
+	if err != nil {
+		return nil, err
+	}
+	out := &Camera2{client: c}
+	var publishers []*publisher
+	var subscribers []*subscriber
+	fail := func(err error) (*Camera2, error) {
+		c.Close()
+		return nil, err
+	}
+
+	// sensor.raw (publish) - sensor.proto
+	sensorRawSocket, err := c.publisher(5557, options.SensorRawSocket)
+	if err != nil {
+		return fail(err)
+	}
+	out.sensorRawPublisher = sensorRawSocket
+	publishers = append(publishers, sensorRawSocket)
+
+	// type (publish) - keyword.proto
+	typeSocket, err := c.publisher(5558, options.TypeSocket)
+	if err != nil {
+		return fail(err)
+	}
+	out.typePublisher = typeSocket
+	publishers = append(publishers, typeSocket)
+
+	c.start(publishers, subscribers)
+	return out, nil
+}
+
+// PublishSensorRaw queues payload on sensor.raw, blocking while the send buffer is full.
+// 같은 토픽의 다른 발행자
+func (c *Camera2) PublishSensorRaw(payload []byte) error {
+	_, err := c.sensorRawPublisher.publish("sensor.raw", payload)
+	return err
+}
+
+// PublishSensorRawBatch queues payloads on sensor.raw and returns how many were queued.
+func (c *Camera2) PublishSensorRawBatch(payloads [][]byte) (int, error) {
+	return c.sensorRawPublisher.publish("sensor.raw", payloads...)
+}
+
+// PublishType queues payload on type, blocking while the send buffer is full.
+// Go/Rust 예약어와 같은 이름
+func (c *Camera2) PublishType(payload []byte) error {
+	_, err := c.typePublisher.publish("type", payload)
+	return err
+}
+
+// PublishTypeBatch queues payloads on type and returns how many were queued.
+func (c *Camera2) PublishTypeBatch(payloads [][]byte) (int, error) {
+	return c.typePublisher.publish("type", payloads...)
+}
@@ -0,0 +1,243 @@
+// Auto-generated ZeroMQ Topic Manager Code (Go): shared types and socket goroutines
+
+// Package zmqtopics contains generated ZeroMQ clients for the application catalog.
+//
+// Wire format: [topic, payload] multipart messages; subscribers subscribe to their
+// topic name. Every socket is owned by one goroutine: a publisher goroutine drains a
+// buffered channel and writes everything queued in one batch, a subscriber goroutine
+// reads its socket and delivers payloads on a buffered channel.
+package zmqtopics
+
+import (
+	"errors"
+	"fmt"
+	"sync"
+	"time"
+
+	zmq "github.com/pebbe/zmq4"
+)
+
+// SocketOptions configures one socket and the channel in front of it.
+type SocketOptions struct {
+	// SendHWM and ReceiveHWM are libzmq queue limits in messages (0 = unlimited).
+	// A PUB socket drops messages for a subscriber whose queue is full.
+	SendHWM    int
+	ReceiveHWM int
+	// Buffer is the capacity of the channel between callers and the socket goroutine.
+	Buffer int
+}
+
+// DefaultSocketOptions uses libzmq's default queue limits.
+var DefaultSocketOptions = SocketOptions{SendHWM: 1000, ReceiveHWM: 1000, Buffer: 1024}
+
+// BatchSize is the most messages a publisher goroutine writes per wakeup.
+const BatchSize = 256
+
+// pollInterval bounds how long a subscriber goroutine takes to notice Close.
+const pollInterval = 100 * time.Millisecond
+
+// ErrClosed is returned when publishing on a closed client.
+var ErrClosed = errors.New("zmqtopics: client closed")
+
+// client holds what every generated client shares: the context, its sockets and their goroutines.
+type client struct {
+	host       string
+	portOffset int
+	context    *zmq.Context
+	sockets    []*zmq.Socket
+	done       chan struct{}
+	wg         sync.WaitGroup
+	closeOnce  sync.Once
+	closeErr   error
+}
+
+func newClient(host string, portOffset int, ioThreads int) (*client, error) {
+	context, err := zmq.NewContext()
+	if err != nil {
+		return nil, err
+	}
+	if err := context.SetIoThreads(ioThreads); err != nil {
+		context.Term()
+		return nil, err
+	}
+	return &client{host: host, portOffset: portOffset, context: context, done: make(chan struct{})}, nil
+}
+
+func (c *client) socket(kind zmq.Type, options SocketOptions) (*zmq.Socket, error) {
+	socket, err := c.context.NewSocket(kind)
+	if err != nil {
+		return nil, err
+	}
+	c.sockets = append(c.sockets, socket)
+	// Queue limits apply only to connections made after they are set
+	if err := socket.SetSndhwm(options.SendHWM); err != nil {
+		return nil, err
+	}
+	if err := socket.SetRcvhwm(options.ReceiveHWM); err != nil {
+		return nil, err
+	}
+	return socket, socket.SetLinger(0)
+}
+
+// endpoint is the TCP endpoint of a planned port.
+func (c *client) endpoint(port int) string {
+	return fmt.Sprintf("tcp://%s:%d", c.host, port+c.portOffset)
+}
+
+// publisher binds a PUB socket on a planned port.
+func (c *client) publisher(port int, options SocketOptions) (*publisher, error) {
+	socket, err := c.socket(zmq.PUB, options)
+	if err != nil {
+		return nil, err
+	}
+	if err := socket.Bind(c.endpoint(port)); err != nil {
+		return nil, fmt.Errorf("bind %s: %w", c.endpoint(port), err)
+	}
+	return &publisher{socket: socket, queue: make(chan message, max(options.Buffer, 1)), done: c.done}, nil
+}
+
+// subscriber connects a SUB socket to every publisher of topic.
+func (c *client) subscriber(ports []int, topic string, options SocketOptions) (*subscriber, error) {
+	socket, err := c.socket(zmq.SUB, options)
+	if err != nil {
+		return nil, err
+	}
+	for _, port := range ports {
+		if err := socket.Connect(c.endpoint(port)); err != nil {
+			return nil, fmt.Errorf("connect %s: %w", c.endpoint(port), err)
+		}
+	}
+	// Only this topic's messages pass libzmq's prefix filter
+	if err := socket.SetSubscribe(topic); err != nil {
+		return nil, err
+	}
+	return &subscriber{socket: socket, topic: topic, out: make(chan []byte, max(options.Buffer, 1)), done: c.done}, nil
+}
+
+// start hands every socket to its goroutine (after all of them are set up).
+func (c *client) start(publishers []*publisher, subscribers []*subscriber) {
+	for _, p := range publishers {
+		c.wg.Add(1)
+		go func(p *publisher) {
+			defer c.wg.Done()
+			p.run()
+		}(p)
+	}
+	for _, s := range subscribers {
+		c.wg.Add(1)
+		go func(s *subscriber) {
+			defer c.wg.Done()
+			s.run()
+		}(s)
+	}
+}
+
+// Close stops the socket goroutines, closes the sockets and terminates the context.
+// Messages still queued are dropped and subscriber channels are closed.
+func (c *client) Close() error {
+	c.closeOnce.Do(func() {
+		close(c.done)
+		c.wg.Wait()
+		for _, socket := range c.sockets {
+			socket.Close()
+		}
+		c.closeErr = c.context.Term()
+	})
+	return c.closeErr
+}
+
+type message struct {
+	topic   string
+	payload []byte
+}
+
+type publisher struct {
+	socket *zmq.Socket
+	queue  chan message
+	done   chan struct{}
+}
+
+// publish queues payloads (blocking while the buffer is full) and returns how many were queued.
+// Payloads are sent as they are: do not modify them afterwards.
+func (p *publisher) publish(topic string, payloads ...[]byte) (int, error) {
+	for i, payload := range payloads {
+		select {
+		case <-p.done:
+			return i, ErrClosed
+		default:
+		}
+		select {
+		case p.queue <- message{topic, payload}:
+		case <-p.done:
+			return i, ErrClosed
+		}
+	}
+	return len(payloads), nil
+}
+
+func (p *publisher) run() {
+	batch := make([]message, 0, BatchSize)
+	for {
+		select {
+		case <-p.done:
+			return
+		case m := <-p.queue:
+			batch = append(batch[:0], m)
+		}
+		// Take whatever else is already queued so one wakeup writes up to BatchSize messages
+	fill:
+		for len(batch) < BatchSize {
+			select {
+			case m := <-p.queue:
+				batch = append(batch, m)
+			default:
+				break fill
+			}
+		}
+		for _, m := range batch {
+			// PUB sockets never block: a failed send drops the message like a full queue does
+			if _, err := p.socket.Send(m.topic, zmq.SNDMORE); err == nil {
+				p.socket.SendBytes(m.payload, 0)
+			}
+		}
+	}
+}
+
+type subscriber struct {
+	socket *zmq.Socket
+	topic  string
+	out    chan []byte
+	done   chan struct{}
+}
+
+func (s *subscriber) run() {
+	defer close(s.out)
+	poller := zmq.NewPoller()
+	poller.Add(s.socket, zmq.POLLIN)
+	for {
+		select {
+		case <-s.done:
+			return
+		default:
+		}
+		if polled, err := poller.Poll(pollInterval); err != nil || len(polled) == 0 {
+			continue
+		}
+		// Drain everything already queued before polling again
+		for {
+			frames, err := s.socket.RecvMessageBytes(zmq.DONTWAIT)
+			if err != nil {
+				break
+			}
+			// Subscriptions match by prefix: skip longer topic names that share it
+			if len(frames) < 2 || string(frames[0]) != s.topic {
+				continue
+			}
+			select {
+			case s.out <- frames[len(frames)-1]:
+			case <-s.done:
+				return
+			}
+		}
+	}
+}
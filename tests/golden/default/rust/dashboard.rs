@@ -0,0 +1,321 @@
+//! Auto-generated ZeroMQ Topic Manager Code (Rust)
+//!
+//! Wire format: [topic, payload] multipart messages; subscribers subscribe to their topic name.
+//! libzmq sockets block and are not thread-safe, so each one is owned by a thread: a publisher
+//! thread drains a tokio channel and writes everything queued in one batch, a subscriber thread
+//! reads its socket and delivers payloads on a tokio channel.
+
+#![allow(dead_code)]
+
+use std::fmt;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::Arc;
+use std::thread;
+
+use tokio::sync::mpsc;
+
+/// Queue limits of one socket and the capacity of the channel in front of it
+#[derive(Clone, Copy, Debug)]
+pub struct SocketOptions {
+    /// libzmq send queue limit in messages (0 = unlimited); PUB drops for subscribers whose queue is full
+    pub send_hwm: i32,
+    /// libzmq receive queue limit in messages (0 = unlimited)
+    pub receive_hwm: i32,
+    /// Capacity of the channel between async callers and the socket thread
+    pub buffer: usize,
+}
+
+impl Default for SocketOptions {
+    fn default() -> Self {
+        SocketOptions { send_hwm: 1000, receive_hwm: 1000, buffer: 1024 }
+    }
+}
+
+/// Most messages a publisher thread writes per wakeup
+pub const BATCH_SIZE: usize = 256;
+
+/// Upper bound on how long a subscriber thread takes to notice its client was dropped
+const POLL_INTERVAL_MS: i64 = 100;
+
+#[derive(Debug)]
+pub enum Error {
+    Zmq(zmq::Error),
+    /// The client was dropped
+    Closed,
+}
+
+impl fmt::Display for Error {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        match self {
+            Error::Zmq(error) => write!(f, "zmq: {}", error),
+            Error::Closed => write!(f, "client closed"),
+        }
+    }
+}
+
+impl std::error::Error for Error {}
+
+impl From<zmq::Error> for Error {
+    fn from(error: zmq::Error) -> Self {
+        Error::Zmq(error)
+    }
+}
+
+fn endpoint(host: &str, port: i32) -> String {
+    format!("tcp://{}:{}", host, port)
+}
+
+fn socket(context: &zmq::Context, kind: zmq::SocketType, options: &SocketOptions) -> Result<zmq::Socket, Error> {
+    let socket = context.socket(kind)?;
+    // Queue limits apply only to connections made after they are set
+    socket.set_sndhwm(options.send_hwm)?;
+    socket.set_rcvhwm(options.receive_hwm)?;
+    socket.set_linger(0)?;
+    Ok(socket)
+}
+
+struct Outgoing {
+    topic: &'static [u8],
+    payload: Vec<u8>,
+}
+
+/// Binds a PUB socket and starts its thread (the thread ends when every sender is dropped)
+fn spawn_publisher(context: &zmq::Context, host: &str, port: i32,
+                   options: &SocketOptions) -> Result<mpsc::Sender<Outgoing>, Error> {
+    let socket = socket(context, zmq::PUB, options)?;
+    socket.bind(&endpoint(host, port))?;
+    let (sender, mut receiver) = mpsc::channel::<Outgoing>(options.buffer.max(1));
+    thread::spawn(move || {
+        let mut batch = Vec::with_capacity(BATCH_SIZE);
+        while let Some(message) = receiver.blocking_recv() {
+            batch.push(message);
+            // Take whatever else is already queued so one wakeup writes up to BATCH_SIZE messages
+            while batch.len() < BATCH_SIZE {
+                match receiver.try_recv() {
+                    Ok(message) => batch.push(message),
+                    Err(_) => break,
+                }
+            }
+            for message in batch.drain(..) {
+                // PUB sockets never block: a failed send drops the message like a full queue does
+                if socket.send(message.topic, zmq::SNDMORE).is_ok() {
+                    let _ = socket.send(message.payload, 0);
+                }
+            }
+        }
+    });
+    Ok(sender)
+}
+
+/// Connects a SUB socket to every publisher of `topic` and starts its thread
+/// (the thread ends when `running` is cleared or the receiver is dropped)
+fn spawn_subscriber(context: &zmq::Context, host: &str, ports: &[i32], topic: &'static [u8],
+                    options: &SocketOptions, running: Arc<AtomicBool>) -> Result<mpsc::Receiver<Vec<u8>>, Error> {
+    let socket = socket(context, zmq::SUB, options)?;
+    for port in ports {
+        socket.connect(&endpoint(host, *port))?;
+    }
+    // Only this topic's messages pass libzmq's prefix filter
+    socket.set_subscribe(topic)?;
+    let (sender, receiver) = mpsc::channel(options.buffer.max(1));
+    thread::spawn(move || {
+        while running.load(Ordering::Relaxed) && !sender.is_closed() {
+            match socket.poll(zmq::POLLIN, POLL_INTERVAL_MS) {
+                Ok(0) | Err(zmq::Error::EINTR) => continue,
+                Ok(_) => {}
+                Err(_) => return,
+            }
+            // Drain everything already queued before polling again
+            while let Ok(mut frames) = socket.recv_multipart(zmq::DONTWAIT) {
+                // Subscriptions match by prefix: skip longer topic names that share it
+                if frames.len() < 2 || frames[0] != topic {
+                    continue;
+                }
+                if sender.blocking_send(frames.pop().unwrap()).is_err() {
+                    return;
+                }
+            }
+        }
+    });
+    Ok(receiver)
+}
+
+async fn publish(sender: &mpsc::Sender<Outgoing>, topic: &'static [u8], payload: Vec<u8>) -> Result<(), Error> {
+    sender.send(Outgoing { topic, payload }).await.map_err(|_| Error::Closed)
+}
+
+/// Options of a [`Dashboard`] client
+#[derive(Clone, Debug)]
+pub struct DashboardOptions {
+    /// Publishers bind and subscribers connect on this host
+    pub host: String,
+    /// Added to every planned port (run several deployments side by side)
+    pub port_offset: i32,
+    /// libzmq I/O threads
+    pub io_threads: i32,
+    pub sensor_raw_socket: SocketOptions,
+    pub sensor_raw_v2_socket: SocketOptions,
+    pub type_socket: SocketOptions,
+    pub control_socket: SocketOptions,
+    pub orphan_socket: SocketOptions,
+}
+
+impl Default for DashboardOptions {
+    fn default() -> Self {
+        DashboardOptions {
+            host: "localhost".to_string(),
+            port_offset: 0,
+            io_threads: 1,
+            sensor_raw_socket: SocketOptions::default(),
+            sensor_raw_v2_socket: SocketOptions::default(),
+            type_socket: SocketOptions::default(),
+            control_socket: SocketOptions::default(),
+            orphan_socket: SocketOptions::default(),
+        }
+    }
+}
+
+/// ZeroMQ client of Dashboard
+pub struct Dashboard {
+    running: Arc<AtomicBool>,
+    sensor_raw_receiver: Option<mpsc::Receiver<Vec<u8>>>,
+    sensor_raw_v2_receiver: Option<mpsc::Receiver<Vec<u8>>>,
+    type_receiver: Option<mpsc::Receiver<Vec<u8>>>,
+    control_publisher: mpsc::Sender<Outgoing>,
+    orphan_receiver: Option<mpsc::Receiver<Vec<u8>>>,
+}
+
+impl Dashboard {
+    /// Binds and connects every socket of Dashboard and starts their threads
+    pub fn new(options: DashboardOptions) -> Result<Self, Error> {
+        let context = zmq::Context::new();
+        context.set_io_threads(options.io_threads)?;
+        let running = Arc::new(AtomicBool::new(true));
+        // sensor.raw (subscribe) - sensor.proto
+        let sensor_raw_receiver = spawn_subscriber(&context, &options.host,
+                                        &[5555 + options.port_offset, 5557 + options.port_offset],
+                                        b"sensor.raw", &options.sensor_raw_socket, running.clone())?;
+        // sensor.raw.v2 (subscribe) - sensor_v2.proto
+        let sensor_raw_v2_receiver = spawn_subscriber(&context, &options.host,
+                                        &[5556 + options.port_offset],
+                                        b"sensor.raw.v2", &options.sensor_raw_v2_socket, running.clone())?;
+        // type (subscribe) - keyword.proto
+        let type_receiver = spawn_subscriber(&context, &options.host,
+                                        &[5558 + options.port_offset],
+                                        b"type", &options.type_socket, running.clone())?;
+        // control (publish) - control.proto
+        let control_publisher = spawn_publisher(&context, &options.host, 5559 + options.port_offset,
+                                        &options.control_socket)?;
+        // orphan (subscribe) - orphan.proto
+        // No application in the catalog publishes orphan
+        let orphan_receiver = spawn_subscriber(&context, &options.host,
+                                        &[],
+                                        b"orphan", &options.orphan_socket, running.clone())?;
+        Ok(Dashboard {
+            running,
+            sensor_raw_receiver: Some(sensor_raw_receiver),
+            sensor_raw_v2_receiver: Some(sensor_raw_v2_receiver),
+            type_receiver: Some(type_receiver),
+            control_publisher,
+            orphan_receiver: Some(orphan_receiver),
+        })
+    }
+
+    /// Next payload received on sensor.raw (None once the receiver was taken)
+    ///
+    /// 발행자 두 곳
+    pub async fn recv_sensor_raw(&mut self) -> Option<Vec<u8>> {
+        self.sensor_raw_receiver.as_mut()?.recv().await
+    }
+
+    /// Moves up to `limit` payloads of sensor.raw into `buffer`, waiting for the first; returns how many
+    pub async fn recv_sensor_raw_batch(&mut self, buffer: &mut Vec<Vec<u8>>, limit: usize) -> usize {
+        match self.sensor_raw_receiver.as_mut() {
+            Some(receiver) => receiver.recv_many(buffer, limit).await,
+            None => 0,
+        }
+    }
+
+    /// Takes the sensor.raw channel to consume it from another task
+    pub fn take_sensor_raw_receiver(&mut self) -> Option<mpsc::Receiver<Vec<u8>>> {
+        self.sensor_raw_receiver.take()
+    }
+
+    /// Next payload received on sensor.raw.v2 (None once the receiver was taken)
+    pub async fn recv_sensor_raw_v2(&mut self) -> Option<Vec<u8>> {
+        self.sensor_raw_v2_receiver.as_mut()?.recv().await
+    }
+
+    /// Moves up to `limit` payloads of sensor.raw.v2 into `buffer`, waiting for the first; returns how many
+    pub async fn recv_sensor_raw_v2_batch(&mut self, buffer: &mut Vec<Vec<u8>>, limit: usize) -> usize {
+        match self.sensor_raw_v2_receiver.as_mut() {
+            Some(receiver) => receiver.recv_many(buffer, limit).await,
+            None => 0,
+        }
+    }
+
+    /// Takes the sensor.raw.v2 channel to consume it from another task
+    pub fn take_sensor_raw_v2_receiver(&mut self) -> Option<mpsc::Receiver<Vec<u8>>> {
+        self.sensor_raw_v2_receiver.take()
+    }
+
+    /// Next payload received on type (None once the receiver was taken)
+    pub async fn recv_type(&mut self) -> Option<Vec<u8>> {
+        self.type_receiver.as_mut()?.recv().await
+    }
+
+    /// Moves up to `limit` payloads of type into `buffer`, waiting for the first; returns how many
+    pub async fn recv_type_batch(&mut self, buffer: &mut Vec<Vec<u8>>, limit: usize) -> usize {
+        match self.type_receiver.as_mut() {
+            Some(receiver) => receiver.recv_many(buffer, limit).await,
+            None => 0,
+        }
+    }
+
+    /// Takes the type channel to consume it from another task
+    pub fn take_type_receiver(&mut self) -> Option<mpsc::Receiver<Vec<u8>>> {
+        self.type_receiver.take()
+    }
+
+    /// Queues a payload on control, waiting while the send buffer is full
+    ///
+    /// */ 주석 닫기
+    pub async fn publish_control(&self, payload: Vec<u8>) -> Result<(), Error> {
+        publish(&self.control_publisher, b"control", payload).await
+    }
+
+    /// Queues every payload on control (the socket thread writes them in batches)
+    pub async fn publish_control_batch<I: IntoIterator<Item = Vec<u8>>>(&self, payloads: I) -> Result<(), Error> {
+        for payload in payloads {
+            publish(&self.control_publisher, b"control", payload).await?;
+        }
+        Ok(())
+    }
+
+    /// Next payload received on orphan (None once the receiver was taken)
+    ///
+    /// 발행자 없음
+    pub async fn recv_orphan(&mut self) -> Option<Vec<u8>> {
+        self.orphan_receiver.as_mut()?.recv().await
+    }
+
+    /// Moves up to `limit` payloads of orphan into `buffer`, waiting for the first; returns how many
+    pub async fn recv_orphan_batch(&mut self, buffer: &mut Vec<Vec<u8>>, limit: usize) -> usize {
+        match self.orphan_receiver.as_mut() {
+            Some(receiver) => receiver.recv_many(buffer, limit).await,
+            None => 0,
+        }
+    }
+
+    /// Takes the orphan channel to consume it from another task
+    pub fn take_orphan_receiver(&mut self) -> Option<mpsc::Receiver<Vec<u8>>> {
+        self.orphan_receiver.take()
+    }
+}
+
+impl Drop for Dashboard {
+    fn drop(&mut self) {
+        // Publisher threads stop when their senders are dropped, subscriber threads within one poll interval
+        self.running.store(false, Ordering::Relaxed);
+    }
+}
@@ -0,0 +1,264 @@
+//! Auto-generated ZeroMQ Topic Manager Code (Rust)
+//!
+//! Wire format: [topic, payload] multipart messages; subscribers subscribe to their topic name.
+//! libzmq sockets block and are not thread-safe, so each one is owned by a thread: a publisher
+//! thread drains a tokio channel and writes everything queued in one batch, a subscriber thread
+//! reads its socket and delivers payloads on a tokio channel.
+
+#![allow(dead_code)]
+
+use std::fmt;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::Arc;
+use std::thread;
+
+use tokio::sync::mpsc;
+
+/// Queue limits of one socket and the capacity of the channel in front of it
+#[derive(Clone, Copy, Debug)]
+pub struct SocketOptions {
+    /// libzmq send queue limit in messages (0 = unlimited); PUB drops for subscribers whose queue is full
+    pub send_hwm: i32,
+    /// libzmq receive queue limit in messages (0 = unlimited)
+    pub receive_hwm: i32,
+    /// Capacity of the channel between async callers and the socket thread
+    pub buffer: usize,
+}
+
+impl Default for SocketOptions {
+    fn default() -> Self {
+        SocketOptions { send_hwm: 1000, receive_hwm: 1000, buffer: 1024 }
+    }
+}
+
+/// Most messages a publisher thread writes per wakeup
+pub const BATCH_SIZE: usize = 256;
+
+/// Upper bound on how long a subscriber thread takes to notice its client was dropped
+const POLL_INTERVAL_MS: i64 = 100;
+
+#[derive(Debug)]
+pub enum Error {
+    Zmq(zmq::Error),
+    /// The client was dropped
+    Closed,
+}
+
+impl fmt::Display for Error {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        match self {
+            Error::Zmq(error) => write!(f, "zmq: {}", error),
+            Error::Closed => write!(f, "client closed"),
+        }
+    }
+}
+
+impl std::error::Error for Error {}
+
+impl From<zmq::Error> for Error {
+    fn from(error: zmq::Error) -> Self {
+        Error::Zmq(error)
+    }
+}
+
+fn endpoint(host: &str, port: i32) -> String {
+    format!("tcp://{}:{}", host, port)
+}
+
+fn socket(context: &zmq::Context, kind: zmq::SocketType, options: &SocketOptions) -> Result<zmq::Socket, Error> {
+    let socket = context.socket(kind)?;
+    // Queue limits apply only to connections made after they are set
+    socket.set_sndhwm(options.send_hwm)?;
+    socket.set_rcvhwm(options.receive_hwm)?;
+    socket.set_linger(0)?;
+    Ok(socket)
+}
+
+struct Outgoing {
+    topic: &'static [u8],
+    payload: Vec<u8>,
+}
+
+/// Binds a PUB socket and starts its thread (the thread ends when every sender is dropped)
+fn spawn_publisher(context: &zmq::Context, host: &str, port: i32,
+                   options: &SocketOptions) -> Result<mpsc::Sender<Outgoing>, Error> {
+    let socket = socket(context, zmq::PUB, options)?;
+    socket.bind(&endpoint(host, port))?;
+    let (sender, mut receiver) = mpsc::channel::<Outgoing>(options.buffer.max(1));
+    thread::spawn(move || {
+        let mut batch = Vec::with_capacity(BATCH_SIZE);
+        while let Some(message) = receiver.blocking_recv() {
+            batch.push(message);
+            // Take whatever else is already queued so one wakeup writes up to BATCH_SIZE messages
+            while batch.len() < BATCH_SIZE {
+                match receiver.try_recv() {
+                    Ok(message) => batch.push(message),
+                    Err(_) => break,
+                }
+            }
+            for message in batch.drain(..) {
+                // PUB sockets never block: a failed send drops the message like a full queue does
+                if socket.send(message.topic, zmq::SNDMORE).is_ok() {
+                    let _ = socket.send(message.payload, 0);
+                }
+            }
+        }
+    });
+    Ok(sender)
+}
+
+/// Connects a SUB socket to every publisher of `topic` and starts its thread
+/// (the thread ends when `running` is cleared or the receiver is dropped)
+fn spawn_subscriber(context: &zmq::Context, host: &str, ports: &[i32], topic: &'static [u8],
+                    options: &SocketOptions, running: Arc<AtomicBool>) -> Result<mpsc::Receiver<Vec<u8>>, Error> {
+    let socket = socket(context, zmq::SUB, options)?;
+    for port in ports {
+        socket.connect(&endpoint(host, *port))?;
+    }
+    // Only this topic's messages pass libzmq's prefix filter
+    socket.set_subscribe(topic)?;
+    let (sender, receiver) = mpsc::channel(options.buffer.max(1));
+    thread::spawn(move || {
+        while running.load(Ordering::Relaxed) && !sender.is_closed() {
+            match socket.poll(zmq::POLLIN, POLL_INTERVAL_MS) {
+                Ok(0) | Err(zmq::Error::EINTR) => continue,
+                Ok(_) => {}
+                Err(_) => return,
+            }
+            // Drain everything already queued before polling again
+            while let Ok(mut frames) = socket.recv_multipart(zmq::DONTWAIT) {
+                // Subscriptions match by prefix: skip longer topic names that share it
+                if frames.len() < 2 || frames[0] != topic {
+                    continue;
+                }
+                if sender.blocking_send(frames.pop().unwrap()).is_err() {
+                    return;
+                }
+            }
+        }
+    });
+    Ok(receiver)
+}
+
+async fn publish(sender: &mpsc::Sender<Outgoing>, topic: &'static [u8], payload: Vec<u8>) -> Result<(), Error> {
+    sender.send(Outgoing { topic, payload }).await.map_err(|_| Error::Closed)
+}
+
+/// Options of a [`SensorHub`] client
+#[derive(Clone, Debug)]
+pub struct SensorHubOptions {
+    /// Publishers bind and subscribers connect on this host
+    pub host: String,
+    /// Added to every planned port (run several deployments side by side)
+    pub port_offset: i32,
+    /// libzmq I/O threads
+    pub io_threads: i32,
+    pub sensor_raw_socket: SocketOptions,
+    pub sensor_raw_v2_socket: SocketOptions,
+    pub control_socket: SocketOptions,
+}
+
+impl Default for SensorHubOptions {
+    fn default() -> Self {
+        SensorHubOptions {
+            host: "localhost".to_string(),
+            port_offset: 0,
+            io_threads: 1,
+            sensor_raw_socket: SocketOptions::default(),
+            sensor_raw_v2_socket: SocketOptions::default(),
+            control_socket: SocketOptions::default(),
+        }
+    }
+}
+
+/// ZeroMQ client of Sensor Hub
+///
+/// 센서 수집 "허브"
+pub struct SensorHub {
+    running: Arc<AtomicBool>,
+    sensor_raw_publisher: mpsc::Sender<Outgoing>,
+    sensor_raw_v2_publisher: mpsc::Sender<Outgoing>,
+    control_receiver: Option<mpsc::Receiver<Vec<u8>>>,
+}
+
+impl SensorHub {
+    /// Binds and connects every socket of Sensor Hub and starts their threads
+    pub fn new(options: SensorHubOptions) -> Result<Self, Error> {
+        let context = zmq::Context::new();
+        context.set_io_threads(options.io_threads)?;
+        let running = Arc::new(AtomicBool::new(true));
+        // sensor.raw (publish) - sensor.proto
+        let sensor_raw_publisher = spawn_publisher(&context, &options.host, 5555 + options.port_offset,
+                                        &options.sensor_raw_socket)?;
+        // sensor.raw.v2 (publish) - sensor_v2.proto
+        let sensor_raw_v2_publisher = spawn_publisher(&context, &options.host, 5556 + options.port_offset,
+                                        &options.sensor_raw_v2_socket)?;
+        // control (subscribe) - control.proto
+        let control_receiver = spawn_subscriber(&context, &options.host,
+                                        &[5559 + options.port_offset],
+                                        b"control", &options.control_socket, running.clone())?;
+        Ok(SensorHub {
+            running,
+            sensor_raw_publisher,
+            sensor_raw_v2_publisher,
+            control_receiver: Some(control_receiver),
+        })
+    }
+
+    /// Queues a payload on sensor.raw, waiting while the send buffer is full
+    ///
+    /// 원시 센서 값
+    pub async fn publish_sensor_raw(&self, payload: Vec<u8>) -> Result<(), Error> {
+        publish(&self.sensor_raw_publisher, b"sensor.raw", payload).await
+    }
+
+    /// Queues every payload on sensor.raw (the socket thread writes them in batches)
+    pub async fn publish_sensor_raw_batch<I: IntoIterator<Item = Vec<u8>>>(&self, payloads: I) -> Result<(), Error> {
+        for payload in payloads {
+            publish(&self.sensor_raw_publisher, b"sensor.raw", payload).await?;
+        }
+        Ok(())
+    }
+
+    /// Queues a payload on sensor.raw.v2, waiting while the send buffer is full
+    ///
+    /// 접두어가 같은 토픽
+    pub async fn publish_sensor_raw_v2(&self, payload: Vec<u8>) -> Result<(), Error> {
+        publish(&self.sensor_raw_v2_publisher, b"sensor.raw.v2", payload).await
+    }
+
+    /// Queues every payload on sensor.raw.v2 (the socket thread writes them in batches)
+    pub async fn publish_sensor_raw_v2_batch<I: IntoIterator<Item = Vec<u8>>>(&self, payloads: I) -> Result<(), Error> {
+        for payload in payloads {
+            publish(&self.sensor_raw_v2_publisher, b"sensor.raw.v2", payload).await?;
+        }
+        Ok(())
+    }
+
+    /// Next payload received on control (None once the receiver was taken)
+    ///
+    /// 제어 명령
+    pub async fn recv_control(&mut self) -> Option<Vec<u8>> {
+        self.control_receiver.as_mut()?.recv().await
+    }
+
+    /// Moves up to `limit` payloads of control into `buffer`, waiting for the first; returns how many
+    pub async fn recv_control_batch(&mut self, buffer: &mut Vec<Vec<u8>>, limit: usize) -> usize {
+        match self.control_receiver.as_mut() {
+            Some(receiver) => receiver.recv_many(buffer, limit).await,
+            None => 0,
+        }
+    }
+
+    /// Takes the control channel to consume it from another task
+    pub fn take_control_receiver(&mut self) -> Option<mpsc::Receiver<Vec<u8>>> {
+        self.control_receiver.take()
+    }
+}
+
+impl Drop for SensorHub {
+    fn drop(&mut self) {
+        // Publisher threads stop when their senders are dropped, subscriber threads within one poll interval
+        self.running.store(false, Ordering::Relaxed);
+    }
+}
@@ -0,0 +1,157 @@
+// Auto-generated ZeroMQ Topic Manager Code (Go)
+// Shared types and socket goroutines: zmqtopics.go
+
+package zmqtopics
+
+// DashboardOptions configures a Dashboard client.
+type DashboardOptions struct {
+	// Host is where publishers bind and subscribers connect.
+	Host string
+	// PortOffset is added to every planned port (run several deployments side by side).
+	PortOffset int
+	// IOThreads is the number of libzmq I/O threads.
+	IOThreads int
+	// Queue limits and channel buffers per socket (PublisherSocket is shared by all publish topics).
+	PublisherSocket   SocketOptions
+	SensorRawSocket   SocketOptions
+	SensorRawV2Socket SocketOptions
+	TypeSocket        SocketOptions
+	OrphanSocket      SocketOptions
+}
+
+// NewDashboardOptions returns the default options.
+func NewDashboardOptions() DashboardOptions {
+	return DashboardOptions{
+		Host:              "localhost",
+		IOThreads:         1,
+		PublisherSocket:   DefaultSocketOptions,
+		SensorRawSocket:   DefaultSocketOptions,
+		SensorRawV2Socket: DefaultSocketOptions,
+		TypeSocket:        DefaultSocketOptions,
+		OrphanSocket:      DefaultSocketOptions,
+	}
+}
+
+// Dashboard is the ZeroMQ client of Dashboard.
+type Dashboard struct {
+	*client
+	publisher           *publisher
+	sensorRawMessages   <-chan []byte
+	sensorRawV2Messages <-chan []byte
+	typeMessages        <-chan []byte
+	orphanMessages      <-chan []byte
+}
+
+// NewDashboard binds and connects every socket of Dashboard and starts their goroutines.
+func NewDashboard(options DashboardOptions) (*Dashboard, error) {
+	c, err := newClient(options.Host, options.PortOffset, options.IOThreads)
+	if err != nil {
+		return nil, err
+	}
+	out := &Dashboard{client: c}
+	var publishers []*publisher
+	var subscribers []*subscriber
+	fail := func(err error) (*Dashboard, error) {
+		c.Close()
+		return nil, err
+	}
+
+	// All publish topics share one PUB socket (subscribers filter on the topic frame)
+	publisher, err := c.publisher(5557, options.PublisherSocket)
+	if err != nil {
+		return fail(err)
+	}
+	out.publisher = publisher
+	publishers = append(publishers, publisher)
+
+	// sensor.raw (subscribe) - sensor.proto
+	sensorRawSocket, err := c.subscriber([]int{5555, 5556}, "sensor.raw", options.SensorRawSocket)
+	if err != nil {
+		return fail(err)
+	}
+	out.sensorRawMessages = sensorRawSocket.out
+	subscribers = append(subscribers, sensorRawSocket)
+
+	// sensor.raw.v2 (subscribe) - sensor_v2.proto
+	sensorRawV2Socket, err := c.subscriber([]int{5555}, "sensor.raw.v2", options.SensorRawV2Socket)
+	if err != nil {
+		return fail(err)
+	}
+	out.sensorRawV2Messages = sensorRawV2Socket.out
+	subscribers = append(subscribers, sensorRawV2Socket)
+
+	// type (subscribe) - keyword.proto
+	typeSocket, err := c.subscriber([]int{5556}, "type", options.TypeSocket)
+	if err != nil {
+		return fail(err)
+	}
+	out.typeMessages = typeSocket.out
+	subscribers = append(subscribers, typeSocket)
+
+	// orphan (subscribe) - orphan.proto
+	// No application in the catalog publishes orphan
+	orphanSocket, err := c.subscriber([]int{}, "orphan", options.OrphanSocket)
+	if err != nil {
+		return fail(err)
+	}
+	out.orphanMessages = orphanSocket.out
+	subscribers = append(subscribers, orphanSocket)
+
+	c.start(publishers, subscribers)
+	return out, nil
+}
+
+// ReceiveSensorRaw returns the payloads received on sensor.raw; Close closes the channel.
+// 발행자 두 곳
+func (c *Dashboard) ReceiveSensorRaw() <-chan []byte {
+	return c.sensorRawMessages
+}
+
+// ReceiveSensorRawV2 returns the payloads received on sensor.raw.v2; Close closes the channel.
+func (c *Dashboard) ReceiveSensorRawV2() <-chan []byte {
+	return c.sensorRawV2Messages
+}
+
+// ReceiveType returns the payloads received on type; Close closes the channel.
+func (c *Dashboard) ReceiveType() <-chan []byte {
+	return c.typeMessages
+}
+
+// PublishControl queues payload on control, blocking while the send buffer is full.
+// */ 주석 닫기
+func (c *Dashboard) PublishControl(payload []byte) error {
+	_, err := c.publisher.publish("control", payload)
+	return err
+}
+
+// PublishControlBatch queues payloads on control and returns how many were queued.
+func (c *Dashboard) PublishControlBatch(payloads [][]byte) (int, error) {
+	return c.publisher.publish("control", payloads...)
+}
+
+// ReceiveOrphan returns the payloads received on orphan; Close closes the channel.
+// 발행자 없음
+func (c *Dashboard) ReceiveOrphan() <-chan []byte {
+	return c.orphanMessages
+}
+
+// Usage example:
+//
+//	dashboard, err := NewDashboard(NewDashboardOptions())
+//	if err != nil {
+//		log.Fatal(err)
+//	}
+//	defer dashboard.Close()
+//	for payload := range dashboard.ReceiveSensorRaw() {
+//		// handle payload
+//	}
+//	for payload := range dashboard.ReceiveSensorRawV2() {
+//		// handle payload
+//	}
+//	for payload := range dashboard.ReceiveType() {
+//		// handle payload
+//	}
+//	dashboard.PublishControl(payload)
+//	for payload := range dashboard.ReceiveOrphan() {
+//		// handle payload
+//	}
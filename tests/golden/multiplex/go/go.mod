@@ -0,0 +1,5 @@
+module zmqtopics
+
+go 1.21
+
+require github.com/pebbe/zmq4 v1.2.10
@@ -0,0 +1,112 @@
+// Auto-generated ZeroMQ Topic Manager Code (Go)
+// Shared types and socket goroutines: zmqtopics.go
+
+package zmqtopics
+
+// SensorHubOptions configures a SensorHub client.
+type SensorHubOptions struct {
+	// Host is where publishers bind and subscribers connect.
+	Host string
+	// PortOffset is added to every planned port (run several deployments side by side).
+	PortOffset int
+	// IOThreads is the number of libzmq I/O threads.
+	IOThreads int
+	// Queue limits and channel buffers per socket (PublisherSocket is shared by all publish topics).
+	PublisherSocket SocketOptions
+	ControlSocket   SocketOptions
+}
+
+// NewSensorHubOptions returns the default options.
+func NewSensorHubOptions() SensorHubOptions {
+	return SensorHubOptions{
+		Host:            "localhost",
+		IOThreads:       1,
+		PublisherSocket: DefaultSocketOptions,
+		ControlSocket:   DefaultSocketOptions,
+	}
+}
+
+// SensorHub is the ZeroMQ client of Sensor Hub.
+// 센서 수집 "허브"
+type SensorHub struct {
+	*client
+	publisher       *publisher
+	controlMessages <-chan []byte
+}
+
+// NewSensorHub binds and connects every socket of Sensor Hub and starts their goroutines.
+func NewSensorHub(options SensorHubOptions) (*SensorHub, error) {
+	c, err := newClient(options.Host, options.PortOffset, options.IOThreads)
+	if err != nil {
+		return nil, err
+	}
+	out := &SensorHub{client: c}
+	var publishers []*publisher
+	var subscribers []*subscriber
+	fail := func(err error) (*SensorHub, error) {
+		c.Close()
+		return nil, err
+	}
+
+	// All publish topics share one PUB socket (subscribers filter on the topic frame)
+	publisher, err := c.publisher(5555, options.PublisherSocket)
+	if err != nil {
+		return fail(err)
+	}
+	out.publisher = publisher
+	publishers = append(publishers, publisher)
+
+	// control (subscribe) - control.proto
+	controlSocket, err := c.subscriber([]int{5557}, "control", options.ControlSocket)
+	if err != nil {
+		return fail(err)
+	}
+	out.controlMessages = controlSocket.out
+	subscribers = append(subscribers, controlSocket)
+
+	c.start(publishers, subscribers)
+	return out, nil
+}
+
+// PublishSensorRaw queues payload on sensor.raw, blocking while the send buffer is full.
+// 원시 센서 값
+func (c *SensorHub) PublishSensorRaw(payload []byte) error {
+	_, err := c.publisher.publish("sensor.raw", payload)
+	return err
+}
+
+// PublishSensorRawBatch queues payloads on sensor.raw and returns how many were queued.
+func (c *SensorHub) PublishSensorRawBatch(payloads [][]byte) (int, error) {
+	return c.publisher.publish("sensor.raw", payloads...)
+}
+
+// PublishSensorRawV2 queues payload on sensor.raw.v2, blocking while the send buffer is full.
+// 접두어가 같은 토픽
+func (c *SensorHub) PublishSensorRawV2(payload []byte) error {
+	_, err := c.publisher.publish("sensor.raw.v2", payload)
+	return err
+}
+
+// PublishSensorRawV2Batch queues payloads on sensor.raw.v2 and returns how many were queued.
+func (c *SensorHub) PublishSensorRawV2Batch(payloads [][]byte) (int, error) {
+	return c.publisher.publish("sensor.raw.v2", payloads...)
+}
+
+// ReceiveControl returns the payloads received on control; Close closes the channel.
+// 제어 명령
+func (c *SensorHub) ReceiveControl() <-chan []byte {
+	return c.controlMessages
+}
+
+// Usage example:
+//
+//	sensorHub, err := NewSensorHub(NewSensorHubOptions())
+//	if err != nil {
+//		log.Fatal(err)
+//	}
+//	defer sensorHub.Close()
+//	sensorHub.PublishSensorRaw(payload)
+//	sensorHub.PublishSensorRawV2(payload)
+//	for payload := range sensorHub.ReceiveControl() {
+//		// handle payload
+//	}
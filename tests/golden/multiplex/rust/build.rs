@@ -0,0 +1,22 @@
+// Auto-generated: declares one module per generated .rs file in this directory
+
+use std::{env, fs, path::Path};
+
+fn main() {
+    let dir = env::var("CARGO_MANIFEST_DIR").unwrap();
+    let mut files: Vec<_> = fs::read_dir(&dir)
+        .unwrap()
+        .filter_map(|entry| entry.ok().map(|entry| entry.path()))
+        .filter(|path| path.extension().map_or(false, |extension| extension == "rs"))
+        .filter(|path| !matches!(path.file_name().and_then(|name| name.to_str()), Some("lib.rs" | "build.rs")))
+        .collect();
+    files.sort();
+
+    let mut modules = String::new();
+    for path in &files {
+        let name = path.file_stem().unwrap().to_string_lossy();
+        modules.push_str(&format!("#[path = {:?}]\npub mod {};\n", path.display().to_string(), name));
+    }
+    fs::write(Path::new(&env::var("OUT_DIR").unwrap()).join("modules.rs"), modules).unwrap();
+    println!("cargo:rerun-if-changed={}", dir);
+}
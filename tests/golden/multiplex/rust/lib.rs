@@ -0,0 +1,3 @@
+//! Generated ZeroMQ clients: one module per generated file (see build.rs)
+
+include!(concat!(env!("OUT_DIR"), "/modules.rs"));
@@ -0,0 +1,40 @@
+import os
+import stat
+
+import pytest
+
+from models.atomic_io import DURABILITY_NONE, atomic_write_bytes
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_replacing_keeps_existing_mode(tmp_path):
+    target = tmp_path / "catalog.xml"
+    target.write_bytes(b"old")
+    os.chmod(target, 0o644)
+
+    atomic_write_bytes(target, b"new", DURABILITY_NONE)
+
+    assert target.read_bytes() == b"new"
+    assert _mode(target) == 0o644
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_new_file_gets_umask_default(tmp_path):
+    umask = os.umask(0o022)
+    os.umask(umask)
+    target = tmp_path / "new.xml"
+
+    atomic_write_bytes(target, b"data", DURABILITY_NONE)
+
+    assert _mode(target) == 0o666 & ~umask
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path):
+    target = tmp_path / "catalog.xml"
+    with pytest.raises(ValueError):
+        atomic_write_bytes(target, b"data", "bogus")
+    assert list(tmp_path.iterdir()) == []
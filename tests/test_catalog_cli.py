@@ -0,0 +1,80 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+import catalog_cli
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def catalog_dir(tmp_path):
+    directory = tmp_path / "catalogs"
+    directory.mkdir()
+    shutil.copy(ROOT / "data" / "xml" / "applications.xml", directory / "applications.xml")
+    return directory
+
+
+def _run(command, catalog_dir, cache, **options):
+    files = catalog_cli.collect_files([str(catalog_dir)], "*.xml")
+    return catalog_cli.run(command, files, options, 1, cache)
+
+
+def _codegen_options(tmp_path, **overrides):
+    options = {
+        "language": "python", "output_dir": str(tmp_path / "generated"), "no_comments": False,
+        "no_examples": False, "deterministic": True, "serialization": "json",
+        "multiplex_publishers": False, "benchmarks": False
+    }
+    options.update(overrides)
+    return options
+
+
+def test_validate_cache_is_keyed_by_validator_version(catalog_dir, monkeypatch):
+    cache = {"format": catalog_cli.CACHE_FORMAT_VERSION, "entries": {}}
+
+    assert [r["cached"] for r in _run("validate", catalog_dir, cache, mode="xsd", fail_fast=False)] == [False]
+    assert [r["cached"] for r in _run("validate", catalog_dir, cache, mode="xsd", fail_fast=False)] == [True]
+
+    monkeypatch.setattr(catalog_cli, "validator_fingerprint", lambda: "rules-changed")
+    assert [r["cached"] for r in _run("validate", catalog_dir, cache, mode="xsd", fail_fast=False)] == [False]
+
+
+def test_codegen_cache_is_keyed_by_templates(catalog_dir, tmp_path, monkeypatch):
+    cache = {"format": catalog_cli.CACHE_FORMAT_VERSION, "entries": {}}
+    options = _codegen_options(tmp_path)
+
+    assert [r["cached"] for r in _run("codegen", catalog_dir, cache, **options)] == [False]
+    assert [r["cached"] for r in _run("codegen", catalog_dir, cache, **options)] == [True]
+
+    engine = catalog_cli._get_manager().code_generator.template_engine
+    monkeypatch.setattr(engine, "template_fingerprint", lambda language: "templates-changed")
+    assert [r["cached"] for r in _run("codegen", catalog_dir, cache, **options)] == [False]
+
+    options = _codegen_options(tmp_path, benchmarks=True)
+    assert [r["cached"] for r in _run("codegen", catalog_dir, cache, **options)] == [False]
+    monkeypatch.setattr(engine, "benchmark_fingerprint", lambda: "benchmark-changed")
+    assert [r["cached"] for r in _run("codegen", catalog_dir, cache, **options)] == [False]
+
+
+def test_normalize_accepts_files_saved_by_the_server(catalog_dir, tmp_path, main_module):
+    from models.file_manager import XMLFileManager
+
+    file_manager = XMLFileManager(base_dir=str(tmp_path / "server"))
+    manager = main_module.ZeroMQTopicManager()
+    structure = manager.get_xml_structure()
+    structure["Applications"]["Application"][0]["@description"] = 'quotes " & <brackets>'
+    manager.apply_structure(structure)
+    # 서버 자동 저장과 같은 경로: 문서 → XML 문자열 → file_manager 저장
+    assert file_manager.save_xml(manager._structure_to_xml(manager.get_xml_structure()), "saved.xml")
+    saved = file_manager.xml_dir / "saved.xml"
+    shutil.copy(saved, catalog_dir / "saved.xml")
+
+    results = {r["path"]: r["status"] for r in _run("normalize", catalog_dir, None, write=False)}
+
+    assert results == {"applications.xml": "unchanged", "saved.xml": "unchanged"}
+    # 저장 형식은 다시 저장해도 그대로
+    before = saved.read_bytes()
+    assert file_manager.save_xml(before.decode("utf-8"), "saved.xml")
+    assert saved.read_bytes() == before
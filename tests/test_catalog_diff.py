@@ -0,0 +1,140 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from models.catalog_diff import CatalogDiffer, build_catalog_index, diff_catalogs
+from models.file_manager import xml_file_manager
+
+
+def _xml(*apps):
+    """(응용프로그램 이름, 설명, [(토픽, proto, direction)]) 목록으로 카탈로그 XML 생성"""
+    body = "".join(
+        f'<Application name="{name}" description="{description}">'
+        + "".join(f'<Topic name="{topic}" proto="{proto}" direction="{direction}" description=""/>'
+                  for topic, proto, direction in topics)
+        + "</Application>"
+        for name, description, topics in apps
+    )
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<Applications xmlns="http://zeromq-topic-manager/schema" version="1.0">{body}</Applications>\n')
+
+
+OLD = _xml(
+    ("Viewer", "v", [("PTZ", "ptz.proto", "publish"), ("VIDEO", "video.proto", "subscribe")]),
+    ("Audio", "a", [("AUDIO", "audio.proto", "publish")])
+)
+NEW = _xml(
+    ("Viewer", "v2", [("PTZ", "ptz2.proto", "publish"), ("ZOOM", "zoom.proto", "publish")]),
+    ("Radar", "r", [("TRACK", "track.proto", "publish")])
+)
+
+
+def test_diff_reports_added_removed_and_changed(tmp_path):
+    differ = CatalogDiffer()
+    (tmp_path / "old.xml").write_text(OLD, encoding="utf-8")
+    (tmp_path / "new.xml").write_text(NEW, encoding="utf-8")
+
+    diff = diff_catalogs(differ.load_index(tmp_path / "old.xml"), differ.load_index(tmp_path / "new.xml"))
+
+    assert diff["applications"]["added"] == [{"name": "Radar", "topics": ["TRACK"]}]
+    assert diff["applications"]["removed"] == [{"name": "Audio", "topics": ["AUDIO"]}]
+    assert diff["applications"]["changed"] == [{
+        "name": "Viewer",
+        "attributes": {"description": {"from": "v", "to": "v2"}},
+        "topics": {"added": ["ZOOM"], "removed": ["VIDEO"],
+                   "changed": [{"name": "PTZ", "attributes": {"proto": {"from": "ptz.proto", "to": "ptz2.proto"}}}]}
+    }]
+    assert diff["summary"] == {
+        "applications_added": 1, "applications_removed": 1, "applications_changed": 1,
+        "topics_added": 2, "topics_removed": 2, "topics_changed": 1
+    }
+    assert diff_catalogs(build_catalog_index({}), build_catalog_index({}))["summary"]["applications_changed"] == 0
+
+
+def test_index_cache_is_keyed_on_path_mtime_and_size(tmp_path):
+    differ = CatalogDiffer()
+    path = tmp_path / "catalog.xml"
+    path.write_text(OLD, encoding="utf-8")
+
+    first = differ.load_index(path)
+    assert differ.load_index(path) is first
+    assert (differ.hits, differ.misses) == (1, 1)
+
+    # 크기가 같아도 mtime이 바뀌면 다시 파싱
+    stat = path.stat()
+    path.write_text(OLD.replace('description="v"', 'description="w"'), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert path.stat().st_size == stat.st_size
+    changed = differ.load_index(path)
+    assert changed["apps"]["Viewer"]["attrs"]["description"] == "w"
+    assert (differ.hits, differ.misses) == (1, 2)
+
+    # mtime이 같아도 크기가 다르면 다시 파싱
+    path.write_text(NEW, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert "Radar" in differ.load_index(path)["apps"]
+    assert (differ.hits, differ.misses) == (1, 3)
+
+
+def test_index_cache_evicts_least_recently_used(tmp_path):
+    differ = CatalogDiffer(max_cached_versions=2)
+    paths = []
+    for name in ("a", "b", "c"):
+        paths.append(tmp_path / f"{name}.xml")
+        paths[-1].write_text(OLD, encoding="utf-8")
+
+    differ.load_index(paths[0])
+    differ.load_index(paths[1])
+    differ.load_index(paths[0])  # a를 최근 사용으로
+    differ.load_index(paths[2])  # b가 밀려남
+
+    assert differ.get_cache_info()["entries"] == 2
+    differ.load_index(paths[0])
+    assert differ.misses == 3
+    differ.load_index(paths[1])
+    assert differ.misses == 4
+
+
+@pytest.fixture
+def versions(main_module):
+    paths = [xml_file_manager.xml_dir / "diff_old.xml", xml_file_manager.xml_dir / "diff_new.xml"]
+    paths[0].write_text(OLD, encoding="utf-8")
+    paths[1].write_text(NEW, encoding="utf-8")
+    try:
+        yield TestClient(main_module.app)
+    finally:
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+
+def test_diff_endpoint(versions):
+    response = versions.get("/api/diff", params={"from": "diff_old.xml", "to": "diff_new.xml"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is True
+    assert body["diff"]["summary"]["applications_added"] == 1
+    assert body["diff"]["applications"]["removed"] == [{"name": "Audio", "topics": ["AUDIO"]}]
+
+    # 같은 버전을 다시 비교하면 파싱 없이 캐시 적중
+    again = versions.get("/api/diff", params={"from": "diff_old.xml", "to": "diff_new.xml"}).json()
+    assert again["diff"] == body["diff"]
+    assert again["cache"]["hits"] == body["cache"]["hits"] + 2
+    assert again["cache"]["misses"] == body["cache"]["misses"]
+
+
+def test_diff_endpoint_against_live_document(versions, main_module):
+    live = main_module.topic_manager.get_xml_structure()
+    live_names = {app["@name"] for app in live["Applications"]["Application"]}
+
+    body = versions.get("/api/diff", params={"from": "diff_old.xml"}).json()
+
+    assert body["to"] == "current"
+    added = {entry["name"] for entry in body["diff"]["applications"]["added"]}
+    assert added == live_names - {"Viewer", "Audio"}
+
+
+def test_diff_endpoint_unknown_version(versions):
+    assert versions.get("/api/diff", params={"from": "missing.xml"}).status_code == 404
+    assert versions.get("/api/diff", params={"from": "../diff_old.xml"}).status_code == 404
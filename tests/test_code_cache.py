@@ -0,0 +1,93 @@
+from models.template_engine import CodeCache, TemplateEngine
+
+OPTIONS = {"include_comments": True, "include_examples": True, "serialization": "json",
+           "multiplex_publishers": False, "generated_at": None}
+
+
+def _apps(count):
+    return [{"@name": f"App{i}", "@description": "", "Topic": [
+        {"@name": f"T{i}", "@proto": "t.proto", "@direction": "publish", "@description": ""}
+    ]} for i in range(count)]
+
+
+def test_eviction_by_total_size():
+    cache = CodeCache(max_size=10)
+    cache.put(("a",), "xxxx")
+    cache.put(("b",), "xxxx")
+    assert cache.get(("a",)) == "xxxx"  # a가 최근 사용으로 바뀌어 b가 먼저 밀려남
+
+    cache.put(("c",), "xxxx")
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == "xxxx"
+    assert cache.get(("c",)) == "xxxx"
+    info = cache.get_info()
+    assert info["entries"] == 2
+    assert info["size"] == 8
+    assert info["evictions"] == 1
+
+
+def test_oversized_value_is_not_stored():
+    cache = CodeCache(max_size=10)
+    cache.put(("a",), "xxxx")
+    cache.put(("big",), "x" * 11)
+
+    assert cache.get(("big",)) is None
+    assert cache.get(("a",)) == "xxxx"
+    assert cache.get_info()["evictions"] == 0
+
+
+def test_replacing_a_key_updates_size():
+    cache = CodeCache(max_size=10)
+    cache.put(("a",), "xxxx")
+    cache.put(("a",), "xx")
+
+    assert cache.get_info()["size"] == 2
+    assert cache.get(("a",)) == "xx"
+
+
+def test_hit_and_miss_statistics():
+    cache = CodeCache()
+    cache.put(("a",), "x")
+    cache.get(("a",))
+    cache.get(("a",))
+    cache.get(("b",))
+
+    info = cache.get_info()
+    assert (info["hits"], info["misses"]) == (2, 1)
+    assert info["hit_rate"] == round(2 / 3, 4)
+
+
+def test_render_reuses_cached_fragments():
+    engine = TemplateEngine()
+    applications = _apps(3)
+    first = engine.render("python", applications, OPTIONS)
+    after_first = engine.cache.get_info()
+
+    assert engine.render("python", applications, OPTIONS) == first
+    info = engine.cache.get_info()
+    # 응용프로그램 조각 3개 + 꼬리말 1개가 모두 적중
+    assert info["hits"] - after_first["hits"] == 4
+    assert info["misses"] == after_first["misses"]
+    assert info["entries"] == after_first["entries"]
+
+
+def test_cache_key_separates_generation_options():
+    engine = TemplateEngine()
+    applications = _apps(2)
+    outputs = {}
+    for comments in (True, False):
+        for examples in (True, False):
+            options = dict(OPTIONS, include_comments=comments, include_examples=examples)
+            outputs[comments, examples] = engine.render("python", applications, options)
+    entries = engine.cache.get_info()["entries"]
+
+    # 옵션 조합마다 별도 항목 (조각 2개 + 꼬리말 1개)
+    assert entries == 4 * 3
+    for (comments, examples), output in outputs.items():
+        uncached = TemplateEngine().render("python", applications,
+                                           dict(OPTIONS, include_comments=comments, include_examples=examples),
+                                           use_cache=False)
+        assert output == uncached
+    assert outputs[True, True] != outputs[False, True]
+    assert outputs[True, True] != outputs[True, False]
@@ -0,0 +1,81 @@
+import io
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from models import codegen_output
+from models.codegen_output import build_code_bundle, create_render_pool
+
+
+def _catalog(apps):
+    return {"Applications": {"@xmlns": "http://zeromq-topic-manager/schema", "@version": "1.0", "Application": [
+        {"@name": f"App{i}", "@description": "", "Topic": [
+            {"@name": f"T{i}", "@proto": "t.proto", "@direction": "publish", "@description": ""},
+            {"@name": f"T{(i + 1) % apps}", "@proto": "t.proto", "@direction": "subscribe", "@description": ""}
+        ]}
+        for i in range(apps)
+    ]}}
+
+
+def _bundle(structure, **kwargs):
+    data = b"".join(build_code_bundle(structure, ["python", "cpp"], deterministic=True, **kwargs))
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+class _CountingExecutor:
+    """submit 횟수만 세고 현재 스레드에서 실행하는 Executor 대역"""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def test_small_bundle_renders_inline(monkeypatch):
+    executor = _CountingExecutor()
+    monkeypatch.setattr(codegen_output, "BUNDLE_PARALLEL_MIN_FILES", 1000)
+
+    files = _bundle(_catalog(10), executor=executor, workers=4)
+
+    assert executor.submitted == 0
+    assert "python/app0.py" in files and "endpoints.json" in files
+
+
+def test_large_bundle_uses_the_given_executor(monkeypatch):
+    executor = _CountingExecutor()
+    monkeypatch.setattr(codegen_output, "BUNDLE_PARALLEL_MIN_FILES", 100)
+    monkeypatch.setattr(codegen_output, "BUNDLE_CHUNK_SIZE", 16)
+    structure = _catalog(80)
+
+    parallel = _bundle(structure, executor=executor, workers=2)
+
+    assert executor.submitted == 10    # 언어 2개 × 80개 / 16개씩
+    assert parallel == _bundle(structure)
+
+
+def test_shared_process_pool_serves_several_bundles(monkeypatch):
+    monkeypatch.setattr(codegen_output, "BUNDLE_PARALLEL_MIN_FILES", 0)
+    monkeypatch.setattr(codegen_output, "BUNDLE_CHUNK_SIZE", 8)
+    structure = _catalog(40)
+    expected = _bundle(structure)
+
+    pool = create_render_pool(2)
+    assert isinstance(pool, ProcessPoolExecutor)
+    try:
+        for _ in range(3):
+            assert _bundle(structure, executor=pool, workers=2) == expected
+        # 중간에 끊긴 스트림은 풀을 닫지 않음
+        chunks = build_code_bundle(structure, ["python"], executor=pool, workers=2)
+        next(chunks)
+        chunks.close()
+        assert _bundle(structure, executor=pool, workers=2) == expected
+    finally:
+        pool.shutdown()
+
+
+def test_single_worker_has_no_pool():
+    assert create_render_pool(1) is None
@@ -0,0 +1,58 @@
+"""
+Go/Rust 생성 코드 골든 파일 테스트
+
+tests/fixtures/catalog.xml 로 생성한 파일을 tests/golden/<변형>/<언어>/ 와 비교.
+템플릿을 의도적으로 바꿨다면 다시 만들고 차이를 검토한 뒤 함께 커밋:
+
+    UPDATE_GOLDEN=1 python -m pytest tests/test_codegen_golden.py
+"""
+
+import difflib
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from models.codegen_output import MANIFEST_NAME, IncrementalCodeWriter
+from models.xml_schema import XMLProcessor
+
+TESTS_DIR = Path(__file__).resolve().parent
+CATALOG = TESTS_DIR / "fixtures" / "catalog.xml"
+GOLDEN_DIR = TESTS_DIR / "golden"
+LANGUAGES = ["go", "rust"]
+
+# 변형 이름 → IncrementalCodeWriter 옵션
+VARIANTS = {
+    "default": {},
+    "multiplex": {"include_examples": True, "multiplex_publishers": True}
+}
+
+
+def _generate(output_dir: Path, options: dict) -> dict:
+    structure = XMLProcessor().xml_to_dict(CATALOG.read_text(encoding="utf-8"))
+    IncrementalCodeWriter(output_dir, LANGUAGES, **options).sync(structure)
+    return {path.relative_to(output_dir).as_posix(): path.read_text(encoding="utf-8")
+            for language in LANGUAGES
+            for path in sorted((output_dir / language).iterdir())
+            if path.name != MANIFEST_NAME}
+
+
+@pytest.mark.parametrize("variant", sorted(VARIANTS))
+def test_generated_code_matches_golden(tmp_path, variant):
+    generated = _generate(tmp_path, VARIANTS[variant])
+    golden_dir = GOLDEN_DIR / variant
+
+    if os.environ.get("UPDATE_GOLDEN"):
+        shutil.rmtree(golden_dir, ignore_errors=True)
+        for name, content in generated.items():
+            (golden_dir / name).parent.mkdir(parents=True, exist_ok=True)
+            (golden_dir / name).write_text(content, encoding="utf-8")
+
+    golden = {path.relative_to(golden_dir).as_posix(): path.read_text(encoding="utf-8")
+              for path in sorted(golden_dir.rglob("*")) if path.is_file()}
+    assert sorted(generated) == sorted(golden), "생성 파일 목록이 골든과 다름 (UPDATE_GOLDEN=1 로 갱신)"
+    for name in sorted(generated):
+        diff = "".join(difflib.unified_diff(golden[name].splitlines(True), generated[name].splitlines(True),
+                                            f"golden/{variant}/{name}", f"generated/{name}"))
+        assert not diff, f"{name} 이 골든과 다름 (UPDATE_GOLDEN=1 로 갱신)\n{diff}"
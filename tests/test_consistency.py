@@ -0,0 +1,76 @@
+import pytest
+
+from models.xml_schema import ConsistencyChecker, IncrementalValidator
+
+
+def _app(name, *topics):
+    return {"@name": name, "Topic": [{"@name": topic, "@proto": proto} for topic, proto in topics]}
+
+
+def _catalog(*apps):
+    return {"Applications": {"Application": list(apps)}}
+
+
+CATALOGS = {
+    "duplicate_names": _catalog(
+        _app("A", ("x", "x.proto")), _app("B", ("y", "y.proto")), _app("A"), _app("C"), _app("B")
+    ),
+    "duplicate_topics": _catalog(
+        _app("A", ("x", "x.proto"), ("x", "x.proto"), ("y", "y.proto"), ("y", "z.proto"))
+    ),
+    "conflicts_found_together": _catalog(
+        _app("A", ("x", "x.proto"), ("y", "y.proto")),
+        _app("B", ("y", "other.proto"), ("x", "other.proto")),
+        _app("C", ("x", "third.proto"))
+    ),
+    "everything": _catalog(
+        _app("A", ("x", "x.proto"), ("x", "x.proto")),
+        _app("B", ("x", "b.proto")),
+        _app("A"),
+        _app("", ("y", "y.proto")),
+        _app("", ("z", "z.proto"))
+    ),
+}
+
+
+def _incremental(data):
+    """증분 경로: 응용프로그램을 이름당 한 번 (첫 선언) 넣고 이름 목록으로 중복 검사"""
+    checker = ConsistencyChecker()
+    apps = data["Applications"]["Application"]
+    seen = set()
+    for i, app in enumerate(apps):
+        if app["@name"] not in seen:
+            seen.add(app["@name"])
+            checker.update_application(app, prefix=f"Application[{i}]")
+    checker.set_application_names([app["@name"] for app in apps])
+    return checker.get_errors()
+
+
+@pytest.mark.parametrize("name", sorted(CATALOGS))
+def test_incremental_matches_full_check(name):
+    data = CATALOGS[name]
+    expected = ConsistencyChecker().check(data)
+
+    assert expected
+    assert _incremental(data) == expected
+
+
+def test_duplicate_name_message_lists_positions():
+    errors = ConsistencyChecker().check(CATALOGS["duplicate_names"])
+
+    assert "Duplicate application name 'A' (Application[0], Application[2])" in errors
+    assert "Duplicate application name 'B' (Application[1], Application[4])" in errors
+
+
+def test_incremental_validator_reports_duplicate_names_like_check():
+    data = CATALOGS["duplicate_names"]
+    validation = IncrementalValidator()
+    validation.reset(data)
+
+    duplicates = [error for error in validation.get_errors() if error.startswith("Duplicate application name")]
+    assert duplicates == [error for error in ConsistencyChecker().check(data)
+                          if error.startswith("Duplicate application name")]
+
+    # 이름 목록이 바뀌면 위치도 다시 계산
+    assert validation.update_application_names(["A", "B", "C", "A"])
+    assert "Duplicate application name 'A' (Application[0], Application[3])" in validation.get_errors()
@@ -0,0 +1,85 @@
+import ctypes.util
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from models.codegen_output import IncrementalCodeWriter
+from models.xml_schema import XMLProcessor
+
+CATALOG = Path(__file__).resolve().parent.parent / "data" / "xml" / "applications.xml"
+CPPZMQ_STUB = Path(__file__).resolve().parent / "fixtures" / "cppzmq"
+
+
+def _cmake(*args, cwd):
+    return subprocess.run(["cmake", *args], cwd=cwd, capture_output=True, text=True, timeout=600)
+
+
+def _libzmq():
+    """링크할 libzmq 공유 라이브러리 (시스템 또는 pyzmq 번들, 없으면 None)"""
+    try:
+        import zmq
+        bundled = Path(zmq.__file__).resolve().parent.parent / "pyzmq.libs"
+        for path in sorted(bundled.glob("libzmq*.so*")):
+            return path
+    except ImportError:
+        pass
+    name = ctypes.util.find_library("zmq")
+    return Path(name) if name and os.path.isabs(name) else None
+
+
+def _stub_prefix(tmp_path, libzmq):
+    """테스트용 cppzmq 헤더(tests/fixtures/cppzmq)를 가리키는 cppzmqConfig.cmake 생성"""
+    prefix = tmp_path / "cppzmq"
+    prefix.mkdir()
+    (prefix / "cppzmqConfig.cmake").write_text(
+        "add_library(cppzmq INTERFACE IMPORTED)\n"
+        "set_target_properties(cppzmq PROPERTIES\n"
+        f'  INTERFACE_INCLUDE_DIRECTORIES "{CPPZMQ_STUB.as_posix()}"\n'
+        f'  INTERFACE_LINK_LIBRARIES "{libzmq.as_posix()};-Wl,-rpath,{libzmq.parent.as_posix()}")\n',
+        encoding="utf-8"
+    )
+    return prefix
+
+
+@pytest.mark.parametrize("multiplex_publishers", [False, True])
+def test_generated_cpp_builds_and_runs(tmp_path, multiplex_publishers):
+    """생성된 C++ 헤더와 벤치마크가 CMake로 빌드되고 모든 메시지를 주고받는지
+
+    cppzmq 패키지가 없으면 tests/fixtures/cppzmq 의 최소 호환 헤더와 pyzmq에 포함된 libzmq로 빌드한다.
+    """
+    if shutil.which("cmake") is None:
+        pytest.skip("cmake 없음")
+    structure = XMLProcessor().xml_to_dict(CATALOG.read_text(encoding="utf-8"))
+    IncrementalCodeWriter(tmp_path / "out", ["cpp"], include_examples=True,
+                          multiplex_publishers=multiplex_publishers).sync(structure)
+    source = tmp_path / "out" / "cpp"
+    build = tmp_path / "build"
+
+    configured = _cmake("-S", str(source), "-B", str(build), cwd=tmp_path)
+    if configured.returncode != 0 and "cppzmq" in configured.stdout + configured.stderr:
+        libzmq = _libzmq()
+        if libzmq is None:
+            pytest.skip("cppzmq 패키지와 libzmq 모두 없음")
+        build = tmp_path / "build-stub"
+        configured = _cmake("-S", str(source), "-B", str(build),
+                            f"-DCMAKE_PREFIX_PATH={_stub_prefix(tmp_path, libzmq)}", cwd=tmp_path)
+    assert configured.returncode == 0, configured.stdout + configured.stderr
+
+    built = _cmake("--build", str(build), cwd=tmp_path)
+    assert built.returncode == 0, built.stdout + built.stderr
+
+    # 다른 테스트 실행과 포트가 겹치지 않도록 프로세스마다 다른 포트 오프셋
+    port_offset = 20000 + (os.getpid() % 1000) * 10 + int(multiplex_publishers)
+    messages = 500
+    for header in sorted(source.glob("*.hpp")):
+        run = subprocess.run([str(build / f"{header.stem}_benchmark"), str(messages), "64", str(port_offset)],
+                             capture_output=True, text=True, timeout=120)
+        assert run.returncode == 0, run.stdout + run.stderr
+        results = [json.loads(line) for line in run.stdout.splitlines()]
+        assert results, header.name
+        for result in results:
+            assert result["received"] == messages, result
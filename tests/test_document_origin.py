@@ -0,0 +1,59 @@
+import asyncio
+
+from pycrdt import Doc, Map
+
+
+def _remote_update(main_module, manager):
+    """manager 문서를 복제한 클라이언트 문서에서 응용프로그램 설명 하나를 바꾼 업데이트"""
+    client = Doc()
+    client.apply_update(manager.doc.get_update())
+    state = client.get_state()
+    app = client.get("applications", type=Map).get("Applications").get("Application")[0]
+    app["description"] = "edited remotely"
+    return client.get_update(state)
+
+
+def _count_saves(manager, monkeypatch):
+    saves = []
+
+    async def fake_auto_save():
+        saves.append(True)
+
+    monkeypatch.setattr(manager, "_auto_save", fake_auto_save)
+    monkeypatch.setattr(manager, "auto_save_enabled", True)
+    return saves
+
+
+def test_remote_update_triggers_auto_save(main_module, monkeypatch):
+    manager = main_module.ZeroMQTopicManager()
+    saves = _count_saves(manager, monkeypatch)
+    update = _remote_update(main_module, manager)
+
+    async def apply():
+        with manager.transaction(main_module.ORIGIN_REMOTE):
+            manager.doc.apply_update(update)
+        await asyncio.sleep(0)
+
+    asyncio.run(apply())
+
+    assert saves == [True]
+    assert manager.get_xml_structure()["Applications"]["Application"][0]["@description"] == "edited remotely"
+
+
+def test_restore_does_not_trigger_auto_save(main_module, monkeypatch):
+    manager = main_module.ZeroMQTopicManager()
+    saves = _count_saves(manager, monkeypatch)
+    structure = manager.get_xml_structure()
+    structure["Applications"]["Application"][0]["@description"] = "restored"
+    xml_content = manager.xml_processor.dict_to_xml(structure)
+
+    async def restore():
+        restored = manager.restore_from_xml(xml_content)
+        await asyncio.sleep(0)
+        return restored
+
+    restored = asyncio.run(restore())
+
+    assert restored["stats"]["applications_updated"] == 1
+    assert saves == []
+    assert manager._transaction_origin is None
@@ -0,0 +1,89 @@
+import asyncio
+import random
+
+import pytest
+from fastapi import HTTPException
+
+
+def _catalog(apps):
+    """[(앱 이름, [토픽 이름...]), ...] -> xmltodict 형식 구조"""
+    return {"Applications": {
+        "@xmlns": "http://zeromq-topic-manager/schema", "@version": "1.0",
+        "Application": [
+            {"@name": app, "@description": f"{app} app", "Topic": [
+                {"@name": topic, "@proto": f"{topic}.proto", "@direction": "publish", "@description": ""}
+                for topic in topics
+            ]}
+            for app, topics in apps
+        ]
+    }}
+
+
+def _order(manager):
+    return [
+        (app["@name"], [topic["@name"] for topic in app["Topic"]])
+        for app in manager.get_xml_structure()["Applications"]["Application"]
+    ]
+
+
+def test_restore_follows_backup_order(main_module):
+    manager = main_module.ZeroMQTopicManager()
+    manager.apply_structure(_catalog([("A", ["a1", "a2", "a3"]), ("B", ["b1"]), ("C", []), ("D", ["d1"])]))
+
+    target = [("A", ["a3", "a1", "a2"]), ("D", ["d1"]), ("E", []), ("B", ["b1"])]
+    stats = manager.apply_structure(_catalog(target))
+
+    assert _order(manager) == target
+    assert stats["applications_removed"] == 1     # C
+    assert stats["applications_added"] == 1       # E
+    assert stats["applications_moved"] == 1       # B만 다시 넣고 A, D는 제자리
+    assert stats["topics_moved"] == 1             # a3만 다시 넣고 a1, a2는 제자리
+    assert stats["topics_added"] == 0             # 옮긴 B의 토픽은 새 토픽이 아님
+    assert manager.apply_structure(_catalog(target)) == dict.fromkeys(stats, 0)
+
+
+def test_swapping_unchanged_applications_only_moves(main_module):
+    manager = main_module.ZeroMQTopicManager()
+    manager.apply_structure(_catalog([("A", ["a1"]), ("B", ["b1", "b2"])]))
+
+    stats = manager.apply_structure(_catalog([("B", ["b1", "b2"]), ("A", ["a1"])]))
+
+    assert stats == dict(dict.fromkeys(stats, 0), applications_moved=1)
+    assert _order(manager) == [("B", ["b1", "b2"]), ("A", ["a1"])]
+    assert manager.get_xml_structure()["Applications"]["Application"][0]["@description"] == "B app"
+
+
+def test_restore_order_matches_random_backups(main_module):
+    manager = main_module.ZeroMQTopicManager()
+    rng = random.Random(7)
+    names = [f"App{i}" for i in range(8)]
+    for _ in range(30):
+        apps = rng.sample(names, rng.randint(0, len(names)))
+        target = [(app, rng.sample([f"{app}_t{i}" for i in range(5)], rng.randint(0, 5))) for app in apps]
+        manager.apply_structure(_catalog(target))
+        assert _order(manager) == target
+
+
+def test_unparseable_backup_leaves_file_and_document(main_module, monkeypatch):
+    manager = main_module.ZeroMQTopicManager()
+    monkeypatch.setattr(main_module, "topic_manager", manager)
+    file_manager = main_module.xml_file_manager
+    file_manager.backup_dir.mkdir(parents=True, exist_ok=True)
+    (file_manager.backup_dir / "broken_backup.xml").write_text("<Applications><Application", encoding="utf-8")
+    target_path = file_manager.xml_dir / "applications.xml"
+    before_file = target_path.read_bytes()
+    before_document = manager.get_xml_structure()
+
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(main_module.restore_backup({"backup_filename": "broken_backup.xml"}))
+
+    assert raised.value.status_code == 400
+    assert target_path.read_bytes() == before_file
+    assert manager.get_xml_structure() == before_document
+
+
+def test_missing_backup_is_not_found(main_module):
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(main_module.restore_backup({"backup_filename": "../applications.xml"}))
+
+    assert raised.value.status_code == 404
@@ -0,0 +1,73 @@
+import pytest
+
+from models.endpoint_planner import MAX_PORT, plan_endpoints
+
+
+def _app(name, *topics):
+    return {"@name": name, "@description": "", "Topic": [
+        {"@name": topic, "@proto": "t.proto", "@direction": direction, "@description": ""}
+        for topic, direction in topics
+    ]}
+
+
+def _catalog(*apps):
+    return {"Applications": {"@xmlns": "http://zeromq-topic-manager/schema", "@version": "1.0",
+                             "Application": list(apps)}}
+
+
+def _publish_ports(plan):
+    return {(app, topic): port
+            for app, entry in plan["applications"].items()
+            for topic, port in entry["publish"].items()}
+
+
+def test_subscribers_connect_to_every_publisher():
+    plan = plan_endpoints(_catalog(
+        _app("A", ("price", "publish")),
+        _app("B", ("price", "publish"), ("order", "publish")),
+        _app("C", ("price", "subscribe"), ("order", "subscribe"), ("missing", "subscribe"))
+    ))
+
+    assert _publish_ports(plan) == {("A", "price"): 5555, ("B", "price"): 5556, ("B", "order"): 5557}
+    assert plan["applications"]["C"]["subscribe"] == {"price": [5555, 5556], "order": [5557], "missing": []}
+
+
+def test_existing_publishers_keep_ports_across_previous_plan():
+    previous = plan_endpoints(_catalog(
+        _app("A", ("a1", "publish"), ("a2", "publish")),
+        _app("B", ("b1", "publish")),
+        _app("C", ("c1", "publish"))
+    ))
+
+    # A 앞에 새 응용프로그램을 넣고 B를 지워도 A와 C의 포트는 그대로, 새 발행자는 빈 포트(B의 포트)를 받음
+    plan = plan_endpoints(_catalog(
+        _app("N", ("n1", "publish")),
+        _app("A", ("a1", "publish"), ("a2", "publish")),
+        _app("C", ("c1", "publish"))
+    ), previous=previous)
+
+    ports = _publish_ports(plan)
+    previous_ports = _publish_ports(previous)
+    for key in [("A", "a1"), ("A", "a2"), ("C", "c1")]:
+        assert ports[key] == previous_ports[key]
+    assert ports[("N", "n1")] == previous_ports[("B", "b1")]
+
+
+@pytest.mark.parametrize("changed", [{"base_port": 7000}, {"multiplex_publishers": True}])
+def test_plan_with_other_settings_is_not_reused(changed):
+    # B만 있던 계획을 재사용하면 B가 첫 포트를 유지해 새로 만든 계획과 달라짐
+    structure = _catalog(_app("A", ("a1", "publish")), _app("B", ("b1", "publish")))
+    only_b = _catalog(_app("B", ("b1", "publish")))
+
+    assert plan_endpoints(structure, previous=plan_endpoints(only_b)) != plan_endpoints(structure)
+    assert plan_endpoints(structure, previous=plan_endpoints(only_b, **changed)) == plan_endpoints(structure)
+    assert (plan_endpoints(structure, previous=plan_endpoints(only_b), **changed)
+            == plan_endpoints(structure, **changed))
+
+
+def test_port_overflow_raises():
+    structure = _catalog(_app("A", ("a1", "publish"), ("a2", "publish"), ("a3", "publish")))
+
+    assert _publish_ports(plan_endpoints(structure, base_port=MAX_PORT - 2))[("A", "a3")] == MAX_PORT
+    with pytest.raises(ValueError):
+        plan_endpoints(structure, base_port=MAX_PORT - 1)
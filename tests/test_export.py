@@ -0,0 +1,100 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from models.file_manager import xml_file_manager
+
+VERSION_FILE = "export_version.xml"
+VERSION_XML = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+               '<Applications xmlns="http://zeromq-topic-manager/schema" version="1.0">'
+               '<Application name="Exported" description="e">'
+               '<Topic name="E1" proto="e1.proto" direction="publish" description=""/>'
+               '</Application></Applications>\n')
+
+
+@pytest.fixture
+def client(main_module):
+    path = xml_file_manager.xml_dir / VERSION_FILE
+    path.write_text(VERSION_XML, encoding="utf-8")
+    try:
+        yield TestClient(main_module.app)
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def test_json_export_of_live_document(client, main_module):
+    response = client.get("/api/export/json")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == main_module.topic_manager.get_xml_structure()
+    # 정규화된 최소 JSON (키 정렬, 공백 없음)
+    assert response.content == json.dumps(response.json(), ensure_ascii=False, sort_keys=True,
+                                          separators=(",", ":")).encode("utf-8")
+
+
+def test_export_is_cached_per_document_version(client, main_module):
+    exporter = main_module.schema_manager.exporter
+    first = client.get("/api/export/json")
+    hits = exporter.get_cache_info()["hits"]
+
+    second = client.get("/api/export/json")
+
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert exporter.get_cache_info()["hits"] == hits + 1
+
+    assert main_module.topic_manager.add_application("ExportProbe")
+    try:
+        changed = client.get("/api/export/json")
+        assert changed.headers["etag"] != first.headers["etag"]
+        assert "ExportProbe" in changed.text
+        assert client.get("/api/export/json", headers={"if-none-match": first.headers["etag"]}).status_code == 200
+    finally:
+        assert main_module.topic_manager.remove_application("ExportProbe")
+
+    # 삭제만 있는 업데이트는 Yjs 상태 벡터를 바꾸지 않지만 버전은 바뀌어야 함
+    removed = client.get("/api/export/json")
+    assert removed.headers["etag"] not in (first.headers["etag"], changed.headers["etag"])
+    assert "ExportProbe" not in removed.text
+    assert removed.json() == main_module.topic_manager.get_xml_structure()
+
+
+def test_matching_etag_returns_not_modified(client):
+    etag = client.get("/api/export/json").headers["etag"]
+
+    response = client.get("/api/export/json", headers={"if-none-match": f'"other", {etag}'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_export_of_stored_version(client):
+    response = client.get("/api/export/json", params={"version": VERSION_FILE})
+
+    assert response.status_code == 200
+    application = response.json()["Applications"]["Application"]
+    application = application[0] if isinstance(application, list) else application
+    assert application["@name"] == "Exported"
+    assert client.get("/api/export/json", params={"version": VERSION_FILE},
+                      headers={"if-none-match": response.headers["etag"]}).status_code == 304
+
+
+def test_unknown_format_or_version(client):
+    assert client.get("/api/export/yaml").status_code == 404
+    assert client.get("/api/export/json", params={"version": "missing.xml"}).status_code == 404
+
+
+@pytest.mark.parametrize("fmt, module, decode", [
+    ("msgpack", "msgpack", lambda module, data: module.unpackb(data, raw=False)),
+    ("cbor", "cbor2", lambda module, data: module.loads(data)),
+])
+def test_binary_export_matches_json(client, fmt, module, decode):
+    codec = pytest.importorskip(module)
+
+    response = client.get(f"/api/export/{fmt}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == f"application/{fmt}"
+    assert decode(codec, response.content) == client.get("/api/export/json").json()
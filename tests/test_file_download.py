@@ -0,0 +1,84 @@
+import gzip
+
+import pytest
+from fastapi.testclient import TestClient
+
+from models.file_manager import xml_file_manager
+
+FILENAME = "download.xml"
+CONTENT = b'<?xml version="1.0" encoding="UTF-8"?>\n<Applications>' + b"<!-- padding -->" * 512 + b"</Applications>\n"
+
+
+@pytest.fixture
+def client(main_module):
+    path = xml_file_manager.xml_dir / FILENAME
+    path.write_bytes(CONTENT)
+    try:
+        yield TestClient(main_module.app)
+    finally:
+        path.unlink(missing_ok=True)
+        path.with_name(FILENAME + ".gz").unlink(missing_ok=True)
+
+
+def _raw(client, **headers):
+    return client.get(f"/api/files/{FILENAME}/raw", headers=headers)
+
+
+def test_range_returns_partial_content(client):
+    response = _raw(client, range="bytes=10-19")
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 10-19/{len(CONTENT)}"
+    assert response.content == CONTENT[10:20]
+    assert "content-encoding" not in response.headers
+
+
+def test_unsatisfiable_range(client):
+    response = _raw(client, range=f"bytes={len(CONTENT) + 10}-")
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+
+def test_identity_response(client):
+    response = _raw(client, **{"accept-encoding": "identity"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.content == CONTENT
+    assert not response.headers["etag"].endswith('-gz"')
+
+
+def test_gzip_response_uses_compressed_variant(client):
+    # httpx가 자동으로 풀지 않도록 스트림의 원시 바이트를 읽음
+    with client.stream("GET", f"/api/files/{FILENAME}/raw", headers={"accept-encoding": "gzip"}) as response:
+        body = b"".join(response.iter_raw())
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].endswith('-gz"')
+    assert len(body) < len(CONTENT)
+    assert gzip.decompress(body) == CONTENT
+
+
+def test_matching_etag_returns_not_modified(client):
+    etag = _raw(client, **{"accept-encoding": "identity"}).headers["etag"]
+
+    response = _raw(client, **{"accept-encoding": "identity", "if-none-match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_gzip_etag_does_not_match_identity(client):
+    etag = _raw(client, **{"accept-encoding": "gzip"}).headers["etag"]
+
+    assert _raw(client, **{"accept-encoding": "identity", "if-none-match": etag}).status_code == 200
+
+
+def test_if_modified_since(client):
+    last_modified = _raw(client, **{"accept-encoding": "identity"}).headers["last-modified"]
+
+    assert _raw(client, **{"if-modified-since": last_modified}).status_code == 304
+    assert _raw(client, **{"if-modified-since": "Thu, 01 Jan 1970 00:00:00 GMT"}).status_code == 200
@@ -0,0 +1,108 @@
+from models.xml_schema import IncrementalValidator
+
+
+def _catalog(apps):
+    """[(앱 이름, [토픽 이름...]), ...] -> xmltodict 형식 구조"""
+    return {"Applications": {
+        "@xmlns": "http://zeromq-topic-manager/schema", "@version": "1.0",
+        "Application": [
+            {"@name": app, "@description": "", "Topic": [
+                {"@name": topic, "@proto": f"{topic}.proto", "@direction": "publish", "@description": ""}
+                for topic in topics
+            ]}
+            for app, topics in apps
+        ]
+    }}
+
+
+def _full_errors(manager):
+    validator = IncrementalValidator()
+    validator.reset(manager.get_xml_structure())
+    return sorted(validator.get_errors())
+
+
+def _app_map(manager, name):
+    app_array = manager.root_map.get("Applications").get("Application")
+    return next(app_array[i] for i in range(len(app_array)) if app_array[i].get("name") == name)
+
+
+def _manager(main_module, monkeypatch, apps):
+    manager = main_module.ZeroMQTopicManager()
+    manager.apply_structure(_catalog(apps))
+    broadcasts = []
+    monkeypatch.setattr(manager, "_schedule_validation_broadcast", lambda: broadcasts.append(True))
+    validated = []
+    update_application = manager.validation.update_application
+    monkeypatch.setattr(manager.validation, "update_application",
+                        lambda app: validated.append(app["@name"]) or update_application(app))
+    return manager, validated, broadcasts
+
+
+def test_topic_edit_revalidates_only_its_application(main_module, monkeypatch):
+    manager, validated, broadcasts = _manager(main_module, monkeypatch, [("A", ["a1"]), ("B", ["b1"]), ("C", ["c1"])])
+    assert manager.get_validation_state()["valid"]
+    version = manager.validation.version
+
+    _app_map(manager, "B").get("Topic")[0]["proto"] = "b1.txt"
+
+    assert validated == ["B"]
+    state = manager.get_validation_state()
+    assert not state["valid"]
+    assert any("b1.txt" in error for error in state["errors"])
+    assert sorted(state["errors"]) == _full_errors(manager)
+    assert state["version"] > version
+    assert broadcasts == [True]
+
+    _app_map(manager, "B").get("Topic")[0]["proto"] = "b1.proto"
+    assert validated == ["B", "B"]
+    assert manager.get_validation_state()["valid"]
+
+
+def test_description_edit_does_not_broadcast(main_module, monkeypatch):
+    manager, validated, broadcasts = _manager(main_module, monkeypatch, [("A", ["a1"]), ("B", ["b1"])])
+
+    _app_map(manager, "A")["description"] = "changed"
+
+    assert validated == ["A"]
+    assert broadcasts == []
+
+
+def test_rename_to_duplicate_and_back(main_module, monkeypatch):
+    manager, validated, _ = _manager(main_module, monkeypatch, [("A", ["a1"]), ("B", ["b1"])])
+
+    _app_map(manager, "B")["name"] = "A"
+    state = manager.get_validation_state()
+    assert not state["valid"]
+    assert sorted(state["errors"]) == _full_errors(manager)
+
+    app_array = manager.root_map.get("Applications").get("Application")
+    app_array[1]["name"] = "B"
+    assert manager.get_validation_state()["valid"]
+    assert sorted(manager.get_validation_state()["errors"]) == _full_errors(manager)
+    assert set(validated) <= {"A", "B"}
+
+
+def test_added_and_removed_applications(main_module, monkeypatch):
+    manager, validated, _ = _manager(main_module, monkeypatch, [("A", ["a1"]), ("B", ["b1"])])
+    topic = main_module.TopicModel(name="x1", proto="x1", direction="publish", description="")
+
+    assert manager.add_application("X")
+    assert manager.add_topic("X", topic)
+    assert "A" not in validated and "B" not in validated
+    assert not manager.get_validation_state()["valid"]
+    assert sorted(manager.get_validation_state()["errors"]) == _full_errors(manager)
+
+    assert manager.remove_application("X")
+    assert manager.get_validation_state()["valid"]
+    assert "A" not in validated and "B" not in validated
+
+
+def test_root_version_change(main_module, monkeypatch):
+    manager, validated, broadcasts = _manager(main_module, monkeypatch, [("A", ["a1"])])
+
+    manager.root_map.get("Applications")["version"] = "2.0"
+
+    assert validated == []
+    assert not manager.get_validation_state()["valid"]
+    assert sorted(manager.get_validation_state()["errors"]) == _full_errors(manager)
+    assert broadcasts == [True]
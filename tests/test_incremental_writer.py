@@ -0,0 +1,77 @@
+import copy
+import os
+
+from models.codegen_output import IncrementalCodeWriter
+
+OLD_MTIME_NS = 1_000_000_000 * 10**9
+
+
+def _catalog(names):
+    return {"Applications": {"@xmlns": "http://zeromq-topic-manager/schema", "@version": "1.0", "Application": [
+        {"@name": name, "@description": "", "Topic": [
+            {"@name": f"{name}Topic", "@proto": "t.proto", "@direction": "publish", "@description": ""}
+        ]}
+        for name in names
+    ]}}
+
+
+def _app_files(writer, language):
+    """매니페스트 기준 응용프로그램 이름 → 출력 파일명"""
+    manifest = writer._load_manifest(writer.output_dir / language)
+    return {name: entry["file"] for name, entry in manifest["applications"].items()}
+
+
+def _age(directory):
+    """이후 다시 쓴 파일을 mtime으로 구별할 수 있도록 모든 파일의 mtime을 과거로 돌림"""
+    for path in directory.rglob("*"):
+        if path.is_file():
+            os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+def test_second_sync_writes_nothing(tmp_path):
+    writer = IncrementalCodeWriter(tmp_path, languages=["python", "cpp"])
+    structure = _catalog(["Alpha", "Beta", "Gamma"])
+
+    first = writer.sync(structure)
+    second = writer.sync(structure)
+
+    for language in ("python", "cpp"):
+        assert len(first[language]["written"]) >= 3
+        assert second[language]["written"] == []
+        assert second[language]["removed"] == []
+
+
+def test_changed_topic_rewrites_only_its_application(tmp_path):
+    writer = IncrementalCodeWriter(tmp_path, languages=["python", "cpp"])
+    structure = _catalog(["Alpha", "Beta", "Gamma"])
+    writer.sync(structure)
+    writer.sync(structure)
+    _age(tmp_path)
+
+    changed = copy.deepcopy(structure)
+    changed["Applications"]["Application"][1]["Topic"][0]["@proto"] = "other.proto"
+    stats = writer.sync(changed)
+
+    for language in ("python", "cpp"):
+        files = _app_files(writer, language)
+        assert stats[language]["written"] == [files["Beta"]]
+        assert stats[language]["removed"] == []
+        for name in ("Alpha", "Gamma"):
+            assert (tmp_path / language / files[name]).stat().st_mtime_ns == OLD_MTIME_NS
+        assert (tmp_path / language / files["Beta"]).stat().st_mtime_ns != OLD_MTIME_NS
+
+
+def test_removed_application_file_is_deleted(tmp_path):
+    writer = IncrementalCodeWriter(tmp_path, languages=["python"])
+    writer.sync(_catalog(["Alpha", "Beta", "Gamma"]))
+    removed_file = _app_files(writer, "python")["Gamma"]
+    _age(tmp_path)
+
+    stats = writer.sync(_catalog(["Alpha", "Beta"]))
+
+    assert stats["python"]["removed"] == [removed_file]
+    assert stats["python"]["written"] == []
+    assert not (tmp_path / "python" / removed_file).exists()
+    assert set(_app_files(writer, "python")) == {"Alpha", "Beta"}
+    for file_name in _app_files(writer, "python").values():
+        assert (tmp_path / "python" / file_name).stat().st_mtime_ns == OLD_MTIME_NS
@@ -0,0 +1,39 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("zmq")
+
+from models.xml_schema import XMLProcessor, XMLSchemaManager
+
+CATALOG = Path(__file__).resolve().parent.parent / "data" / "xml" / "applications.xml"
+
+
+def _load_client(tmp_path, serialization):
+    structure = XMLProcessor().xml_to_dict(CATALOG.read_text(encoding="utf-8"))
+    path = tmp_path / f"topics_{serialization}.py"
+    path.write_text(XMLSchemaManager().generate_code(structure, language="python", serialization=serialization,
+                                                     deterministic=True), encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("serialization", ["json", "raw"])
+@pytest.mark.parametrize("polling", [False, True])
+def test_measure_listener(tmp_path, serialization, polling):
+    module = _load_client(tmp_path, serialization)
+    client = module.Videoviewer(module.VideoviewerConfig(host="127.0.0.1"))
+
+    result = asyncio.run(module.measure_listener(client, "PTZ_STATUS", messages=50, latency_samples=10,
+                                                 timeout=10.0, polling=polling))
+
+    assert result["listener"] == ("polling" if polling else "poller")
+    assert result["received"] == 50
+    assert result["latency_p50_us"] > 0
+    if polling:
+        # 이전 루프는 한 번에 하나만 받고 10 ms 쉬므로 지연이 그 이상
+        assert result["latency_p50_us"] >= 5000
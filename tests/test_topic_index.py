@@ -0,0 +1,101 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from models.file_manager import xml_file_manager
+from models.topic_index import MAGIC, TopicEntry, TopicIndex, build_topic_index
+
+
+def _catalog(apps):
+    """[(앱 이름, [(토픽, proto, direction)...]), ...] -> xmltodict 형식 구조"""
+    return {"Applications": {"Application": [
+        {"@name": app, "@description": "", "Topic": [
+            {"@name": topic, "@proto": proto, "@direction": direction, "@description": ""}
+            for topic, proto, direction in topics
+        ]}
+        for app, topics in apps
+    ]}}
+
+
+CATALOG = _catalog([
+    ("Viewer", [("PTZ", "ptz.proto", "publish"), ("VIDEO", "video.proto", "subscribe"), ("상태", "state.proto", "subscribe")]),
+    ("Camera", [("VIDEO", "video2.proto", "publish"), ("PTZ", "ptz.proto", "subscribe")]),
+    ("Recorder", [("VIDEO", "video.proto", "subscribe"), ("VIDEO", "video.proto", "subscribe")]),
+    ("Monitor", [("상태", "state.proto", "publish"), ("", "empty.proto", "publish")])
+])
+
+
+@pytest.fixture
+def index(tmp_path):
+    path = tmp_path / "catalog.idx"
+    path.write_bytes(build_topic_index(CATALOG))
+    with TopicIndex(path) as topic_index:
+        yield topic_index
+
+
+def test_lookup(index):
+    assert len(index) == 3
+    # UTF-8 바이트 순 정렬, 이름 없는 토픽은 제외
+    assert list(index) == ["PTZ", "VIDEO", "상태"]
+    assert index["VIDEO"] == TopicEntry(
+        name="VIDEO", proto="video.proto",  # 처음 선언된 proto
+        publishers=["Camera"], subscribers=["Viewer", "Recorder"]  # 선언 순서, 중복 제거
+    )
+    assert index.get("상태") == TopicEntry("상태", "state.proto", ["Monitor"], ["Viewer"])
+    assert "PTZ" in index
+
+
+def test_missing_topics(index):
+    for name in ("", "A", "PTZ_", "ZZZ", "없음"):
+        assert index.get(name) is None
+        assert name not in index
+    with pytest.raises(KeyError):
+        index["ZZZ"]
+
+
+def test_build_is_deterministic():
+    assert build_topic_index(CATALOG) == build_topic_index(CATALOG)
+    assert build_topic_index({}) != build_topic_index(CATALOG)
+
+
+def test_empty_catalog(tmp_path):
+    path = tmp_path / "empty.idx"
+    path.write_bytes(build_topic_index({}))
+
+    with TopicIndex(path) as index:
+        assert len(index) == 0
+        assert list(index) == []
+        assert index.get("PTZ") is None
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    MAGIC[:4],
+    b"NOTINDEX" + bytes(20),
+    build_topic_index(CATALOG)[:-4],
+])
+def test_invalid_files_are_rejected(tmp_path, data):
+    path = tmp_path / "broken.idx"
+    path.write_bytes(data)
+
+    with pytest.raises(ValueError):
+        TopicIndex(path)
+
+
+def test_topic_index_endpoint(main_module, tmp_path):
+    client = TestClient(main_module.app)
+
+    response = client.get("/api/files/applications.xml/topic-index")
+
+    assert response.status_code == 200
+    path = tmp_path / "downloaded.idx"
+    path.write_bytes(response.content)
+    structure = main_module.topic_manager.xml_processor.xml_to_dict(
+        xml_file_manager.load_xml("applications.xml"))
+    assert response.content == build_topic_index(structure)
+    with TopicIndex(path) as index:
+        assert "PTZ_CONTROL" in index
+
+    etag = response.headers["etag"]
+    assert client.get("/api/files/applications.xml/topic-index",
+                      headers={"if-none-match": etag}).status_code == 304
+    assert client.get("/api/files/missing.xml/topic-index").status_code == 404
@@ -0,0 +1,91 @@
+import pytest
+
+pytest.importorskip("zmq")
+
+from models.topology_simulator import SimulationConfig, simulate_topology
+
+
+def _catalog(apps):
+    """[(앱 이름, [(토픽, direction)...]), ...] -> xmltodict 형식 구조"""
+    return {"Applications": {"Application": [
+        {"@name": app, "@description": "", "Topic": [
+            {"@name": topic, "@proto": "t.proto", "@direction": direction, "@description": ""}
+            for topic, direction in topics
+        ]}
+        for app, topics in apps
+    ]}}
+
+
+def _topics(result):
+    return {entry["topic"]: entry for entry in result["topics"]}
+
+
+def _assert_sent(entry, target):
+    """목표 수 이하로 보냄 (부하가 크면 duration이 지나 조금 덜 보낼 수 있음)"""
+    assert target * 0.8 <= entry["sent"] <= target
+
+
+def test_every_subscriber_receives_every_message():
+    structure = _catalog([
+        ("Camera", [("VIDEO", "publish")]),
+        ("Viewer", [("VIDEO", "subscribe")]),
+        ("Recorder", [("VIDEO", "subscribe")]),
+        # 구독은 접두사 일치이므로 VIDEO_HD가 VIDEO 구독자에게 세어지면 안 됨
+        ("HdCamera", [("VIDEO_HD", "publish")]),
+        ("HdViewer", [("VIDEO_HD", "subscribe")])
+    ])
+
+    result = simulate_topology(structure, SimulationConfig(duration=0.3, rate=200))
+
+    topics = _topics(result)
+    video = topics["VIDEO"]
+    assert video["publishers"] == ["Camera"]
+    assert video["subscribers"] == ["Viewer", "Recorder"]
+    _assert_sent(video, 60)
+    assert video["delivered"] == 2 * video["sent"]
+    assert video["per_subscriber"] == {"Viewer": {"delivered": video["sent"], "dropped": 0},
+                                       "Recorder": {"delivered": video["sent"], "dropped": 0}}
+    assert video["dropped"] == 0
+    assert 0 < video["latency_p50_us"] <= video["latency_p99_us"] <= video["latency_max_us"]
+    _assert_sent(topics["VIDEO_HD"], 60)
+    assert topics["VIDEO_HD"]["delivered"] == topics["VIDEO_HD"]["sent"]
+    assert result["totals"] == {"sent": video["sent"] + topics["VIDEO_HD"]["sent"],
+                                "delivered": video["delivered"] + topics["VIDEO_HD"]["delivered"],
+                                "dropped": 0}
+
+
+def test_subscriber_connects_to_all_publishers():
+    structure = _catalog([
+        ("Left", [("TRACK", "publish"), ("STATUS", "publish")]),
+        ("Right", [("TRACK", "publish")]),
+        ("Fusion", [("TRACK", "subscribe"), ("STATUS", "subscribe")])
+    ])
+
+    for multiplex in (False, True):
+        result = simulate_topology(structure, SimulationConfig(duration=0.2, rate=100, multiplex_publishers=multiplex))
+
+        track = _topics(result)["TRACK"]
+        assert result["multiplex_publishers"] is multiplex
+        assert track["publishers"] == ["Left", "Right"]
+        _assert_sent(track, 40)
+        assert track["delivered"] == track["sent"]
+        # 다중화 소켓의 다른 토픽(STATUS)은 TRACK 전달 수에 섞이지 않음
+        status = _topics(result)["STATUS"]
+        _assert_sent(status, 20)
+        assert status["delivered"] == status["sent"]
+
+
+def test_unpublished_subscription():
+    result = simulate_topology(_catalog([("Lonely", [("NOBODY", "subscribe")])]),
+                               SimulationConfig(duration=0.1, rate=100))
+
+    entry = _topics(result)["NOBODY"]
+    assert entry["publishers"] == []
+    assert (entry["sent"], entry["delivered"], entry["dropped"]) == (0, 0, 0)
+    assert not entry["saturated"]
+
+
+@pytest.mark.parametrize("config", [SimulationConfig(duration=0), SimulationConfig(hwm=-1)])
+def test_invalid_config(config):
+    with pytest.raises(ValueError):
+        simulate_topology(_catalog([("A", [("T", "publish")])]), config)
@@ -0,0 +1,117 @@
+import io
+
+import pytest
+
+from models.xml_schema import XMLSchemaManager
+
+NAMESPACE = "http://zeromq-topic-manager/schema"
+
+
+def _app(name, *topics):
+    body = "".join(
+        f'<Topic name="{topic}" proto="{proto}" direction="{direction}" description=""/>'
+        for topic, proto, direction in topics
+    )
+    return f'<Application name="{name}" description="">{body}</Application>'
+
+
+def _catalog(*apps, namespace=NAMESPACE, version="1.0"):
+    xmlns = f' xmlns="{namespace}"' if namespace else ""
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<Applications{xmlns} version="{version}">{"".join(apps)}</Applications>')
+
+
+INVALID_CATALOGS = {
+    "duplicate_name_with_conflict": _catalog(
+        _app("A", ("x", "x.proto", "publish")),
+        _app("B", ("y", "y.proto", "subscribe")),
+        _app("A", ("x", "other.proto", "subscribe"))
+    ),
+    "three_declarations": _catalog(
+        _app("A"), _app("B", ("x", "x.proto", "publish")), _app("A"), _app("A", ("x", "a.proto", "publish"))
+    ),
+    "duplicate_topics_and_conflicts": _catalog(
+        _app("A", ("x", "x.proto", "publish"), ("x", "x.proto", "publish"), ("y", "y.proto", "publish")),
+        _app("B", ("y", "b.proto", "subscribe"), ("x", "b.proto", "subscribe")),
+        _app("B", ("z", "z.proto", "publish"))
+    ),
+    "schema_and_consistency": _catalog(
+        _app("A", ("x", "x.txt", "sideways")),
+        _app("A", ("x", "x.proto", "publish"), ("x", "x.proto", "publish"))
+    ),
+}
+
+
+# 루트/속성 오류만 있는 카탈로그 (네임스페이스가 달라도 응용프로그램/토픽 오류까지 보고해야 함)
+SCHEMA_ONLY_CATALOGS = {
+    "wrong_namespace": _catalog(
+        _app("A", ("", "x.proto", "publish"), ("y", "y.txt", "sideways")),
+        _app("B", ("z", "bad", "subscribe")),
+        namespace="urn:wrong"
+    ),
+    "missing_namespace_and_version": _catalog(
+        _app("A", ("x", "x.proto", "")),
+        _app("A", ("x", "x.proto", "publish")),
+        namespace=None, version="2.0"
+    ),
+    "blank_attributes": _catalog(
+        _app(" ", ("t", "   ", " "), ("u", "", "publish"), (" ", "u.proto", "subscribe"))
+    ),
+}
+
+
+def _is_consistency_error(error):
+    return error.startswith(("Duplicate application name", "Topic '")) or "Duplicate topic" in error
+
+
+def _errors(manager, xml, mode):
+    if mode == "streaming":
+        return manager.validate_file(io.BytesIO(xml.encode("utf-8")))[1]
+    return manager.validate_xml(xml, mode=mode)[1]
+
+
+@pytest.mark.parametrize("name", sorted(INVALID_CATALOGS))
+def test_all_modes_report_the_same_errors(name):
+    manager = XMLSchemaManager()
+    xml = INVALID_CATALOGS[name]
+
+    python_errors = _errors(manager, xml, "python")
+    streaming_errors = _errors(manager, xml, "streaming")
+    xsd_errors = _errors(manager, xml, "xsd")
+
+    assert any(_is_consistency_error(error) for error in python_errors)
+    assert streaming_errors == python_errors
+    # libxml2는 한 요소의 속성 오류를 선언 순서로 내므로 스키마 오류끼리의 순서만 다를 수 있음
+    assert sorted(xsd_errors) == sorted(python_errors)
+    assert ([error for error in xsd_errors if _is_consistency_error(error)]
+            == [error for error in python_errors if _is_consistency_error(error)])
+
+
+def test_streaming_reports_conflict_from_duplicate_application():
+    errors = _errors(XMLSchemaManager(), INVALID_CATALOGS["duplicate_name_with_conflict"], "streaming")
+
+    assert errors == [
+        "Duplicate application name 'A' (Application[0], Application[2])",
+        "Topic 'x' declared with conflicting proto values: other.proto (A), x.proto (A)",
+    ]
+
+
+@pytest.mark.parametrize("name", sorted(SCHEMA_ONLY_CATALOGS))
+def test_xsd_reports_every_application_error(name):
+    manager = XMLSchemaManager()
+    xml = SCHEMA_ONLY_CATALOGS[name]
+
+    python_errors = _errors(manager, xml, "python")
+
+    assert any(error.startswith("Application[") for error in python_errors)
+    assert _errors(manager, xml, "streaming") == python_errors
+    assert sorted(_errors(manager, xml, "xsd")) == sorted(python_errors)
+
+
+def test_xsd_reports_blank_proto_like_python():
+    errors = _errors(XMLSchemaManager(), _catalog(_app("A", ("t", "  ", "publish"))), "xsd")
+
+    assert errors == [
+        "Application[0].Topic[0]: Empty 'proto' attribute",
+        "Application[0].Topic[0]: Proto file '  ' should end with '.proto'",
+    ]
@@ -0,0 +1,89 @@
+import importlib.util
+import io
+import random
+from pathlib import Path
+
+import pytest
+
+from models.structure_utils import as_list
+from models.xml_schema import XML_DECLARATION, XMLProcessor
+
+NAMESPACE = "http://zeromq-topic-manager/schema"
+# XML 특수 문자, 속성 정규화 대상 공백, 비 ASCII 포함
+ALPHABET = list("abcXYZ019_-./ ") + list("&<>\"'\t\n\r") + ["한", "글", "é", "😀", "]]>"]
+
+
+def _text(rng, max_length=12):
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, max_length)))
+
+
+def _catalog(rng):
+    """파서가 돌려주는 형태(항상 리스트)의 무작위 카탈로그"""
+    apps = []
+    for _ in range(rng.randint(0, 6)):
+        app = {"@name": _text(rng), "@description": _text(rng, 40)}
+        if rng.random() < 0.2:
+            app["@owner"] = _text(rng)    # 스키마가 허용하는 추가 속성
+        app["Topic"] = [
+            {"@name": _text(rng), "@proto": _text(rng) + ".proto",
+             "@direction": rng.choice(("publish", "subscribe")), "@description": _text(rng, 40)}
+            for _ in range(rng.randint(0, 5))
+        ]
+        apps.append(app)
+    return {"Applications": {"@xmlns": NAMESPACE, "@version": "1.0", "Application": apps}}
+
+
+def _as_lists(structure):
+    """xmltodict 결과(단일 요소 dict, 자식 없음 누락)를 파서 형태로 정규화"""
+    root = dict(structure["Applications"])
+    root["Application"] = [dict(app, Topic=as_list(app.get("Topic"))) for app in as_list(root.get("Application"))]
+    return {"Applications": root}
+
+
+CATALOGS = [_catalog(random.Random(seed)) for seed in range(200)]
+
+
+@pytest.fixture(scope="module")
+def processor():
+    return XMLProcessor()
+
+
+@pytest.mark.parametrize("pretty_print", (True, False))
+def test_dict_to_xml_round_trips(processor, pretty_print):
+    for catalog in CATALOGS:
+        xml = processor.dict_to_xml(catalog, pretty_print=pretty_print)
+
+        assert processor.xml_to_dict(xml) == catalog
+        assert _as_lists(processor.xml_to_dict(xml, parser="xmltodict")) == catalog
+
+
+@pytest.mark.parametrize("pretty_print", (True, False))
+def test_write_xml_stream_round_trips(processor, pretty_print):
+    for catalog in CATALOGS:
+        buffer = io.BytesIO()
+        processor.write_xml_stream(catalog, buffer, pretty_print=pretty_print)
+        data = buffer.getvalue()
+
+        assert data.startswith(XML_DECLARATION)
+        assert processor.xml_to_dict(data) == catalog
+        if pretty_print:
+            # 스트리밍 출력은 저장 형식과 바이트 단위로 같음
+            assert data.decode("utf-8") == XML_DECLARATION.decode() + processor.dict_to_xml(catalog)
+
+
+def test_format_xml_is_idempotent(processor):
+    for catalog in CATALOGS:
+        formatted = processor.format_xml(processor.dict_to_xml(catalog, pretty_print=False))
+
+        assert processor.format_xml(formatted) == formatted
+        assert processor.xml_to_dict(formatted) == catalog
+
+
+def test_benchmark_script_runs(capsys):
+    path = Path(__file__).resolve().parent.parent / "benchmarks" / "xml_serialization.py"
+    spec = importlib.util.spec_from_file_location("xml_serialization_benchmark", path)
+    benchmark = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(benchmark)
+
+    assert benchmark.main(["--apps", "5", "--topics", "3", "--repeat", "1", "--format", "json"]) == 0
+    assert "legacy_minidom" in capsys.readouterr().out